@@ -0,0 +1 @@
+"""Reproducible performance benchmarks for clawd-dash."""
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+import json
+import os
+import random
+import sys
+import time
+
+CRON_EXPRESSIONS = [
+    "* * * * *",
+    "*/5 * * * *",
+    "*/15 * * * *",
+    "0 * * * *",
+    "30 * * * *",
+    "0 */6 * * *",
+    "0 7 * * *",
+    "0 9 * * 1-5",
+    "0 0 * * *",
+    "0 0 * * 0",
+]
+WORDS = "moltbot gateway cron memory session agent token model reflection briefing".split()
+
+
+def _env_float(name: str, default: float) -> float:
+    try:
+        return float(os.environ.get(name, default))
+    except ValueError:
+        return default
+
+
+def _latency() -> float:
+    spec = os.environ.get("FAKE_MOLTBOT_LATENCY", "0.05")
+    low, _, high = spec.partition("-")
+    try:
+        if high:
+            return random.uniform(float(low), float(high))
+        return float(low)
+    except ValueError:
+        return 0.05
+
+
+def _padding() -> str:
+    size = int(_env_float("FAKE_MOLTBOT_PAYLOAD_KB", 0) * 1024)
+    if size <= 0:
+        return ""
+    words = []
+    length = 0
+    while length < size:
+        word = random.choice(WORDS)
+        words.append(word)
+        length += len(word) + 1
+    return " ".join(words)[:size]
+
+
+def status_payload(now: float, sessions: int) -> dict:
+    recent = []
+    for index in range(max(1, sessions)):
+        total = 1000 + index * 137 + int(now) % 1000
+        recent.append(
+            {
+                "key": f"agent:worker-{index}:main",
+                "agentId": f"worker-{index}",
+                "model": "claude-sonnet" if index % 3 else "claude-opus",
+                "inputTokens": total * 3 // 4,
+                "outputTokens": total // 4,
+                "totalTokens": total,
+                "contextTokens": 200000,
+                "percentUsed": round(total / 2000, 1),
+                "updatedAt": int((now - index * 60) * 1000),
+                "ageMs": index * 60000,
+            }
+        )
+    return {
+        "sessions": {"recent": recent, "defaults": {"model": "claude-sonnet"}, "count": len(recent)},
+        "gateway": {"runtimeShort": "3h 12m", "uptimeMs": 11520000},
+        "notes": _padding(),
+    }
+
+
+def cron_payload(now: float, jobs: int) -> dict:
+    rng = random.Random(int(os.environ.get("FAKE_MOLTBOT_SEED", "7")))
+    entries = []
+    for index in range(jobs):
+        expr = rng.choice(CRON_EXPRESSIONS)
+        entries.append(
+            {
+                "id": f"job-{index}",
+                "name": f"job-{index:04d}",
+                "schedule": {"kind": "cron", "expr": expr, "tz": "UTC"},
+                "state": {"nextRunAtMs": int((now + rng.randint(1, 3600)) * 1000)},
+                "description": _padding()[:256],
+            }
+        )
+    return {"jobs": entries}
+
+
+def payload(args: list) -> dict:
+    now = time.time()
+    if args[:1] == ["status"]:
+        return status_payload(now, int(_env_float("FAKE_MOLTBOT_SESSIONS", 3)))
+    if args[:2] == ["cron", "list"]:
+        return cron_payload(now, int(_env_float("FAKE_MOLTBOT_JOBS", 20)))
+    raise SystemExit(f"fake moltbot: unsupported command {' '.join(args)!r}")
+
+
+def main() -> int:
+    args = [arg for arg in sys.argv[1:] if arg not in ("--json", "--watch")]
+    if "--watch" in sys.argv:
+        interval = _env_float("FAKE_MOLTBOT_WATCH_INTERVAL", 1.0)
+        while True:
+            print(json.dumps(payload(args)), flush=True)
+            time.sleep(interval)
+    time.sleep(_latency())
+    if random.random() < _env_float("FAKE_MOLTBOT_FAILURE_RATE", 0.0):
+        print("fake moltbot: injected failure", file=sys.stderr)
+        return 1
+    print(json.dumps(payload(args)))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,39 @@
+import os
+import random
+import shutil
+import time
+from pathlib import Path
+
+TOPICS = ["reflection", "context", "ideas", "notes", "log", "briefing", "cron", "session"]
+WORDS = (
+    "moltbot gateway cron trigger memory session agent token model reflection briefing "
+    "deploy canvas inbox weekly goal stabilize investigate system health check nightly build"
+).split()
+
+
+def generate(directory: Path, count: int, seed: int = 1, max_lines: int = 40) -> Path:
+    marker = directory.parent / f"{directory.name}.generated"
+    spec = f"{count}:{seed}:{max_lines}"
+    if marker.exists() and marker.read_text() == spec and _file_count(directory) == count:
+        return directory
+    marker.unlink(missing_ok=True)
+    shutil.rmtree(directory, ignore_errors=True)
+    directory.mkdir(parents=True)
+    rng = random.Random(seed)
+    now = time.time()
+    for index in range(count):
+        stamp = now - rng.uniform(0, 365 * 86400)
+        day = time.strftime("%Y-%m-%d", time.gmtime(stamp))
+        path = directory / f"{day}_{rng.choice(TOPICS)}-{index:06d}.md"
+        lines = [" ".join(rng.choice(WORDS) for _ in range(rng.randint(4, 14))) for _ in range(rng.randint(1, max_lines))]
+        path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+        os.utime(path, (stamp, stamp))
+    marker.write_text(spec)
+    return directory
+
+
+def _file_count(directory: Path) -> int:
+    try:
+        return sum(1 for _ in os.scandir(directory))
+    except OSError:
+        return -1
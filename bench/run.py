@@ -0,0 +1,226 @@
+import argparse
+import asyncio
+import json
+import os
+import platform
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+BENCH_DIR = Path(__file__).resolve().parent
+ROOT = BENCH_DIR.parent
+RESULTS_DIR = BENCH_DIR / "results"
+REGRESSION_THRESHOLD = 0.2
+
+
+def _install_fake_moltbot(bin_dir: Path) -> Path:
+    bin_dir.mkdir(parents=True, exist_ok=True)
+    script = bin_dir / "moltbot"
+    script.write_text(
+        f"#!{sys.executable}\n"
+        "import runpy\n"
+        f"runpy.run_path({str(BENCH_DIR / 'fake_moltbot.py')!r}, run_name='__main__')\n",
+        encoding="utf-8",
+    )
+    script.chmod(0o755)
+    return bin_dir
+
+
+def _scenario_env(config: Dict[str, Any], bin_dir: Path, state_dir: Path) -> Dict[str, str]:
+    env = dict(os.environ)
+    env["PATH"] = f"{bin_dir}{os.pathsep}{env.get('PATH', '')}"
+    env["CLAWD_DASH_STATE_DIR"] = str(state_dir)
+    env["FAKE_MOLTBOT_LATENCY"] = str(config["latency"])
+    env["FAKE_MOLTBOT_JOBS"] = str(config["jobs"])
+    env["FAKE_MOLTBOT_SESSIONS"] = str(config["sessions"])
+    env["FAKE_MOLTBOT_PAYLOAD_KB"] = str(config["payload_kb"])
+    env["FAKE_MOLTBOT_FAILURE_RATE"] = str(config["failure_rate"])
+    env["PYTHONPATH"] = str(ROOT)
+    return env
+
+
+def _percentile(summary: Optional[Dict[str, Any]], key: str) -> Optional[float]:
+    if not summary:
+        return None
+    return summary.get(key)
+
+
+async def _measure(config: Dict[str, Any]) -> Dict[str, Any]:
+    started = time.perf_counter()
+    import core.memory_files
+    import dashboard
+    from core.executor import default_executor
+    from core.instrumentation import default_instrumentation
+    from panels import PerformanceScreen
+
+    import_seconds = time.perf_counter() - started
+    core.memory_files.MEMORY_DIR = Path(config["memory_dir"])
+    default_executor.ttl = config["ttl"]
+
+    app = dashboard.ClawdDashApp()
+    metrics: Dict[str, Any] = {"import_seconds": import_seconds}
+    async with app.run_test(size=(160, 50)) as pilot:
+        while not all(panel.render_stats.renders for panel in app._panels()):
+            await pilot.pause(0.005)
+        metrics["first_paint_seconds"] = time.perf_counter() - started
+        while app._refresh_started:
+            await pilot.pause(0.005)
+
+        default_instrumentation.reset()
+        round_times: List[float] = []
+        key_latencies: List[float] = []
+        for _ in range(config["rounds"]):
+            round_started = time.perf_counter()
+            app.refresh_all()
+            key_started = time.perf_counter()
+            await pilot.press("p")
+            while not isinstance(app.screen, PerformanceScreen):
+                await pilot.pause(0.001)
+            key_latencies.append(time.perf_counter() - key_started)
+            await pilot.press("p")
+            while app._refresh_started:
+                await pilot.pause(0.005)
+            round_times.append(time.perf_counter() - round_started)
+
+        latency = default_instrumentation.snapshot()
+        for panel in app._panels():
+            for phase in ("collect", "build", "render"):
+                summary = latency.get(f"{phase} {panel.id}")
+                metrics[f"{phase}_{panel.id}_p50"] = _percentile(summary, "p50")
+                metrics[f"{phase}_{panel.id}_p95"] = _percentile(summary, "p95")
+        metrics["refresh_round_max_seconds"] = max(round_times) if round_times else None
+        metrics["key_latency_max_seconds"] = max(key_latencies) if key_latencies else None
+        metrics["loop_lag_p99"] = _percentile(latency.get("ui loop lag"), "p99")
+        metrics["frame_p95"] = _percentile(latency.get("ui frame"), "p95")
+    metrics["peak_rss_mb"] = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    return metrics
+
+
+def _run_child(config: Dict[str, Any]) -> None:
+    metrics = asyncio.run(_measure(config))
+    print(json.dumps(metrics))
+
+
+def _run_scenario(config: Dict[str, Any], bin_dir: Path, work_dir: Path) -> Dict[str, Any]:
+    with tempfile.TemporaryDirectory(dir=work_dir) as state_dir:
+        env = _scenario_env(config, bin_dir, Path(state_dir))
+        completed = subprocess.run(
+            [sys.executable, "-m", "bench.run", "--child", json.dumps(config)],
+            cwd=ROOT,
+            env=env,
+            capture_output=True,
+            text=True,
+            check=False,
+        )
+    if completed.returncode != 0:
+        raise RuntimeError(f"scenario {config['name']} failed:\n{completed.stderr}")
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+def _git_revision() -> Optional[str]:
+    try:
+        completed = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True, text=True, check=True
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return completed.stdout.strip() or None
+
+
+def compare(current: Dict[str, Any], baseline: Dict[str, Any], threshold: float = REGRESSION_THRESHOLD) -> List[str]:
+    regressions: List[str] = []
+    previous = {scenario["name"]: scenario["metrics"] for scenario in baseline.get("scenarios", [])}
+    for scenario in current["scenarios"]:
+        old_metrics = previous.get(scenario["name"])
+        if old_metrics is None:
+            continue
+        print(f"\n{scenario['name']}")
+        for key, new in scenario["metrics"].items():
+            old = old_metrics.get(key)
+            if not isinstance(new, (int, float)) or not isinstance(old, (int, float)):
+                continue
+            delta = (new - old) / old if old else 0.0
+            flag = ""
+            if delta > threshold and new - old > 0.001:
+                flag = "  REGRESSION"
+                regressions.append(f"{scenario['name']}.{key}")
+            print(f"  {key:<32}{old:>12.4f}{new:>12.4f}{delta:>+9.1%}{flag}")
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark clawd-dash against a fake moltbot and synthetic memory trees.")
+    parser.add_argument("--child", help=argparse.SUPPRESS)
+    parser.add_argument("--files", type=int, nargs="+", default=[10, 1000, 10000, 100000])
+    parser.add_argument("--jobs", type=int, default=200)
+    parser.add_argument("--sessions", type=int, default=20)
+    parser.add_argument("--latency", default="0.05-0.2", help="fake moltbot latency in seconds, or a low-high range")
+    parser.add_argument("--payload-kb", type=float, default=4.0)
+    parser.add_argument("--failure-rate", type=float, default=0.0)
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--ttl", type=float, default=0.0, help="command executor cache TTL during the run")
+    parser.add_argument("--tree-cache", type=Path, default=Path(tempfile.gettempdir()) / "clawd-dash-bench")
+    parser.add_argument("--output", type=Path)
+    parser.add_argument("--compare", type=Path, help="earlier results file to compare against")
+    args = parser.parse_args(argv)
+
+    if args.child:
+        _run_child(json.loads(args.child))
+        return 0
+
+    from bench.memory_tree import generate
+
+    args.tree_cache.mkdir(parents=True, exist_ok=True)
+    bin_dir = _install_fake_moltbot(args.tree_cache / "bin")
+    scenarios = []
+    for count in args.files:
+        tree = generate(args.tree_cache / f"memory-{count}", count)
+        config = {
+            "name": f"files={count}",
+            "memory_dir": str(tree),
+            "files": count,
+            "jobs": args.jobs,
+            "sessions": args.sessions,
+            "latency": args.latency,
+            "payload_kb": args.payload_kb,
+            "failure_rate": args.failure_rate,
+            "rounds": args.rounds,
+            "ttl": args.ttl,
+        }
+        print(f"running {config['name']} …", file=sys.stderr)
+        scenarios.append({"name": config["name"], "config": config, "metrics": _run_scenario(config, bin_dir, args.tree_cache)})
+
+    results = {
+        "meta": {
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "revision": _git_revision(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+        },
+        "scenarios": scenarios,
+    }
+    output = args.output or RESULTS_DIR / f"{time.strftime('%Y%m%d-%H%M%S')}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(results, indent=2), encoding="utf-8")
+    print(f"results written to {output}", file=sys.stderr)
+
+    for scenario in scenarios:
+        print(f"\n{scenario['name']}")
+        for key, value in scenario["metrics"].items():
+            if isinstance(value, (int, float)):
+                print(f"  {key:<32}{value:>12.4f}")
+
+    if args.compare:
+        regressions = compare(results, json.loads(args.compare.read_text(encoding="utf-8")))
+        if regressions:
+            print(f"\n{len(regressions)} regressions: {', '.join(regressions)}", file=sys.stderr)
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
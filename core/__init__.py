@@ -0,0 +1,26 @@
+"""Data collection and scheduling services for clawd-dash."""
+
+from importlib import import_module
+from typing import Any
+
+_EXPORTS = {
+    "CommandExecutor": "executor",
+    "CommandResult": "executor",
+    "default_executor": "executor",
+    "MemoryIndex": "memory_index",
+    "RefreshPolicy": "scheduler",
+    "RefreshScheduler": "scheduler",
+    "RingBuffer": "sampler",
+    "SystemSampler": "sampler",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
@@ -0,0 +1,305 @@
+import json
+import os
+import shlex
+import subprocess
+import threading
+import time
+from collections import deque
+from dataclasses import asdict, dataclass, replace
+from pathlib import Path
+from typing import Any, Deque, Dict, List, Mapping, Optional, Sequence, Tuple
+
+from .instrumentation import default_instrumentation
+from .paths import state_dir
+
+RULE_BUDGET_SECONDS = 0.0005
+BUDGET_WINDOW = 50
+SUSPEND_SECONDS = 300.0
+HOOK_TIMEOUT = 10.0
+MAX_HOOKS = 2
+KINDS = ("threshold", "rate")
+
+
+@dataclass(frozen=True)
+class AlertRule:
+    name: str
+    metric: str
+    kind: str = "threshold"
+    above: Optional[float] = None
+    below: Optional[float] = None
+    clear: Optional[float] = None
+    duration: float = 0.0
+    window: float = 60.0
+    message: str = ""
+
+
+@dataclass(frozen=True)
+class AlertEvent:
+    rule: str
+    metric: str
+    state: str
+    value: float
+    message: str
+    timestamp: float
+
+
+@dataclass
+class RuleStats:
+    evaluations: int = 0
+    seconds: float = 0.0
+    fired: int = 0
+    firing: bool = False
+    suspended: bool = False
+    suspensions: int = 0
+
+    @property
+    def mean(self) -> Optional[float]:
+        return self.seconds / self.evaluations if self.evaluations else None
+
+
+DEFAULT_RULES = (
+    AlertRule("CPU pegged", "health.cpu", above=90.0, clear=75.0, duration=60.0),
+    AlertRule("Disk almost full", "health.disk", above=90.0, clear=85.0),
+    AlertRule("Cron job overdue", "crons.max_lateness", above=600.0, clear=60.0),
+    AlertRule("Context almost full", "session.percent_used", above=85.0, clear=80.0),
+)
+
+
+class _RuleState:
+    __slots__ = ("rule", "stats", "pending_since", "samples", "window_count", "window_seconds", "suspended_until")
+
+    def __init__(self, rule: AlertRule) -> None:
+        self.rule = rule
+        self.stats = RuleStats()
+        self.pending_since: Optional[float] = None
+        self.samples: Deque[Tuple[float, float]] = deque()
+        self.window_count = 0
+        self.window_seconds = 0.0
+        self.suspended_until = 0.0
+
+    def value(self, value: float, now: float) -> Optional[float]:
+        if self.rule.kind != "rate":
+            return value
+        samples = self.samples
+        samples.append((now, value))
+        while len(samples) > 1 and samples[1][0] <= now - self.rule.window:
+            samples.popleft()
+        start, base = samples[0]
+        span = now - start
+        if span <= 0 or span < self.rule.window / 2:
+            return None
+        return (value - base) / span * 60.0
+
+    def breached(self, value: float) -> bool:
+        rule = self.rule
+        return (rule.above is not None and value > rule.above) or (rule.below is not None and value < rule.below)
+
+    def cleared(self, value: float) -> bool:
+        rule = self.rule
+        if rule.above is not None:
+            return value <= (rule.above if rule.clear is None else rule.clear)
+        if rule.below is not None:
+            return value >= (rule.below if rule.clear is None else rule.clear)
+        return True
+
+
+class AlertEngine:
+    def __init__(self, rules: Sequence[AlertRule]) -> None:
+        self.rules = list(rules)
+        self._lock = threading.Lock()
+        self._states: Dict[str, List[_RuleState]] = {}
+        for rule in self.rules:
+            self._states.setdefault(rule.metric, []).append(_RuleState(rule))
+
+    def observe(self, metrics: Mapping[str, Optional[float]], now: Optional[float] = None) -> List[AlertEvent]:
+        now = time.time() if now is None else now
+        events: List[AlertEvent] = []
+        with self._lock, default_instrumentation.timer("alerts evaluate"):
+            for metric, value in metrics.items():
+                states = self._states.get(metric)
+                if not states or value is None:
+                    continue
+                for state in states:
+                    stats = state.stats
+                    if stats.suspended:
+                        if now < state.suspended_until:
+                            continue
+                        stats.suspended = False
+                        events.append(_event(state.rule, "resumed", value, now, "re-enabled after a time budget pause"))
+                    started = time.thread_time()
+                    event = self._evaluate(state, value, now)
+                    cost = time.thread_time() - started
+                    stats.evaluations += 1
+                    stats.seconds += cost
+                    if event is not None:
+                        events.append(event)
+                    if self._over_budget(state, cost):
+                        stats.suspended = True
+                        stats.suspensions += 1
+                        state.suspended_until = now + SUSPEND_SECONDS
+                        events.append(_event(state.rule, "suspended", value, now, "over its time budget"))
+        return events
+
+    def _over_budget(self, state: _RuleState, cost: float) -> bool:
+        state.window_count += 1
+        state.window_seconds += cost
+        if state.window_count < BUDGET_WINDOW:
+            return False
+        mean = state.window_seconds / state.window_count
+        state.window_count = 0
+        state.window_seconds = 0.0
+        return mean > RULE_BUDGET_SECONDS
+
+    def stats(self) -> Dict[str, RuleStats]:
+        with self._lock:
+            return {state.rule.name: replace(state.stats) for states in self._states.values() for state in states}
+
+    def _evaluate(self, state: _RuleState, raw: float, now: float) -> Optional[AlertEvent]:
+        value = state.value(raw, now)
+        if value is None:
+            return None
+        stats = state.stats
+        if stats.firing:
+            if state.cleared(value):
+                stats.firing = False
+                state.pending_since = None
+                return _event(state.rule, "resolved", value, now)
+            return None
+        if not state.breached(value):
+            state.pending_since = None
+            return None
+        if state.pending_since is None:
+            state.pending_since = now
+        if now - state.pending_since < state.rule.duration:
+            return None
+        stats.firing = True
+        stats.fired += 1
+        return _event(state.rule, "firing", value, now)
+
+
+class AlertHook:
+    def __init__(self, command: Sequence[str]) -> None:
+        self.command = list(command)
+        self.dropped = 0
+        self._slots = threading.BoundedSemaphore(MAX_HOOKS)
+
+    def fire(self, event: AlertEvent) -> None:
+        if not self._slots.acquire(blocking=False):
+            self.dropped += 1
+            return
+        threading.Thread(target=self._run, args=(event,), name="alert-hook", daemon=True).start()
+
+    def _run(self, event: AlertEvent) -> None:
+        env = dict(
+            os.environ,
+            CLAWD_DASH_ALERT_RULE=event.rule,
+            CLAWD_DASH_ALERT_METRIC=event.metric,
+            CLAWD_DASH_ALERT_STATE=event.state,
+            CLAWD_DASH_ALERT_VALUE=f"{event.value:g}",
+            CLAWD_DASH_ALERT_MESSAGE=event.message,
+        )
+        payload = json.dumps(asdict(event))
+        try:
+            subprocess.run(
+                self.command,
+                input=payload,
+                text=True,
+                env=env,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                timeout=HOOK_TIMEOUT,
+            )
+        except (OSError, subprocess.SubprocessError):
+            pass
+        finally:
+            self._slots.release()
+
+
+def _event(rule: AlertRule, state: str, value: float, now: float, message: Optional[str] = None) -> AlertEvent:
+    if message is None:
+        message = _describe(rule, state, value)
+    return AlertEvent(rule=rule.name, metric=rule.metric, state=state, value=value, message=message, timestamp=now)
+
+
+def _describe(rule: AlertRule, state: str, value: float) -> str:
+    if rule.message:
+        try:
+            text = rule.message.format(value=value, metric=rule.metric, name=rule.name)
+        except (KeyError, IndexError, ValueError):
+            text = rule.message
+    else:
+        unit = "/min" if rule.kind == "rate" else ""
+        if rule.above is not None:
+            text = f"{rule.metric} {value:.1f}{unit} (limit {rule.above:g})"
+        else:
+            text = f"{rule.metric} {value:.1f}{unit} (minimum {rule.below:g})"
+    return text if state == "firing" else f"{text} · {state}"
+
+
+def alerts_path() -> Optional[Path]:
+    spec = os.environ.get("CLAWD_DASH_ALERTS", "").strip()
+    if spec.lower() in ("off", "0", "none"):
+        return None
+    if spec:
+        return Path(spec).expanduser()
+    return state_dir() / "alerts.json"
+
+
+def _parse_rule(entry: Any) -> AlertRule:
+    if not isinstance(entry, dict):
+        raise ValueError("rule must be an object")
+    if not entry.get("metric"):
+        raise ValueError("rule needs a metric")
+    kind = entry.get("kind", "threshold")
+    if kind not in KINDS:
+        raise ValueError(f"unknown rule kind {kind!r}")
+    above = entry.get("above")
+    below = entry.get("below")
+    if above is None and below is None:
+        raise ValueError(f"rule for {entry['metric']} needs above or below")
+    clear = entry.get("clear")
+    return AlertRule(
+        name=str(entry.get("name") or entry["metric"]),
+        metric=str(entry["metric"]),
+        kind=kind,
+        above=None if above is None else float(above),
+        below=None if below is None else float(below),
+        clear=None if clear is None else float(clear),
+        duration=float(entry.get("for", 0.0)),
+        window=float(entry.get("window", 60.0)),
+        message=str(entry.get("message", "")),
+    )
+
+
+def _parse_hook(spec: Any) -> Optional[List[str]]:
+    if isinstance(spec, str) and spec.strip():
+        return shlex.split(spec)
+    if isinstance(spec, list) and spec:
+        return [str(part) for part in spec]
+    return None
+
+
+def load_alerts() -> Tuple[List[AlertRule], Optional[List[str]], Optional[str]]:
+    hook = _parse_hook(os.environ.get("CLAWD_DASH_ALERT_HOOK"))
+    path = alerts_path()
+    if path is None:
+        return [], None, None
+    if not path.exists() and not os.environ.get("CLAWD_DASH_ALERTS"):
+        return list(DEFAULT_RULES), hook, None
+    try:
+        raw = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError) as exc:
+        return list(DEFAULT_RULES), hook, f"alert rules {path}: {exc}"
+    if isinstance(raw, list):
+        raw = {"rules": raw}
+    if not isinstance(raw, dict):
+        return list(DEFAULT_RULES), hook, f"alert rules {path}: expected an object"
+    rules: List[AlertRule] = []
+    errors: List[str] = []
+    for index, entry in enumerate(raw.get("rules", [])):
+        try:
+            rules.append(_parse_rule(entry))
+        except (TypeError, ValueError) as exc:
+            errors.append(f"rule {index + 1}: {exc}")
+    hook = _parse_hook(raw.get("hook")) or hook
+    return rules, hook, f"alert rules {path}: {'; '.join(errors)}" if errors else None
@@ -0,0 +1,266 @@
+import json
+import os
+import queue
+import signal
+import socket
+import socketserver
+import threading
+import time
+from dataclasses import asdict, dataclass, field
+from functools import partial
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional
+
+from .datasource import SourceResult, collector_path, diff_delta
+from .paths import state_dir
+
+if TYPE_CHECKING:
+    from .iostats import IOMonitor
+    from .procmon import ProcessMonitor
+
+CLIENT_QUEUE = 64
+REFRESH_MIN_SECONDS = 5.0
+
+
+@dataclass
+class Topic:
+    name: str
+    collect: Callable[[], SourceResult]
+    interval: float
+    version: int = 0
+    data: Any = None
+    error: Optional[str] = None
+    full_line: bytes = b""
+    collected_at: float = 0.0
+    subscribers: List["_Client"] = field(default_factory=list)
+    wake: threading.Event = field(default_factory=threading.Event)
+
+
+class _Client:
+    def __init__(self, connection: socket.socket) -> None:
+        self.connection = connection
+        self.queue: "queue.Queue[Optional[bytes]]" = queue.Queue(CLIENT_QUEUE)
+
+    def send(self, line: bytes) -> bool:
+        try:
+            self.queue.put_nowait(line)
+            return True
+        except queue.Full:
+            return False
+
+    def close(self) -> None:
+        try:
+            self.queue.put_nowait(None)
+        except queue.Full:
+            pass
+        try:
+            self.connection.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    server: "_Server"
+
+    def handle(self) -> None:
+        try:
+            request = json.loads(self.rfile.readline() or b"{}")
+        except ValueError:
+            return
+        if not isinstance(request, dict):
+            return
+        refresh = self.server.collector.topics.get(str(request.get("refresh")))
+        if refresh is not None:
+            self.server.collector.refresh(refresh)
+            return
+        topic = self.server.collector.topics.get(str(request.get("subscribe")))
+        if topic is None:
+            return
+        client = _Client(self.connection)
+        self.server.collector.attach(topic, client)
+        try:
+            while True:
+                line = client.queue.get()
+                if line is None:
+                    return
+                self.wfile.write(line)
+                self.wfile.flush()
+        except OSError:
+            return
+        finally:
+            self.server.collector.detach(topic, client)
+
+
+class _Server(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+    collector: "Collector"
+
+
+class Collector:
+    def __init__(self, path: Path, topics: List[Topic]) -> None:
+        self.path = path
+        self.topics = {topic.name: topic for topic in topics}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._server: Optional[_Server] = None
+
+    def serve_forever(self) -> None:
+        _claim_socket(self.path)
+        self._server = _Server(str(self.path), _Handler)
+        self._server.collector = self
+        os.chmod(self.path, 0o600)
+        for topic in self.topics.values():
+            threading.Thread(target=self._run_topic, args=(topic,), name=f"collect-{topic.name}", daemon=True).start()
+        try:
+            self._server.serve_forever(poll_interval=0.5)
+        finally:
+            self._server.server_close()
+            with self._lock:
+                clients = [client for topic in self.topics.values() for client in topic.subscribers]
+            for client in clients:
+                client.close()
+            try:
+                self.path.unlink()
+            except OSError:
+                pass
+
+    def stop(self) -> None:
+        self._stop.set()
+        for topic in self.topics.values():
+            topic.wake.set()
+        if self._server is not None:
+            threading.Thread(target=self._server.shutdown, daemon=True).start()
+
+    def attach(self, topic: Topic, client: _Client) -> None:
+        with self._lock:
+            topic.subscribers.append(client)
+            if topic.version:
+                client.send(topic.full_line)
+        topic.wake.set()
+
+    def detach(self, topic: Topic, client: _Client) -> None:
+        with self._lock:
+            if client in topic.subscribers:
+                topic.subscribers.remove(client)
+
+    def refresh(self, topic: Topic) -> None:
+        if time.monotonic() - topic.collected_at >= REFRESH_MIN_SECONDS:
+            topic.collected_at = 0.0
+            topic.wake.set()
+
+    def _run_topic(self, topic: Topic) -> None:
+        while not self._stop.is_set():
+            with self._lock:
+                idle = not topic.subscribers
+            remaining = topic.interval - (time.monotonic() - topic.collected_at)
+            if idle or (topic.version and remaining > 0):
+                topic.wake.wait(None if idle else remaining)
+                topic.wake.clear()
+                continue
+            topic.collected_at = time.monotonic()
+            try:
+                result = topic.collect()
+            except Exception as exc:
+                result = SourceResult(error=str(exc))
+            self._publish(topic, result)
+
+    def _publish(self, topic: Topic, result: SourceResult) -> None:
+        data = topic.data if result.error else result.data
+        if topic.version and data == topic.data and result.error == topic.error:
+            return
+        version = topic.version + 1
+        envelope: Dict[str, Any] = {"topic": topic.name, "version": version}
+        if result.error:
+            envelope["error"] = result.error
+        full_line = _encode(dict(envelope, data=data))
+        line = full_line
+        if topic.version and data != topic.data:
+            delta = _encode(dict(envelope, base=topic.version, ops=diff_delta(topic.data, data)))
+            if len(delta) < len(full_line):
+                line = delta
+        elif topic.version:
+            line = _encode(dict(envelope, base=topic.version, ops=[]))
+        with self._lock:
+            topic.version = version
+            topic.data = data
+            topic.error = result.error
+            topic.full_line = full_line
+            slow = [client for client in topic.subscribers if not client.send(line)]
+            for client in slow:
+                topic.subscribers.remove(client)
+        for client in slow:
+            client.close()
+
+
+def _encode(message: Dict[str, Any]) -> bytes:
+    return (json.dumps(message, separators=(",", ":"), default=str) + "\n").encode("utf-8")
+
+
+def _claim_socket(path: Path) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if not path.exists():
+        return
+    probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        probe.connect(str(path))
+    except OSError:
+        path.unlink()
+        return
+    finally:
+        probe.close()
+    raise RuntimeError(f"a collector is already listening on {path}")
+
+
+def _collect_status() -> SourceResult:
+    from .status import status_source
+
+    return status_source.fetch()
+
+
+def _collect_crons() -> SourceResult:
+    from .cronjobs import cron_source
+
+    return cron_source.fetch()
+
+
+def _collect_memory() -> SourceResult:
+    from .memory_files import MEMORY_DIR, scan_memory_files
+
+    files, count = scan_memory_files()
+    return SourceResult(data={"directory": str(MEMORY_DIR), "files": files, "count": count})
+
+
+def _collect_health(monitor: "ProcessMonitor", io_monitor: "IOMonitor") -> SourceResult:
+    from .sampler import take_snapshot
+
+    return SourceResult(
+        data=dict(asdict(take_snapshot()), processes=asdict(monitor.sample()), io=asdict(io_monitor.sample()))
+    )
+
+
+def default_topics() -> List[Topic]:
+    from .iostats import IOMonitor
+    from .procmon import ProcessMonitor
+
+    return [
+        Topic("status", _collect_status, 15.0),
+        Topic("cron", _collect_crons, 300.0),
+        Topic("memory", _collect_memory, 10.0),
+        Topic("health", partial(_collect_health, ProcessMonitor(), IOMonitor()), 1.0),
+    ]
+
+
+def run_collector() -> int:
+    path = collector_path() or state_dir() / "collector.sock"
+    os.environ["CLAWD_DASH_COLLECTOR"] = "off"
+    collector = Collector(path, default_topics())
+    signal.signal(signal.SIGTERM, lambda signum, frame: collector.stop())
+    print(f"clawd-dash collector listening on {path}", flush=True)
+    try:
+        collector.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    except RuntimeError as exc:
+        print(str(exc))
+        return 1
+    return 0
@@ -0,0 +1,235 @@
+import calendar
+from bisect import bisect_left
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone, tzinfo
+from functools import lru_cache
+from typing import Dict, Iterator, List, Optional, Tuple
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+MACROS = {
+    "@yearly": "0 0 1 1 *",
+    "@annually": "0 0 1 1 *",
+    "@monthly": "0 0 1 * *",
+    "@weekly": "0 0 * * 0",
+    "@daily": "0 0 * * *",
+    "@midnight": "0 0 * * *",
+    "@hourly": "0 * * * *",
+}
+MONTH_NAMES = {name.lower(): index for index, name in enumerate(calendar.month_abbr) if name}
+DAY_NAMES = {"sun": 0, "mon": 1, "tue": 2, "wed": 3, "thu": 4, "fri": 5, "sat": 6}
+MAX_YEARS = 5
+
+
+class CronParseError(ValueError):
+    pass
+
+
+class UnknownTimezoneError(CronParseError):
+    pass
+
+
+def _parse_value(text: str, names: Dict[str, int]) -> int:
+    lowered = text.lower()
+    if lowered in names:
+        return names[lowered]
+    if not text.isdigit():
+        raise CronParseError(f"invalid value {text!r}")
+    return int(text)
+
+
+def _parse_field(text: str, low: int, high: int, names: Optional[Dict[str, int]] = None) -> Tuple[Tuple[int, ...], bool]:
+    names = names or {}
+    values = set()
+    restricted = not text.startswith(("*", "?"))
+    for part in text.split(","):
+        base, _, step_text = part.partition("/")
+        step = _parse_value(step_text, {}) if step_text else 1
+        if step <= 0:
+            raise CronParseError(f"invalid step in {part!r}")
+        if base in ("*", "?"):
+            start, end = low, high
+        elif "-" in base:
+            start_text, end_text = base.split("-", 1)
+            start, end = _parse_value(start_text, names), _parse_value(end_text, names)
+        else:
+            start = _parse_value(base, names)
+            end = high if step_text else start
+        if start < low or end > high or start > end:
+            raise CronParseError(f"{part!r} out of range {low}-{high}")
+        values.update(range(start, end + 1, step))
+    return tuple(sorted(values)), restricted
+
+
+def _next_in(values: Tuple[int, ...], current: int) -> Optional[int]:
+    index = bisect_left(values, current)
+    return values[index] if index < len(values) else None
+
+
+@dataclass(frozen=True)
+class CronExpression:
+    source: str
+    seconds: Tuple[int, ...]
+    minutes: Tuple[int, ...]
+    hours: Tuple[int, ...]
+    days: Tuple[int, ...]
+    months: Tuple[int, ...]
+    weekdays: Tuple[int, ...]
+    days_restricted: bool
+    weekdays_restricted: bool
+
+    def _day_matches(self, year: int, month: int, day: int) -> bool:
+        in_days = day in self.days
+        weekday = (calendar.weekday(year, month, day) + 1) % 7
+        in_weekdays = weekday in self.weekdays
+        if self.days_restricted and self.weekdays_restricted:
+            return in_days or in_weekdays
+        return in_days and in_weekdays
+
+    def matches(self, local: datetime) -> bool:
+        return (
+            local.second in self.seconds
+            and local.minute in self.minutes
+            and local.hour in self.hours
+            and local.month in self.months
+            and self._day_matches(local.year, local.month, local.day)
+        )
+
+    def next_after(self, moment: datetime, tz: Optional[tzinfo] = None) -> Optional[datetime]:
+        tz = tz or timezone.utc
+        if moment.tzinfo is None:
+            moment = moment.replace(tzinfo=timezone.utc)
+        local = moment.astimezone(tz).replace(tzinfo=None, microsecond=0) + timedelta(seconds=1)
+        limit = local.year + MAX_YEARS
+        while local.year <= limit:
+            if local.month not in self.months:
+                month = _next_in(self.months, local.month)
+                if month is None:
+                    local = datetime(local.year + 1, self.months[0], 1)
+                else:
+                    local = datetime(local.year, month, 1)
+                continue
+            if not self._day_matches(local.year, local.month, local.day):
+                local = datetime(local.year, local.month, local.day) + timedelta(days=1)
+                continue
+            if local.hour not in self.hours:
+                hour = _next_in(self.hours, local.hour)
+                if hour is None:
+                    local = datetime(local.year, local.month, local.day) + timedelta(days=1)
+                else:
+                    local = local.replace(hour=hour, minute=0, second=0)
+                continue
+            if local.minute not in self.minutes:
+                minute = _next_in(self.minutes, local.minute)
+                if minute is None:
+                    local = local.replace(minute=0, second=0) + timedelta(hours=1)
+                else:
+                    local = local.replace(minute=minute, second=0)
+                continue
+            if local.second not in self.seconds:
+                second = _next_in(self.seconds, local.second)
+                if second is None:
+                    local = local.replace(second=0) + timedelta(minutes=1)
+                else:
+                    local = local.replace(second=second)
+                continue
+            candidate = local.replace(tzinfo=tz)
+            resolved = candidate.astimezone(timezone.utc)
+            if resolved.astimezone(tz).replace(tzinfo=None) != local or resolved <= moment:
+                local += timedelta(seconds=1)
+                continue
+            return resolved
+        return None
+
+    def iter_minutes(self, start: datetime, end: datetime, tz: Optional[tzinfo] = None) -> Iterator[datetime]:
+        tz = tz or timezone.utc
+        local_start = start.astimezone(tz).replace(tzinfo=None)
+        local_end = end.astimezone(tz).replace(tzinfo=None)
+        day = datetime(local_start.year, local_start.month, local_start.day)
+        while day <= local_end:
+            if day.month in self.months and self._day_matches(day.year, day.month, day.day):
+                for hour in self.hours:
+                    for minute in self.minutes:
+                        local = day.replace(hour=hour, minute=minute)
+                        resolved = local.replace(tzinfo=tz).astimezone(timezone.utc)
+                        if tz is not timezone.utc and resolved.astimezone(tz).replace(tzinfo=None) != local:
+                            continue
+                        if resolved < start:
+                            continue
+                        if resolved >= end:
+                            return
+                        yield resolved
+            day += timedelta(days=1)
+
+    def iter_after(self, moment: datetime, tz: Optional[tzinfo] = None) -> Iterator[datetime]:
+        current = self.next_after(moment, tz)
+        while current is not None:
+            yield current
+            current = self.next_after(current, tz)
+
+
+@lru_cache(maxsize=1024)
+def parse_cron(expr: str) -> CronExpression:
+    text = MACROS.get(expr.strip().lower(), expr.strip())
+    fields = text.split()
+    if len(fields) == 5:
+        fields = ["0"] + fields
+    if len(fields) != 6:
+        raise CronParseError(f"expected 5 or 6 fields in {expr!r}")
+    seconds, _ = _parse_field(fields[0], 0, 59)
+    minutes, _ = _parse_field(fields[1], 0, 59)
+    hours, _ = _parse_field(fields[2], 0, 23)
+    days, days_restricted = _parse_field(fields[3], 1, 31)
+    months, _ = _parse_field(fields[4], 1, 12, MONTH_NAMES)
+    weekdays, weekdays_restricted = _parse_field(fields[5], 0, 7, DAY_NAMES)
+    weekdays = tuple(sorted({0 if day == 7 else day for day in weekdays}))
+    return CronExpression(
+        source=expr,
+        seconds=seconds,
+        minutes=minutes,
+        hours=hours,
+        days=days,
+        months=months,
+        weekdays=weekdays,
+        days_restricted=days_restricted,
+        weekdays_restricted=weekdays_restricted,
+    )
+
+
+@lru_cache(maxsize=64)
+def resolve_timezone(name: Optional[str]) -> tzinfo:
+    if not name:
+        return timezone.utc
+    try:
+        return ZoneInfo(name)
+    except (ZoneInfoNotFoundError, ValueError):
+        raise UnknownTimezoneError(f"unknown timezone {name!r}") from None
+
+
+def schedule_error(expr: str, tz_name: Optional[str] = None) -> Optional[str]:
+    try:
+        parse_cron(expr)
+        resolve_timezone(tz_name)
+    except CronParseError as exc:
+        return str(exc)
+    return None
+
+
+def next_fire(expr: str, moment: datetime, tz_name: Optional[str] = None) -> Optional[datetime]:
+    try:
+        expression = parse_cron(expr)
+    except CronParseError:
+        return None
+    return expression.next_after(moment, resolve_timezone(tz_name))
+
+
+def upcoming(expr: str, moment: datetime, count: int, tz_name: Optional[str] = None) -> List[datetime]:
+    try:
+        expression = parse_cron(expr)
+    except CronParseError:
+        return []
+    fires: List[datetime] = []
+    for fire in expression.iter_after(moment, resolve_timezone(tz_name)):
+        fires.append(fire)
+        if len(fires) >= count:
+            break
+    return fires
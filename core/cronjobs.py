@@ -0,0 +1,162 @@
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple
+
+from .cronexpr import next_fire, schedule_error
+from .datasource import PollingSource, source_from_env
+
+CRON_COMMAND = ["moltbot", "cron", "list", "--json"]
+
+cron_source = source_from_env(
+    "CLAWD_DASH_CRON_SOURCE",
+    "cron",
+    PollingSource(CRON_COMMAND, "moltbot cron list"),
+)
+
+
+def load_jobs() -> Tuple[List[Dict[str, Any]], Optional[str]]:
+    result = cron_source.fetch()
+    if result.error:
+        return [], result.error
+    data = result.data
+    if isinstance(data, dict) and "jobs" in data:
+        jobs = data["jobs"]
+    else:
+        jobs = data
+    if not isinstance(jobs, list):
+        return [], "unexpected cron payload"
+    return jobs, None
+
+
+def _parse_datetime(value: str) -> Optional[datetime]:
+    if not value:
+        return None
+    try:
+        if value.endswith("Z"):
+            return datetime.fromisoformat(value.replace("Z", "+00:00"))
+        return datetime.fromisoformat(value)
+    except ValueError:
+        return None
+
+
+def _parse_epoch(value: Any) -> Optional[datetime]:
+    if value is None:
+        return None
+    if isinstance(value, str) and value.isdigit():
+        value = int(value)
+    if isinstance(value, (int, float)):
+        timestamp = float(value)
+        if timestamp > 1e12:
+            timestamp /= 1000.0
+        return datetime.fromtimestamp(timestamp, tz=timezone.utc)
+    if isinstance(value, str):
+        return _parse_datetime(value)
+    return None
+
+
+def extract_next_run(job: Dict[str, Any]) -> Optional[datetime]:
+    state = job.get("state") or {}
+    for key in ("nextRunAtMs", "next_run_at_ms", "nextRunAt", "next_run_at", "next"):
+        if key in state:
+            return _parse_epoch(state[key])
+    schedule = job.get("schedule") or {}
+    if isinstance(schedule, dict):
+        if schedule.get("kind") == "at":
+            for key in ("atMs", "at", "at_ms"):
+                if key in schedule:
+                    return _parse_epoch(schedule[key])
+        for key in ("nextRunAtMs", "nextRunAt", "next"):
+            if key in schedule:
+                return _parse_epoch(schedule[key])
+    for key in ("nextRunAtMs", "nextRunAt", "next_run", "next"):
+        if key in job:
+            return _parse_epoch(job[key])
+    return None
+
+
+def format_countdown(target: Optional[datetime]) -> str:
+    if not target:
+        return "unknown"
+    now = datetime.now(timezone.utc)
+    if target.tzinfo is None:
+        target = target.replace(tzinfo=timezone.utc)
+    delta = int((target - now).total_seconds())
+    if delta <= 0:
+        return "due"
+    minutes, seconds = divmod(delta, 60)
+    hours, minutes = divmod(minutes, 60)
+    days, hours = divmod(hours, 24)
+    if days:
+        return f"{days}d {hours}h"
+    if hours:
+        return f"{hours}h {minutes}m"
+    if minutes:
+        return f"{minutes}m {seconds}s"
+    return f"{seconds}s"
+
+
+def parse_jobs(jobs: List[Dict[str, Any]], now: datetime) -> List[Dict[str, Any]]:
+    parsed: List[Dict[str, Any]] = []
+    for job in jobs:
+        name = str(job.get("name") or job.get("id") or "job")
+        schedule = job.get("schedule") or job.get("cron")
+        schedule_text = "-"
+        expr: Optional[str] = None
+        tz_name: Optional[str] = None
+        if isinstance(schedule, dict):
+            if schedule.get("kind") == "cron":
+                schedule_text = str(schedule.get("expr") or schedule.get("cron") or "-")
+                expr = schedule.get("expr") or schedule.get("cron")
+                tz_name = schedule.get("tz") or schedule.get("timezone")
+            elif schedule.get("kind") == "at":
+                schedule_text = "at"
+        elif schedule:
+            schedule_text = str(schedule)
+            expr = schedule_text
+        next_dt = extract_next_run(job)
+        if next_dt is not None and next_dt.tzinfo is None:
+            next_dt = next_dt.replace(tzinfo=timezone.utc)
+        recurring = bool(expr) or (isinstance(schedule, dict) and schedule.get("kind") == "every")
+        lateness = _lateness(job, next_dt, now) if recurring else None
+        error = schedule_error(str(expr), tz_name) if expr else None
+        if expr and not error and (next_dt is None or next_dt <= now):
+            next_dt = next_fire(str(expr), now, tz_name) or next_dt
+        parsed.append(
+            {
+                "name": name,
+                "schedule": schedule_text,
+                "expr": str(expr) if expr else None,
+                "tz": tz_name,
+                "next_dt": next_dt,
+                "fired": next_dt is not None and next_dt <= now,
+                "lateness": lateness,
+                "error": error,
+            }
+        )
+    return parsed
+
+
+def _lateness(job: Dict[str, Any], reported: Optional[datetime], now: datetime) -> Optional[float]:
+    if reported is None or reported > now or job.get("enabled") is False:
+        return None
+    state = job.get("state") or {}
+    if not isinstance(state, dict) or state.get("runningAtMs"):
+        return None
+    last_run = _parse_epoch(state.get("lastRunAtMs"))
+    if last_run is not None and last_run >= reported:
+        return None
+    return (now - reported).total_seconds()
+
+
+def advance_jobs(parsed: List[Dict[str, Any]], now: datetime) -> bool:
+    fired = False
+    for job in parsed:
+        next_dt = job["next_dt"]
+        if next_dt is None or next_dt > now or job.get("fired"):
+            continue
+        fired = True
+        upcoming = next_fire(job["expr"], now, job["tz"]) if job["expr"] else None
+        if upcoming is not None and upcoming > now:
+            job["next_dt"] = upcoming
+        else:
+            job["fired"] = True
+    return fired
@@ -0,0 +1,117 @@
+import heapq
+from array import array
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone, tzinfo
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from .cronexpr import CronExpression, CronParseError, parse_cron, resolve_timezone
+
+
+@dataclass(frozen=True)
+class Hotspot:
+    start: datetime
+    count: int
+    jobs: Tuple[str, ...]
+
+
+@dataclass(frozen=True)
+class Timeline:
+    start: datetime
+    minutes: int
+    counts: array
+    total: int
+    jobs: int
+    schedules: int
+    hotspots: Tuple[Hotspot, ...]
+
+    @property
+    def peak(self) -> int:
+        return max(self.counts) if self.counts else 0
+
+
+@dataclass
+class _Group:
+    expression: Optional[CronExpression]
+    tz: tzinfo
+    names: List[str]
+    at: Optional[datetime] = None
+
+    def fires(self, index: int, start: datetime, end: datetime) -> Iterator[Tuple[int, int, int]]:
+        origin = int(start.timestamp()) // 60
+        if self.expression is None:
+            if self.at is not None and start <= self.at < end:
+                yield int(self.at.timestamp()) // 60 - origin, index, len(self.names)
+            return
+        weight = len(self.expression.seconds) * len(self.names)
+        for minute in self.expression.iter_minutes(start, end, self.tz):
+            yield int(minute.timestamp()) // 60 - origin, index, weight
+
+    def fires_at(self, minute: datetime) -> bool:
+        if self.expression is None:
+            return self.at is not None and minute <= self.at < minute + timedelta(minutes=1)
+        local = minute.astimezone(self.tz).replace(tzinfo=None)
+        return any(self.expression.matches(local.replace(second=second)) for second in self.expression.seconds)
+
+
+def _group_jobs(jobs: Sequence[Dict[str, Any]]) -> List[_Group]:
+    groups: Dict[Tuple[Any, ...], _Group] = {}
+    for job in jobs:
+        name = str(job.get("name") or "job")
+        expr = job.get("expr")
+        expression: Optional[CronExpression] = None
+        tz = timezone.utc
+        if expr:
+            try:
+                expression = parse_cron(expr)
+                tz = resolve_timezone(job.get("tz"))
+            except (CronParseError, ValueError):
+                expression = None
+        if expression is not None:
+            key: Tuple[Any, ...] = ("cron", expr, job.get("tz"))
+            group = groups.get(key)
+            if group is None:
+                group = groups[key] = _Group(expression=expression, tz=tz, names=[])
+        else:
+            key = ("at", job.get("next_dt"))
+            group = groups.get(key)
+            if group is None:
+                group = groups[key] = _Group(expression=None, tz=timezone.utc, names=[], at=job.get("next_dt"))
+        group.names.append(name)
+    return list(groups.values())
+
+
+def build_timeline(
+    jobs: Sequence[Dict[str, Any]],
+    now: Optional[datetime] = None,
+    hours: int = 24,
+    hotspot_count: int = 5,
+) -> Timeline:
+    start = (now or datetime.now(timezone.utc)).replace(second=0, microsecond=0)
+    minutes = hours * 60
+    end = start + timedelta(minutes=minutes)
+    groups = _group_jobs(jobs)
+    counts = array("I", [0]) * minutes
+    total = 0
+    for bucket, _, weight in heapq.merge(*(group.fires(index, start, end) for index, group in enumerate(groups))):
+        if 0 <= bucket < minutes:
+            counts[bucket] += weight
+            total += weight
+    busiest = heapq.nlargest(
+        hotspot_count,
+        (item for item in enumerate(counts) if item[1] > 1),
+        key=lambda item: item[1],
+    )
+    hotspots: List[Hotspot] = []
+    for bucket, count in sorted(busiest):
+        minute = start + timedelta(minutes=bucket)
+        names = tuple(name for group in groups if group.fires_at(minute) for name in group.names)
+        hotspots.append(Hotspot(start=minute, count=count, jobs=names))
+    return Timeline(
+        start=start,
+        minutes=minutes,
+        counts=counts,
+        total=total,
+        jobs=len(jobs),
+        schedules=len(groups),
+        hotspots=tuple(hotspots),
+    )
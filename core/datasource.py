@@ -0,0 +1,349 @@
+import json
+import os
+import shlex
+import socket
+import subprocess
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, IO, Iterator, List, Optional, Sequence
+
+from .executor import CommandExecutor, default_executor
+from .paths import state_dir
+
+Listener = Callable[[], None]
+
+
+@dataclass(frozen=True)
+class SourceResult:
+    data: Any = None
+    error: Optional[str] = None
+    version: int = 0
+    pushed: bool = False
+
+
+class DataSource:
+    label = "source"
+
+    def fetch(self) -> SourceResult:
+        raise NotImplementedError
+
+    def subscribe(self, listener: Listener) -> None:
+        pass
+
+    def request_refresh(self) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+
+class PollingSource(DataSource):
+    def __init__(self, command: Sequence[str], label: str, executor: Optional[CommandExecutor] = None) -> None:
+        self.command = list(command)
+        self.label = label
+        self._executor = executor or default_executor
+
+    def fetch(self) -> SourceResult:
+        result = self._executor.run(self.command)
+        output = result.output
+        if not output:
+            return SourceResult(error=result.describe())
+        try:
+            return SourceResult(data=json.loads(output))
+        except json.JSONDecodeError:
+            return SourceResult(error=f"invalid JSON from {self.label}")
+
+
+class StreamSource(DataSource):
+    max_retry_delay = 30.0
+
+    def __init__(self, label: str, fallback: Optional[DataSource] = None) -> None:
+        self.label = label
+        self.fallback = fallback
+        self._lock = threading.Lock()
+        self._listeners: List[Listener] = []
+        self._latest: Any = None
+        self._version = 0
+        self._connected = False
+        self._last_error: Optional[str] = None
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def fetch(self) -> SourceResult:
+        self._ensure_started()
+        with self._lock:
+            if self._connected and self._version:
+                return SourceResult(data=self._latest, version=self._version, pushed=True)
+            error = self._last_error
+        if self.fallback is not None:
+            return self.fallback.fetch()
+        return SourceResult(error=error or f"waiting for {self.label}")
+
+    def subscribe(self, listener: Listener) -> None:
+        with self._lock:
+            self._listeners.append(listener)
+        self._ensure_started()
+
+    def close(self) -> None:
+        self._stop.set()
+        self._disconnect()
+
+    def _ensure_started(self) -> None:
+        with self._lock:
+            if self._thread is not None:
+                return
+            self._thread = threading.Thread(target=self._run, name=f"source-{self.label}", daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        delay = 1.0
+        while not self._stop.is_set():
+            try:
+                for line in self._connect():
+                    if self._stop.is_set():
+                        break
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        payload = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue
+                    self._publish(payload)
+                    delay = 1.0
+                error = f"{self.label} stream closed"
+            except Exception as exc:
+                error = f"{self.label} stream failed: {exc}"
+            finally:
+                self._disconnect()
+            with self._lock:
+                self._connected = False
+                self._last_error = error
+            self._notify()
+            if self._stop.wait(delay):
+                break
+            delay = min(delay * 2, self.max_retry_delay)
+
+    def _publish(self, payload: Any) -> None:
+        with self._lock:
+            if self._connected and self._version and payload == self._latest:
+                return
+            self._latest = payload
+            self._version += 1
+            self._connected = True
+            self._last_error = None
+        self._notify()
+
+    def _notify(self) -> None:
+        with self._lock:
+            listeners = list(self._listeners)
+        for listener in listeners:
+            try:
+                listener()
+            except Exception:
+                pass
+
+    def _connect(self) -> Iterator[str]:
+        raise NotImplementedError
+
+    def _disconnect(self) -> None:
+        pass
+
+
+class WatchSource(StreamSource):
+    def __init__(self, command: Sequence[str], label: str, fallback: Optional[DataSource] = None) -> None:
+        super().__init__(label, fallback)
+        self.command = list(command)
+        self._process: Optional[subprocess.Popen] = None
+
+    def _connect(self) -> Iterator[str]:
+        process = subprocess.Popen(
+            self.command,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            stdin=subprocess.DEVNULL,
+            text=True,
+            bufsize=1,
+        )
+        self._process = process
+        assert process.stdout is not None
+        return iter(process.stdout)
+
+    def _disconnect(self) -> None:
+        process, self._process = self._process, None
+        if process is None:
+            return
+        if process.poll() is None:
+            process.terminate()
+            try:
+                process.wait(timeout=2)
+            except subprocess.TimeoutExpired:
+                process.kill()
+                process.wait()
+        if process.stdout is not None:
+            process.stdout.close()
+
+
+class SocketSource(StreamSource):
+    def __init__(self, path: str, topic: str, label: str, fallback: Optional[DataSource] = None) -> None:
+        super().__init__(label, fallback)
+        self.path = path
+        self.topic = topic
+        self._socket: Optional[socket.socket] = None
+        self._reader: Optional[IO[str]] = None
+
+    def _connect(self) -> Iterator[str]:
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            sock.connect(self.path)
+            sock.sendall((json.dumps({"subscribe": self.topic}) + "\n").encode("utf-8"))
+        except OSError:
+            sock.close()
+            raise
+        self._socket = sock
+        self._reader = sock.makefile("r", encoding="utf-8")
+        return iter(self._reader)
+
+    def _disconnect(self) -> None:
+        sock, self._socket = self._socket, None
+        reader, self._reader = self._reader, None
+        if sock is None:
+            return
+        try:
+            sock.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+        if reader is not None:
+            reader.close()
+        sock.close()
+
+
+class CollectorSource(SocketSource):
+    first_result_timeout = 2.0
+    request_timeout = 1.0
+
+    def __init__(self, path: str, topic: str, label: str, fallback: Optional[DataSource] = None) -> None:
+        super().__init__(path, topic, label, fallback)
+        self._remote_version = 0
+        self._remote_error: Optional[str] = None
+        self._settled = threading.Event()
+
+    def fetch(self) -> SourceResult:
+        self._ensure_started()
+        self._settled.wait(self.first_result_timeout)
+        result = super().fetch()
+        with self._lock:
+            error = self._remote_error
+        if result.pushed and error:
+            return SourceResult(error=error, version=result.version, pushed=True)
+        return result
+
+    def request_refresh(self) -> None:
+        try:
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+                sock.settimeout(self.request_timeout)
+                sock.connect(self.path)
+                sock.sendall((json.dumps({"refresh": self.topic}) + "\n").encode("utf-8"))
+        except OSError:
+            pass
+
+    def _connect(self) -> Iterator[str]:
+        self._remote_version = 0
+        return super()._connect()
+
+    def _publish(self, payload: Any) -> None:
+        if not isinstance(payload, dict) or payload.get("topic") != self.topic:
+            return
+        if "ops" in payload:
+            if payload.get("base") != self._remote_version:
+                raise OSError("collector delta out of sequence")
+            with self._lock:
+                data = apply_delta(self._latest, payload["ops"])
+        else:
+            data = payload.get("data")
+        self._remote_version = payload.get("version", 0)
+        error = payload.get("error")
+        with self._lock:
+            error_changed = error != self._remote_error
+            self._remote_error = error
+        super()._publish(data)
+        self._settled.set()
+        if error_changed:
+            self._notify()
+
+    def _disconnect(self) -> None:
+        super()._disconnect()
+        self._settled.set()
+
+
+def diff_delta(old: Any, new: Any, path: Optional[List[Any]] = None) -> List[List[Any]]:
+    path = path or []
+    if isinstance(old, dict) and isinstance(new, dict):
+        ops: List[List[Any]] = []
+        for key in old:
+            if key not in new:
+                ops.append([path + [key]])
+        for key, value in new.items():
+            if key not in old:
+                ops.append([path + [key], value])
+            elif old[key] != value:
+                ops.extend(diff_delta(old[key], value, path + [key]))
+        return ops
+    if isinstance(old, list) and isinstance(new, list) and len(old) == len(new):
+        ops = []
+        for index, (before, after) in enumerate(zip(old, new)):
+            if before != after:
+                ops.extend(diff_delta(before, after, path + [index]))
+        return ops
+    return [[path, new]]
+
+
+def apply_delta(data: Any, ops: List[List[Any]]) -> Any:
+    root = [data]
+    copied = set()
+    for op in ops:
+        parent: Any = root
+        key: Any = 0
+        for step in op[0]:
+            child = parent[key]
+            if id(child) not in copied:
+                child = parent[key] = child.copy()
+                copied.add(id(child))
+            parent, key = child, step
+        if len(op) == 1:
+            parent.pop(key, None)
+        else:
+            parent[key] = op[1]
+    return root[0]
+
+
+def collector_path() -> Optional[Path]:
+    spec = os.environ.get("CLAWD_DASH_COLLECTOR", "").strip()
+    if spec in ("off", "0", "none"):
+        return None
+    if spec:
+        return Path(spec).expanduser()
+    path = state_dir() / "collector.sock"
+    return path if path.exists() else None
+
+
+def collector_source(topic: str, label: str, fallback: Optional[DataSource] = None) -> Optional[CollectorSource]:
+    path = collector_path()
+    if path is None:
+        return None
+    return CollectorSource(str(path), topic, label, fallback)
+
+
+def source_from_env(variable: str, topic: str, fallback: PollingSource) -> DataSource:
+    spec = os.environ.get(variable, "").strip()
+    if spec == "poll":
+        return fallback
+    if not spec:
+        return collector_source(topic, fallback.label, fallback) or fallback
+    kind, _, target = spec.partition(":")
+    if kind == "watch" and target:
+        return WatchSource(shlex.split(target), fallback.label, fallback)
+    if kind == "unix" and target:
+        return SocketSource(target, topic, fallback.label, fallback)
+    return fallback
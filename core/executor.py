@@ -0,0 +1,195 @@
+import subprocess
+import threading
+import time
+from dataclasses import dataclass, replace
+from typing import Callable, Dict, Optional, Sequence, Tuple
+
+from .instrumentation import default_instrumentation
+
+DEFAULT_TTL = 2.0
+DEFAULT_TIMEOUT = 8.0
+
+CommandKey = Tuple[str, ...]
+
+
+@dataclass(frozen=True)
+class CommandResult:
+    command: CommandKey
+    stdout: str = ""
+    stderr: str = ""
+    returncode: Optional[int] = None
+    duration: float = 0.0
+    timed_out: bool = False
+    error: Optional[str] = None
+    cached: bool = False
+
+    @property
+    def ok(self) -> bool:
+        return self.returncode == 0 and not self.timed_out and self.error is None
+
+    @property
+    def output(self) -> Optional[str]:
+        return self.stdout.strip() or None if self.ok else None
+
+    def describe(self) -> str:
+        name = " ".join(self.command)
+        if self.error:
+            return f"{name}: {self.error}"
+        if self.timed_out:
+            return f"{name} timed out after {self.duration:.1f}s"
+        if self.returncode:
+            detail = self.stderr.strip().splitlines()
+            suffix = f": {detail[-1]}" if detail else ""
+            return f"{name} exited with code {self.returncode}{suffix}"
+        if not self.stdout.strip():
+            return f"{name} returned no output"
+        return f"{name} ok"
+
+
+@dataclass
+class ExecutorStats:
+    calls: int = 0
+    cache_hits: int = 0
+    coalesced: int = 0
+    executions: int = 0
+    failures: int = 0
+    timeouts: int = 0
+    total_latency: float = 0.0
+    max_latency: float = 0.0
+    last_latency: float = 0.0
+
+    @property
+    def avg_latency(self) -> float:
+        return self.total_latency / self.executions if self.executions else 0.0
+
+
+class _InFlight:
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Optional[CommandResult] = None
+
+
+class CommandExecutor:
+    def __init__(
+        self,
+        ttl: float = DEFAULT_TTL,
+        timeout: float = DEFAULT_TIMEOUT,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.ttl = ttl
+        self.timeout = timeout
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._cache: Dict[CommandKey, Tuple[float, CommandResult]] = {}
+        self._in_flight: Dict[CommandKey, _InFlight] = {}
+        self._stats = ExecutorStats()
+        self._per_command: Dict[CommandKey, ExecutorStats] = {}
+
+    def run(
+        self,
+        command: Sequence[str],
+        ttl: Optional[float] = None,
+        timeout: Optional[float] = None,
+    ) -> CommandResult:
+        key = tuple(command)
+        ttl = self.ttl if ttl is None else ttl
+        with self._lock:
+            command_stats = self._per_command.setdefault(key, ExecutorStats())
+            self._stats.calls += 1
+            command_stats.calls += 1
+            cached = self._cache.get(key)
+            if cached and cached[0] > self._clock():
+                self._stats.cache_hits += 1
+                command_stats.cache_hits += 1
+                return cached[1]
+            pending = self._in_flight.get(key)
+            owner = pending is None
+            if owner:
+                pending = self._in_flight[key] = _InFlight()
+            else:
+                self._stats.coalesced += 1
+                command_stats.coalesced += 1
+        if not owner:
+            pending.done.wait()
+            assert pending.result is not None
+            return pending.result
+
+        result: Optional[CommandResult] = None
+        try:
+            result = self._execute(key, self.timeout if timeout is None else timeout)
+            default_instrumentation.record(f"subprocess {' '.join(key)}", result.duration)
+        finally:
+            with self._lock:
+                del self._in_flight[key]
+                if result is not None:
+                    self._account(self._stats, result)
+                    self._account(command_stats, result)
+                    if result.ok and ttl > 0:
+                        self._cache[key] = (self._clock() + ttl, replace(result, cached=True))
+                pending.result = result or CommandResult(command=key, error="execution aborted")
+            pending.done.set()
+        return result
+
+    def invalidate(self, command: Optional[Sequence[str]] = None) -> None:
+        with self._lock:
+            if command is None:
+                self._cache.clear()
+            else:
+                self._cache.pop(tuple(command), None)
+
+    def stats(self) -> ExecutorStats:
+        with self._lock:
+            return replace(self._stats)
+
+    def command_stats(self) -> Dict[CommandKey, ExecutorStats]:
+        with self._lock:
+            return {key: replace(value) for key, value in self._per_command.items()}
+
+    def _execute(self, key: CommandKey, timeout: float) -> CommandResult:
+        started = time.perf_counter()
+        try:
+            completed = subprocess.run(
+                key,
+                capture_output=True,
+                text=True,
+                timeout=timeout,
+            )
+        except subprocess.TimeoutExpired as exc:
+            return CommandResult(
+                command=key,
+                stdout=_decode(exc.stdout),
+                stderr=_decode(exc.stderr),
+                duration=time.perf_counter() - started,
+                timed_out=True,
+            )
+        except FileNotFoundError:
+            return CommandResult(command=key, duration=time.perf_counter() - started, error="command not found")
+        except (OSError, subprocess.SubprocessError) as exc:
+            return CommandResult(command=key, duration=time.perf_counter() - started, error=str(exc))
+        return CommandResult(
+            command=key,
+            stdout=completed.stdout,
+            stderr=completed.stderr,
+            returncode=completed.returncode,
+            duration=time.perf_counter() - started,
+        )
+
+    @staticmethod
+    def _account(stats: ExecutorStats, result: CommandResult) -> None:
+        stats.executions += 1
+        stats.total_latency += result.duration
+        stats.max_latency = max(stats.max_latency, result.duration)
+        stats.last_latency = result.duration
+        if result.timed_out:
+            stats.timeouts += 1
+        if not result.ok:
+            stats.failures += 1
+
+
+def _decode(value: object) -> str:
+    if isinstance(value, bytes):
+        return value.decode("utf-8", errors="replace")
+    return value or ""
+
+
+default_executor = CommandExecutor()
@@ -0,0 +1,157 @@
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple, Union
+
+Step = Union[str, int]
+KeyPath = Tuple[Step, ...]
+Getter = Callable[[Any], Any]
+
+MAX_VARIANTS = 64
+
+
+@dataclass(frozen=True)
+class Candidate:
+    path: KeyPath
+    convert: Optional[Callable[[Any], Any]] = None
+
+
+@dataclass
+class ResolverStats:
+    hits: int = 0
+    scans: int = 0
+    fallbacks: int = 0
+    variants: int = 0
+
+
+@dataclass
+class _Step:
+    name: str
+    getters: List[Getter]
+    key: Optional[str] = None
+    convert: Optional[Callable[[Any], Any]] = None
+
+
+@dataclass
+class _Plan:
+    steps: List[_Step]
+
+
+def lookup(payload: Any, path: KeyPath) -> Any:
+    value = payload
+    for step in path:
+        if isinstance(step, int):
+            if not isinstance(value, list) or step >= len(value):
+                return None
+            value = value[step]
+        else:
+            if not isinstance(value, dict):
+                return None
+            value = value.get(step)
+            if value is None:
+                return None
+    return value
+
+
+def compile_candidate(candidate: Candidate) -> Getter:
+    path = candidate.path
+    convert = candidate.convert
+    if len(path) == 1 and isinstance(path[0], str):
+        key = path[0]
+        if convert is None:
+            return lambda payload: payload.get(key) if isinstance(payload, dict) else None
+
+        def convert_key(payload: Any) -> Any:
+            value = payload.get(key) if isinstance(payload, dict) else None
+            return None if value is None else convert(value)
+
+        return convert_key
+    if convert is None:
+        return lambda payload: lookup(payload, path)
+
+    def convert_path(payload: Any) -> Any:
+        value = lookup(payload, path)
+        return None if value is None else convert(value)
+
+    return convert_path
+
+
+class FieldResolver:
+    def __init__(self, fields: Mapping[str, Sequence[Candidate]]) -> None:
+        self._candidates = {name: list(candidates) for name, candidates in fields.items()}
+        self._fields = {
+            name: [compile_candidate(candidate) for candidate in candidates] for name, candidates in fields.items()
+        }
+        self._plans: Dict[Tuple[Tuple[str, ...], Optional[Tuple[str, ...]]], _Plan] = {}
+        self.stats = ResolverStats()
+
+    def resolve(self, payload: Any, names: Optional[Tuple[str, ...]] = None) -> Dict[str, Any]:
+        key = (tuple(payload) if isinstance(payload, dict) else (), names)
+        plan = self._plans.get(key)
+        if plan is None:
+            plan = self._compile(key, names)
+        else:
+            self.stats.hits += 1
+        result: Dict[str, Any] = {}
+        for step in plan.steps:
+            result[step.name] = self._first(step.getters, payload)
+        return result
+
+    def resolve_many(self, payloads: Iterable[Any], names: Tuple[str, ...]) -> List[Tuple[Any, ...]]:
+        rows: List[Tuple[Any, ...]] = []
+        last: Optional[Tuple[Tuple[str, ...], Optional[Tuple[str, ...]]]] = None
+        steps: List[Tuple[Optional[str], Optional[Callable[[Any], Any]], List[Getter]]] = []
+        for payload in payloads:
+            key = (tuple(payload) if isinstance(payload, dict) else (), names)
+            if key != last:
+                plan = self._plans.get(key) or self._compile(key, names)
+                steps = [(step.key, step.convert, step.getters) for step in plan.steps]
+                last = key
+            row = []
+            for direct, convert, getters in steps:
+                if direct is None:
+                    row.append(self._first(getters, payload))
+                    continue
+                value = payload.get(direct)
+                if value is not None and convert is not None:
+                    value = convert(value)
+                if value is None and len(getters) > 1:
+                    value = self._first(getters[1:], payload)
+                row.append(value)
+            rows.append(tuple(row))
+        self.stats.hits += len(rows)
+        return rows
+
+    def _compile(
+        self,
+        key: Tuple[Tuple[str, ...], Optional[Tuple[str, ...]]],
+        names: Optional[Tuple[str, ...]],
+    ) -> _Plan:
+        if len(self._plans) >= MAX_VARIANTS:
+            self._plans.clear()
+        self.stats.variants += 1
+        self.stats.scans += 1
+        present = set(key[0])
+        steps = []
+        for name in self._fields if names is None else names:
+            candidates = self._candidates[name]
+            indexes = [
+                index
+                for index, candidate in enumerate(candidates)
+                if not isinstance(candidate.path[0], str) or candidate.path[0] in present
+            ]
+            getters = [self._fields[name][index] for index in indexes]
+            first = candidates[indexes[0]] if indexes else None
+            if first is not None and len(first.path) == 1 and isinstance(first.path[0], str):
+                steps.append(_Step(name, getters, first.path[0], first.convert))
+            else:
+                steps.append(_Step(name, getters))
+        plan = self._plans[key] = _Plan(steps)
+        return plan
+
+    def _first(self, getters: List[Getter], payload: Any) -> Any:
+        for position, getter in enumerate(getters):
+            value = getter(payload)
+            if value is not None:
+                if position:
+                    self.stats.fallbacks += 1
+                return value
+        return None
@@ -0,0 +1,109 @@
+import json
+import math
+import threading
+import time
+from array import array
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional
+
+_MIN_SECONDS = 1e-5
+_MAX_SECONDS = 120.0
+_GROWTH = 1.1
+_LOG_GROWTH = math.log(_GROWTH)
+_BUCKETS = int(math.ceil(math.log(_MAX_SECONDS / _MIN_SECONDS) / _LOG_GROWTH)) + 2
+
+
+class LatencyHistogram:
+    __slots__ = ("counts", "count", "total", "minimum", "maximum")
+
+    def __init__(self) -> None:
+        self.counts = array("Q", [0]) * _BUCKETS
+        self.count = 0
+        self.total = 0.0
+        self.minimum = math.inf
+        self.maximum = 0.0
+
+    def record(self, seconds: float) -> None:
+        seconds = max(0.0, seconds)
+        if seconds <= _MIN_SECONDS:
+            index = 0
+        else:
+            index = min(_BUCKETS - 1, int(math.log(seconds / _MIN_SECONDS) / _LOG_GROWTH) + 1)
+        self.counts[index] += 1
+        self.count += 1
+        self.total += seconds
+        self.minimum = min(self.minimum, seconds)
+        self.maximum = max(self.maximum, seconds)
+
+    def percentile(self, percent: float) -> Optional[float]:
+        if not self.count:
+            return None
+        target = max(1, math.ceil(percent / 100.0 * self.count))
+        seen = 0
+        for index, bucket in enumerate(self.counts):
+            seen += bucket
+            if seen >= target:
+                upper = _MIN_SECONDS * (_GROWTH ** index)
+                return min(max(upper, self.minimum), self.maximum)
+        return self.maximum
+
+    @property
+    def mean(self) -> Optional[float]:
+        return self.total / self.count if self.count else None
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "count": self.count,
+            "mean": self.mean,
+            "min": self.minimum if self.count else None,
+            "p50": self.percentile(50),
+            "p95": self.percentile(95),
+            "p99": self.percentile(99),
+            "max": self.maximum if self.count else None,
+        }
+
+
+class Instrumentation:
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._histograms: Dict[str, LatencyHistogram] = {}
+        self.started = time.time()
+
+    def record(self, name: str, seconds: float) -> None:
+        with self._lock:
+            histogram = self._histograms.get(name)
+            if histogram is None:
+                histogram = self._histograms[name] = LatencyHistogram()
+            histogram.record(seconds)
+
+    @contextmanager
+    def timer(self, name: str) -> Iterator[None]:
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - started)
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        with self._lock:
+            return {name: histogram.summary() for name, histogram in sorted(self._histograms.items())}
+
+    def reset(self) -> None:
+        with self._lock:
+            self._histograms.clear()
+            self.started = time.time()
+
+    def dump(self, path: Path, extra: Optional[Dict[str, Any]] = None) -> Path:
+        payload: Dict[str, Any] = {
+            "started": self.started,
+            "dumped": time.time(),
+            "latency": self.snapshot(),
+        }
+        if extra:
+            payload.update(extra)
+        path.write_text(json.dumps(payload, indent=2, default=str), encoding="utf-8")
+        return path
+
+
+default_instrumentation = Instrumentation()
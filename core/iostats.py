@@ -0,0 +1,209 @@
+import os
+import time
+from dataclasses import dataclass, fields
+from fnmatch import fnmatch
+from typing import Any, Dict, List, Optional, Tuple
+
+import psutil
+
+MOUNT_REFRESH_SECONDS = 60.0
+
+PSEUDO_FSTYPES = frozenset(
+    (
+        "autofs",
+        "binfmt_misc",
+        "bpf",
+        "cgroup",
+        "cgroup2",
+        "configfs",
+        "debugfs",
+        "devfs",
+        "devpts",
+        "devtmpfs",
+        "efivarfs",
+        "fusectl",
+        "hugetlbfs",
+        "mqueue",
+        "nsfs",
+        "proc",
+        "pstore",
+        "ramfs",
+        "rpc_pipefs",
+        "securityfs",
+        "squashfs",
+        "sysfs",
+        "tmpfs",
+        "tracefs",
+    )
+)
+
+REMOTE_FSTYPES = frozenset(
+    (
+        "9p",
+        "afs",
+        "ceph",
+        "cifs",
+        "fuse.gcsfuse",
+        "fuse.glusterfs",
+        "fuse.rclone",
+        "fuse.s3fs",
+        "fuse.sshfs",
+        "glusterfs",
+        "lustre",
+        "ncpfs",
+        "nfs",
+        "nfs4",
+        "smb3",
+        "smbfs",
+        "sshfs",
+    )
+)
+
+
+@dataclass(frozen=True)
+class MountUsage:
+    mountpoint: str
+    device: str
+    fstype: str
+    percent: float
+    used: int
+    total: int
+
+
+@dataclass(frozen=True)
+class IOStats:
+    mounts: Tuple[MountUsage, ...] = ()
+    read_rate: Optional[float] = None
+    write_rate: Optional[float] = None
+    read_iops: Optional[float] = None
+    write_iops: Optional[float] = None
+    rx_rate: Optional[float] = None
+    tx_rate: Optional[float] = None
+
+
+def mount_patterns_from_env() -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+    spec = os.environ.get("CLAWD_DASH_MOUNTS", "")
+    parts = [part.strip() for part in spec.split(",") if part.strip()]
+    include = tuple(part for part in parts if not part.startswith("!"))
+    exclude = tuple(part[1:] for part in parts if part.startswith("!"))
+    return include, exclude
+
+
+def io_stats_from_dict(data: Any) -> Optional[IOStats]:
+    if not isinstance(data, dict):
+        return None
+    try:
+        values = {item.name: data.get(item.name) for item in fields(IOStats)}
+        values["mounts"] = tuple(MountUsage(**mount) for mount in values["mounts"] or ())
+        return IOStats(**values)
+    except TypeError:
+        return None
+
+
+class IOMonitor:
+    def __init__(
+        self,
+        include: Optional[Tuple[str, ...]] = None,
+        exclude: Optional[Tuple[str, ...]] = None,
+    ) -> None:
+        if include is None or exclude is None:
+            env_include, env_exclude = mount_patterns_from_env()
+            include = env_include if include is None else include
+            exclude = env_exclude if exclude is None else exclude
+        self.include = include
+        self.exclude = exclude
+        self._mounts: List[Tuple[str, str, str]] = []
+        self._mounts_at: Optional[float] = None
+        self._disk: Optional[Tuple[int, int, int, int]] = None
+        self._net: Optional[Tuple[int, int]] = None
+        self._sampled_at: Optional[float] = None
+
+    def sample(self) -> IOStats:
+        now = time.monotonic()
+        if self._mounts_at is None or now - self._mounts_at >= MOUNT_REFRESH_SECONDS:
+            self._mounts = self._discover()
+            self._mounts_at = now
+        disk = _disk_counters()
+        net = _net_counters()
+        elapsed = None if self._sampled_at is None else now - self._sampled_at
+        read_rate, write_rate, read_iops, write_iops = _rates(self._disk, disk, elapsed, 4)
+        rx_rate, tx_rate = _rates(self._net, net, elapsed, 2)
+        self._disk, self._net, self._sampled_at = disk, net, now
+        return IOStats(
+            mounts=self._usage(),
+            read_rate=read_rate,
+            write_rate=write_rate,
+            read_iops=read_iops,
+            write_iops=write_iops,
+            rx_rate=rx_rate,
+            tx_rate=tx_rate,
+        )
+
+    def _discover(self) -> List[Tuple[str, str, str]]:
+        try:
+            partitions = psutil.disk_partitions(all=False)
+        except (OSError, psutil.Error):
+            return []
+        mounts: Dict[str, Tuple[str, str, str]] = {}
+        for partition in partitions:
+            mountpoint = partition.mountpoint
+            if partition.fstype in PSEUDO_FSTYPES:
+                continue
+            included = any(fnmatch(mountpoint, pattern) for pattern in self.include)
+            if self.include and not included:
+                continue
+            if partition.fstype in REMOTE_FSTYPES and not included:
+                continue
+            if any(fnmatch(mountpoint, pattern) for pattern in self.exclude):
+                continue
+            seen = mounts.get(partition.device)
+            if seen is None or len(mountpoint) < len(seen[0]):
+                mounts[partition.device] = (mountpoint, partition.device, partition.fstype)
+        return sorted(mounts.values())
+
+    def _usage(self) -> Tuple[MountUsage, ...]:
+        usage: List[MountUsage] = []
+        for mountpoint, device, fstype in self._mounts:
+            try:
+                disk = psutil.disk_usage(mountpoint)
+            except OSError:
+                continue
+            usage.append(MountUsage(mountpoint, device, fstype, disk.percent, disk.used, disk.total))
+        return tuple(usage)
+
+
+def _disk_counters() -> Optional[Tuple[int, int, int, int]]:
+    try:
+        counters = psutil.disk_io_counters()
+    except (OSError, RuntimeError):
+        return None
+    if counters is None:
+        return None
+    return counters.read_bytes, counters.write_bytes, counters.read_count, counters.write_count
+
+
+def _net_counters() -> Optional[Tuple[int, int]]:
+    try:
+        counters = psutil.net_io_counters(pernic=True)
+    except OSError:
+        return None
+    received = sent = 0
+    for name, nic in counters.items():
+        if name == "lo" or name.startswith("lo0"):
+            continue
+        received += nic.bytes_recv
+        sent += nic.bytes_sent
+    return received, sent
+
+
+def _rates(
+    previous: Optional[Tuple[int, ...]],
+    current: Optional[Tuple[int, ...]],
+    elapsed: Optional[float],
+    width: int,
+) -> Tuple[Optional[float], ...]:
+    if previous is None or current is None or not elapsed or elapsed <= 0:
+        return (None,) * width
+    return tuple(
+        (after - before) / elapsed if after >= before else None for before, after in zip(previous, current)
+    )
@@ -0,0 +1,340 @@
+import fcntl
+import json
+import os
+import signal
+import subprocess
+import threading
+import time
+import uuid
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field, fields
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional, Set
+
+from .runlog import DATA_SUFFIX, INDEX_SUFFIX, RunLog, RunLogWriter, log_paths
+
+DEFAULT_MAX_JOBS = 2
+HISTORY_LIMIT = 50
+KILL_GRACE_SECONDS = 2.0
+ORPHAN_GRACE_SECONDS = 3600.0
+
+FINISHED_STATES = ("succeeded", "failed", "cancelled", "interrupted")
+
+
+@dataclass
+class JobRun:
+    id: str
+    name: str
+    command: List[str]
+    state: str = "queued"
+    queued_at: float = field(default_factory=time.time)
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    exit_code: Optional[int] = None
+    lines: int = 0
+    error: Optional[str] = None
+    owner: Optional[int] = None
+
+    @property
+    def finished(self) -> bool:
+        return self.state in FINISHED_STATES
+
+    @property
+    def duration(self) -> Optional[float]:
+        if self.started_at is None:
+            return None
+        return (self.finished_at or time.time()) - self.started_at
+
+
+class JobRunner:
+    def __init__(self, directory: Path, max_concurrent: int = DEFAULT_MAX_JOBS, history: int = HISTORY_LIMIT) -> None:
+        self.directory = directory
+        self.max_concurrent = max(1, max_concurrent)
+        self.history = history
+        self._lock = threading.Lock()
+        self._runs: Dict[str, JobRun] = {}
+        self._owned: Set[str] = set()
+        self._owner = os.getpid()
+        self._futures: Dict[str, Future] = {}
+        self._processes: Dict[str, subprocess.Popen] = {}
+        self._writers: Dict[str, RunLogWriter] = {}
+        self._listeners: List[Callable[[JobRun], None]] = []
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._flusher: Optional[threading.Thread] = None
+        self._load()
+
+    def subscribe(self, callback: Callable[[JobRun], None]) -> None:
+        self._listeners.append(callback)
+
+    def runs(self) -> List[JobRun]:
+        with self._lock:
+            return sorted(self._runs.values(), key=lambda run: run.queued_at, reverse=True)
+
+    def get(self, run_id: str) -> Optional[JobRun]:
+        return self._runs.get(run_id)
+
+    def owns(self, run_id: str) -> bool:
+        return run_id in self._owned
+
+    def open_log(self, run: JobRun) -> Optional[RunLog]:
+        try:
+            return RunLog(self.directory / run.id)
+        except OSError:
+            return None
+
+    def submit(self, name: str, command: List[str]) -> JobRun:
+        run = JobRun(
+            id=f"{time.strftime('%Y%m%d-%H%M%S')}-{uuid.uuid4().hex[:6]}",
+            name=name,
+            command=list(command),
+            owner=self._owner,
+        )
+        writer = RunLogWriter(self.directory / run.id)
+        with self._lock:
+            self._owned.add(run.id)
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(max_workers=self.max_concurrent, thread_name_prefix="job")
+            self._runs[run.id] = run
+            self._writers[run.id] = writer
+            self._futures[run.id] = self._pool.submit(self._execute, run, writer)
+            self._rotate_locked()
+        self._changed(run)
+        self._ensure_flusher()
+        return run
+
+    def cancel(self, run_id: str) -> bool:
+        with self._lock:
+            run = self._runs.get(run_id)
+            future = self._futures.get(run_id)
+            process = self._processes.get(run_id)
+        if run is None or run.finished or run_id not in self._owned:
+            return False
+        if future is not None and future.cancel():
+            self._finish(run, "cancelled", None, None)
+            return True
+        run.state = "cancelling"
+        self._changed(run)
+        if process is not None:
+            _signal(process, signal.SIGTERM)
+            killer = threading.Timer(KILL_GRACE_SECONDS, _kill_if_running, (process,))
+            killer.daemon = True
+            killer.start()
+        return True
+
+    def active(self) -> int:
+        with self._lock:
+            return sum(1 for run in self._runs.values() if not run.finished)
+
+    def shutdown(self) -> None:
+        for run in self.runs():
+            if not run.finished:
+                self.cancel(run.id)
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+        with self._lock:
+            processes = list(self._processes.values())
+        deadline = time.monotonic() + KILL_GRACE_SECONDS
+        for process in processes:
+            try:
+                process.wait(timeout=max(0.0, deadline - time.monotonic()))
+            except subprocess.TimeoutExpired:
+                _signal(process, signal.SIGKILL)
+
+    def _execute(self, run: JobRun, writer: RunLogWriter) -> None:
+        if run.state != "queued":
+            return
+        run.state = "running"
+        run.started_at = time.time()
+        self._changed(run)
+        try:
+            process = subprocess.Popen(
+                run.command,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                text=True,
+                errors="replace",
+                start_new_session=True,
+            )
+        except OSError as exc:
+            writer.write(f"Error: {exc}")
+            run.lines = writer.lines
+            self._finish(run, "failed", None, str(exc))
+            return
+        with self._lock:
+            self._processes[run.id] = process
+        if run.state == "cancelling":
+            _signal(process, signal.SIGTERM)
+        assert process.stdout is not None
+        write = writer.write
+        for line in process.stdout:
+            write(line.rstrip("\n"))
+        return_code = process.wait()
+        run.lines = writer.lines
+        if run.state == "cancelling":
+            self._finish(run, "cancelled", return_code, None)
+        else:
+            self._finish(run, "succeeded" if return_code == 0 else "failed", return_code, None)
+
+    def _finish(self, run: JobRun, state: str, exit_code: Optional[int], error: Optional[str]) -> None:
+        with self._lock:
+            writer = self._writers.pop(run.id, None)
+            self._processes.pop(run.id, None)
+            self._futures.pop(run.id, None)
+        if writer is not None:
+            writer.close()
+            run.lines = writer.lines
+        run.state = state
+        run.exit_code = exit_code
+        run.error = error
+        run.finished_at = time.time()
+        with self._lock:
+            self._rotate_locked()
+        self._changed(run)
+
+    def _changed(self, run: JobRun) -> None:
+        self._save()
+        for callback in list(self._listeners):
+            callback(run)
+
+    def _ensure_flusher(self) -> None:
+        with self._lock:
+            if self._flusher is not None:
+                return
+            self._flusher = threading.Thread(target=self._flush_loop, name="job-log-flush", daemon=True)
+            self._flusher.start()
+
+    def _flush_loop(self) -> None:
+        while True:
+            time.sleep(0.25)
+            with self._lock:
+                writers = list(self._writers.items())
+                if not writers:
+                    self._flusher = None
+                    return
+            for run_id, writer in writers:
+                writer.flush_if_stale()
+                run = self._runs.get(run_id)
+                if run is not None:
+                    run.lines = writer.lines
+
+    def _rotate_locked(self) -> None:
+        finished = sorted(
+            (run for run in self._runs.values() if run.finished),
+            key=lambda run: run.queued_at,
+        )
+        excess = len(self._runs) - self.history
+        for run in finished[: max(0, excess)]:
+            del self._runs[run.id]
+            for path in log_paths(self.directory / run.id):
+                try:
+                    path.unlink()
+                except OSError:
+                    pass
+
+    def _history_path(self) -> Path:
+        return self.directory / "history.json"
+
+    @contextmanager
+    def _history_lock(self) -> Iterator[None]:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        with open(self.directory / "history.lock", "a") as handle:
+            fcntl.flock(handle, fcntl.LOCK_EX)
+            yield
+
+    def _read_history(self) -> Dict[str, JobRun]:
+        try:
+            records = json.loads(self._history_path().read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        names = {item.name for item in fields(JobRun)}
+        runs: Dict[str, JobRun] = {}
+        for record in records if isinstance(records, list) else []:
+            if not isinstance(record, dict) or "id" not in record:
+                continue
+            try:
+                run = JobRun(**{key: value for key, value in record.items() if key in names})
+            except TypeError:
+                continue
+            runs[run.id] = run
+        return runs
+
+    def _load(self) -> None:
+        try:
+            with self._history_lock():
+                for run in self._read_history().values():
+                    if not run.finished and (run.owner == self._owner or not _pid_alive(run.owner)):
+                        run.state = "interrupted"
+                        self._owned.add(run.id)
+                    self._runs[run.id] = run
+                self._remove_orphans()
+        except OSError:
+            pass
+
+    def _remove_orphans(self) -> None:
+        try:
+            paths = list(self.directory.iterdir())
+        except OSError:
+            return
+        cutoff = time.time() - ORPHAN_GRACE_SECONDS
+        for path in paths:
+            for suffix in (DATA_SUFFIX, INDEX_SUFFIX):
+                if path.name.endswith(suffix) and path.name[: -len(suffix)] not in self._runs:
+                    try:
+                        if path.stat().st_mtime < cutoff:
+                            path.unlink()
+                    except OSError:
+                        pass
+
+    def _save(self) -> None:
+        try:
+            with self._history_lock():
+                on_disk = self._read_history()
+                with self._lock:
+                    self._merge_locked(on_disk)
+                    records = [asdict(run) for run in self._runs.values()]
+                path = self._history_path()
+                temp = path.with_name(f"{path.name}.{self._owner}.{threading.get_ident()}.tmp")
+                temp.write_text(json.dumps(records), encoding="utf-8")
+                os.replace(temp, path)
+        except OSError:
+            pass
+
+    def _merge_locked(self, on_disk: Dict[str, JobRun]) -> None:
+        for run_id in [run_id for run_id in self._runs if run_id not in self._owned and run_id not in on_disk]:
+            del self._runs[run_id]
+        for run_id, run in on_disk.items():
+            if run_id not in self._owned:
+                self._runs[run_id] = run
+        self._rotate_locked()
+
+
+def _pid_alive(pid: Optional[int]) -> bool:
+    if pid is None:
+        return False
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except OSError:
+        return True
+    return True
+
+
+def _signal(process: subprocess.Popen, signum: int) -> None:
+    try:
+        os.killpg(process.pid, signum)
+    except OSError:
+        pass
+
+
+def _kill_if_running(process: subprocess.Popen) -> None:
+    if process.poll() is None:
+        _signal(process, signal.SIGKILL)
+
+
+def max_jobs_from_env() -> int:
+    try:
+        return int(os.environ.get("CLAWD_DASH_MAX_JOBS", DEFAULT_MAX_JOBS))
+    except ValueError:
+        return DEFAULT_MAX_JOBS
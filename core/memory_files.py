@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import hashlib
+from pathlib import Path
+from typing import TYPE_CHECKING, List, Optional, Tuple
+
+from .datasource import collector_source
+from .memory_index import MemoryIndex
+from .paths import state_path
+
+if TYPE_CHECKING:
+    from .search_index import SearchIndex
+
+MEMORY_DIR = Path("/root/clawd/memory")
+
+PLACEHOLDER_FILES = [
+    ("2026-01-29_reflection.md", "Stavan updated morning briefing flow."),
+    ("2026-01-28_context.txt", "Weekly goal: stabilize cron triggers."),
+    ("2026-01-28_ideas.md", "Investigate new canvas integrations."),
+    ("2026-01-27_notes.txt", "Deployed moltbot v2.4.1."),
+    ("2026-01-26_log.md", "System health checks passed."),
+]
+
+
+memory_source = collector_source("memory", "memory files")
+
+_index: Optional[MemoryIndex] = None
+_search_index: Optional[SearchIndex] = None
+
+
+def memory_index() -> MemoryIndex:
+    global _index
+    if _index is None or _index.directory != MEMORY_DIR:
+        if _index is not None:
+            _index.close()
+        _index = MemoryIndex(MEMORY_DIR)
+    return _index
+
+
+def memory_search_index() -> SearchIndex:
+    global _search_index
+    if _search_index is None or _search_index.directory != MEMORY_DIR:
+        from .search_index import SearchIndex
+
+        if _search_index is not None:
+            _search_index.close()
+        digest = hashlib.sha1(str(MEMORY_DIR).encode("utf-8")).hexdigest()[:12]
+        _search_index = SearchIndex(state_path(f"memory-search-{digest}.db"), MEMORY_DIR)
+    return _search_index
+
+
+def scan_memory_files() -> Tuple[List[Tuple[str, str]], int]:
+    index = memory_index()
+    index.refresh()
+    newest = index.top(5)
+    if not newest:
+        return PLACEHOLDER_FILES, len(index)
+    return [(entry.name, entry.preview or "(empty)") for entry in newest], len(index)
+
+
+def _remote_memory_files() -> Optional[Tuple[List[Tuple[str, str]], int]]:
+    if memory_source is None:
+        return None
+    result = memory_source.fetch()
+    data = result.data
+    if result.error or not isinstance(data, dict) or data.get("directory") != str(MEMORY_DIR):
+        return None
+    return [(str(name), str(preview)) for name, preview in data.get("files", [])], int(data.get("count", 0))
+
+
+def load_memory_files() -> List[Tuple[str, str]]:
+    remote = _remote_memory_files()
+    return remote[0] if remote is not None else scan_memory_files()[0]
+
+
+def memory_file_count() -> int:
+    remote = _remote_memory_files()
+    return remote[1] if remote is not None else len(memory_index())
@@ -0,0 +1,199 @@
+import ctypes
+import ctypes.util
+import heapq
+import os
+import stat
+import struct
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Union
+
+PREVIEW_BYTES = 4096
+
+_IN_MODIFY = 0x00000002
+_IN_ATTRIB = 0x00000004
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_FROM = 0x00000040
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_DELETE = 0x00000200
+_IN_DELETE_SELF = 0x00000400
+_IN_MOVE_SELF = 0x00000800
+_IN_Q_OVERFLOW = 0x00004000
+_IN_IGNORED = 0x00008000
+_WATCH_MASK = (
+    _IN_MODIFY
+    | _IN_ATTRIB
+    | _IN_CLOSE_WRITE
+    | _IN_MOVED_FROM
+    | _IN_MOVED_TO
+    | _IN_CREATE
+    | _IN_DELETE
+    | _IN_DELETE_SELF
+    | _IN_MOVE_SELF
+)
+_RESCAN_MASK = _IN_Q_OVERFLOW | _IN_IGNORED | _IN_DELETE_SELF | _IN_MOVE_SELF
+_EVENT_HEADER = struct.Struct("iIII")
+
+
+@dataclass
+class MemoryEntry:
+    name: str
+    mtime: float
+    size: int
+    preview: Optional[str] = None
+
+
+class _Inotify:
+    def __init__(self, directory: Path) -> None:
+        libc_name = ctypes.util.find_library("c")
+        if not libc_name:
+            raise OSError("libc not found")
+        libc = ctypes.CDLL(libc_name, use_errno=True)
+        if not hasattr(libc, "inotify_init1"):
+            raise OSError("inotify unavailable")
+        fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        if libc.inotify_add_watch(fd, os.fsencode(directory), _WATCH_MASK) < 0:
+            errno = ctypes.get_errno()
+            os.close(fd)
+            raise OSError(errno, "inotify_add_watch failed")
+        self.fd = fd
+
+    def read_changes(self) -> Optional[Set[str]]:
+        changed: Set[str] = set()
+        while True:
+            try:
+                buffer = os.read(self.fd, 65536)
+            except BlockingIOError:
+                return changed
+            offset = 0
+            while offset + _EVENT_HEADER.size <= len(buffer):
+                _, mask, _, length = _EVENT_HEADER.unpack_from(buffer, offset)
+                offset += _EVENT_HEADER.size
+                name = buffer[offset : offset + length].rstrip(b"\0")
+                offset += length
+                if mask & _RESCAN_MASK:
+                    return None
+                if name:
+                    changed.add(os.fsdecode(name))
+
+    def close(self) -> None:
+        os.close(self.fd)
+
+
+def read_preview(path: Union[str, Path], limit: int = PREVIEW_BYTES) -> str:
+    try:
+        with open(path, "rb") as handle:
+            chunk = handle.read(limit)
+    except OSError:
+        return "(unreadable)"
+    text = chunk.decode("utf-8", errors="ignore").strip()
+    return text.splitlines()[0] if text else "(empty)"
+
+
+class MemoryIndex:
+    def __init__(self, directory: Path, use_inotify: bool = True, preview_bytes: int = PREVIEW_BYTES) -> None:
+        self.directory = directory
+        self.use_inotify = use_inotify
+        self.preview_bytes = preview_bytes
+        self._entries: Dict[str, MemoryEntry] = {}
+        self._watcher: Optional[_Inotify] = None
+        self._scanned = False
+        self._lock = threading.Lock()
+        self.full_scans = 0
+        self.incremental_updates = 0
+
+    @property
+    def watching(self) -> bool:
+        return self._watcher is not None
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def refresh(self) -> None:
+        with self._lock:
+            if self._watcher is not None and self._scanned:
+                changed = self._watcher.read_changes()
+                if changed is not None:
+                    self._update(changed)
+                    return
+                self._stop_watching()
+            self._start_watching()
+            self._full_scan()
+
+    def top(self, count: int) -> List[MemoryEntry]:
+        with self._lock:
+            newest = heapq.nlargest(count, self._entries.values(), key=lambda entry: entry.mtime)
+            for entry in newest:
+                if entry.preview is None:
+                    entry.preview = read_preview(self.directory / entry.name, self.preview_bytes)
+            return newest
+
+    def entries(self) -> List[MemoryEntry]:
+        with self._lock:
+            return list(self._entries.values())
+
+    def close(self) -> None:
+        with self._lock:
+            self._stop_watching()
+
+    def _start_watching(self) -> None:
+        if not self.use_inotify or self._watcher is not None:
+            return
+        try:
+            self._watcher = _Inotify(self.directory)
+        except (OSError, AttributeError):
+            self._watcher = None
+
+    def _stop_watching(self) -> None:
+        if self._watcher is not None:
+            self._watcher.close()
+            self._watcher = None
+
+    def _full_scan(self) -> None:
+        self.full_scans += 1
+        seen: Set[str] = set()
+        try:
+            iterator = os.scandir(self.directory)
+        except OSError:
+            self._entries.clear()
+            self._scanned = False
+            return
+        with iterator:
+            for item in iterator:
+                try:
+                    if not item.is_file():
+                        continue
+                    info = item.stat()
+                except OSError:
+                    continue
+                seen.add(item.name)
+                self._store(item.name, info.st_mtime, info.st_size)
+        for name in self._entries.keys() - seen:
+            del self._entries[name]
+        self._scanned = True
+
+    def _update(self, names: Iterable[str]) -> None:
+        for name in names:
+            self.incremental_updates += 1
+            try:
+                info = os.stat(self.directory / name)
+            except OSError:
+                self._entries.pop(name, None)
+                continue
+            if not stat.S_ISREG(info.st_mode):
+                self._entries.pop(name, None)
+                continue
+            self._store(name, info.st_mtime, info.st_size, changed=True)
+
+    def _store(self, name: str, mtime: float, size: int, changed: bool = False) -> None:
+        entry = self._entries.get(name)
+        if entry is None:
+            self._entries[name] = MemoryEntry(name=name, mtime=mtime, size=size)
+        elif changed or entry.mtime != mtime or entry.size != size:
+            entry.mtime = mtime
+            entry.size = size
+            entry.preview = None
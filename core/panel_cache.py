@@ -0,0 +1,81 @@
+import json
+import os
+import re
+import threading
+import time
+import zlib
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+CACHE_VERSION = 1
+WRITE_INTERVAL = 10.0
+TOUCH_INTERVAL = 60.0
+_SAFE_NAME = re.compile(r"[^A-Za-z0-9_.-]+")
+
+
+@dataclass(frozen=True)
+class CachedData:
+    saved_at: float
+    data: Any
+
+
+class PanelCache:
+    def __init__(self, directory: Optional[Path] = None) -> None:
+        self.directory = directory
+        self._lock = threading.Lock()
+        self._written: Dict[str, Tuple[float, Optional[int]]] = {}
+        self._pending: Dict[str, Tuple[float, bytes, int]] = {}
+        if directory is not None:
+            directory.mkdir(parents=True, exist_ok=True)
+
+    def load(self, key: str) -> Optional[CachedData]:
+        if self.directory is None:
+            return None
+        try:
+            raw = json.loads(zlib.decompress(self._path(key).read_bytes()))
+        except (OSError, ValueError, zlib.error):
+            return None
+        if not isinstance(raw, dict) or raw.get("version") != CACHE_VERSION:
+            return None
+        saved_at = raw.get("saved_at")
+        if not isinstance(saved_at, (int, float)):
+            return None
+        return CachedData(saved_at=float(saved_at), data=raw.get("data"))
+
+    def store(self, key: str, data: Any, now: Optional[float] = None) -> None:
+        if self.directory is None:
+            return
+        now = time.time() if now is None else now
+        encoded = json.dumps(data, separators=(",", ":"), sort_keys=True, default=str).encode("utf-8")
+        digest = zlib.crc32(encoded)
+        with self._lock:
+            written_at, written = self._written.get(key, (0.0, None))
+            if digest == written and now - written_at < TOUCH_INTERVAL:
+                self._pending.pop(key, None)
+                return
+            self._pending[key] = (now, encoded, digest)
+            if now - written_at < WRITE_INTERVAL:
+                return
+            self._write_locked(key)
+
+    def flush(self) -> None:
+        with self._lock:
+            for key in list(self._pending):
+                self._write_locked(key)
+
+    def _write_locked(self, key: str) -> None:
+        saved_at, encoded, digest = self._pending.pop(key)
+        envelope = b'{"version":%d,"saved_at":%s,"data":%s}' % (CACHE_VERSION, repr(saved_at).encode(), encoded)
+        path = self._path(key)
+        temporary = path.with_suffix(".tmp")
+        try:
+            temporary.write_bytes(zlib.compress(envelope, 6))
+            os.replace(temporary, path)
+        except OSError:
+            return
+        self._written[key] = (saved_at, digest)
+
+    def _path(self, key: str) -> Path:
+        assert self.directory is not None
+        return self.directory / f"{_SAFE_NAME.sub('_', key)}.json.z"
@@ -0,0 +1,16 @@
+import os
+from pathlib import Path
+
+
+def state_dir() -> Path:
+    override = os.environ.get("CLAWD_DASH_STATE_DIR")
+    if override:
+        return Path(override).expanduser()
+    base = os.environ.get("XDG_STATE_HOME") or os.path.join("~", ".local", "state")
+    return Path(base).expanduser() / "clawd-dash"
+
+
+def state_path(name: str) -> Path:
+    directory = state_dir()
+    directory.mkdir(parents=True, exist_ok=True)
+    return directory / name
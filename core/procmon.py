@@ -0,0 +1,178 @@
+import os
+import time
+from dataclasses import dataclass, fields
+from typing import Any, Dict, Iterable, Optional, Sequence, Set, Tuple
+
+import psutil
+
+DEFAULT_PATTERNS = ("moltbot", "clawdbot")
+FULL_RESCAN_SECONDS = 300.0
+RECHECK_SECONDS = 60.0
+
+
+@dataclass(frozen=True)
+class ProcessStats:
+    processes: int = 0
+    roots: int = 0
+    cpu_percent: float = 0.0
+    rss: int = 0
+    fds: int = 0
+    threads: int = 0
+
+    @property
+    def children(self) -> int:
+        return self.processes - self.roots
+
+
+@dataclass
+class MonitorStats:
+    samples: int = 0
+    full_scans: int = 0
+    inspected: int = 0
+    rechecked: int = 0
+
+
+def patterns_from_env() -> Tuple[str, ...]:
+    spec = os.environ.get("CLAWD_DASH_PROCESS_MATCH", "")
+    patterns = tuple(part.strip().lower() for part in spec.split(",") if part.strip())
+    return patterns or DEFAULT_PATTERNS
+
+
+def stats_from_dict(data: Any) -> Optional[ProcessStats]:
+    if not isinstance(data, dict):
+        return None
+    try:
+        return ProcessStats(**{item.name: data[item.name] for item in fields(ProcessStats)})
+    except (KeyError, TypeError):
+        return None
+
+
+class ProcessMonitor:
+    def __init__(self, patterns: Optional[Sequence[str]] = None) -> None:
+        self.patterns = tuple(patterns) if patterns is not None else patterns_from_env()
+        self.stats = MonitorStats()
+        self._known: Set[int] = set()
+        self._tracked: Dict[int, psutil.Process] = {}
+        self._parents: Dict[int, int] = {}
+        self._candidates: Dict[int, Tuple[psutil.Process, int, float]] = {}
+        self._own_pid = os.getpid()
+        self._scanned_at = 0.0
+
+    def sample(self) -> ProcessStats:
+        self.stats.samples += 1
+        now = time.monotonic()
+        if now - self._scanned_at >= FULL_RESCAN_SECONDS:
+            self._scanned_at = now
+            self._known = set()
+            self.stats.full_scans += 1
+        pids = set(psutil.pids())
+        new = pids - self._known
+        self._known = pids
+        for pid in [pid for pid in self._tracked if pid not in pids]:
+            self._forget(pid)
+        if new or self._candidates:
+            self._adopt(new, pids)
+        return self._measure()
+
+    def _adopt(self, new: Iterable[int], pids: Set[int]) -> None:
+        now = time.time()
+        candidates: Dict[int, Tuple[psutil.Process, int, float]] = {}
+        for pid, (_, parent, created) in self._candidates.items():
+            if pid not in pids or now - created > RECHECK_SECONDS:
+                continue
+            candidate = self._recheck(pid, parent, created)
+            if candidate is not None:
+                candidates[pid] = candidate
+        for pid in new:
+            if pid in self._tracked:
+                continue
+            self.stats.inspected += 1
+            try:
+                process = psutil.Process(pid)
+                with process.oneshot():
+                    parent = process.ppid()
+                    name = process.name()
+                    created = process.create_time()
+                if parent == self._own_pid:
+                    continue
+                if self._matches(process, name):
+                    self._track(pid, process, parent)
+                else:
+                    candidates[pid] = (process, parent, created)
+            except psutil.Error:
+                continue
+        adopted = True
+        while adopted:
+            adopted = False
+            for pid, (process, parent, _) in list(candidates.items()):
+                if parent in self._tracked:
+                    self._track(pid, process, parent)
+                    del candidates[pid]
+                    adopted = True
+        self._candidates = {
+            pid: candidate for pid, candidate in candidates.items() if now - candidate[2] <= RECHECK_SECONDS
+        }
+
+    def _recheck(self, pid: int, parent: int, created: float) -> Optional[Tuple[psutil.Process, int, float]]:
+        self.stats.rechecked += 1
+        try:
+            process = psutil.Process(pid)
+            with process.oneshot():
+                if process.create_time() != created:
+                    return None
+                name = process.name()
+        except psutil.Error:
+            return None
+        if self._matches(process, name):
+            self._track(pid, process, parent)
+            return None
+        return process, parent, created
+
+    def _matches(self, process: psutil.Process, name: str) -> bool:
+        name = name.lower()
+        if any(pattern in name for pattern in self.patterns):
+            return True
+        try:
+            command = " ".join(os.path.basename(part) for part in process.cmdline()[:3]).lower()
+        except psutil.Error:
+            return False
+        return any(pattern in command for pattern in self.patterns)
+
+    def _track(self, pid: int, process: psutil.Process, parent: int) -> None:
+        self._tracked[pid] = process
+        self._parents[pid] = parent
+        try:
+            process.cpu_percent(None)
+        except psutil.Error:
+            pass
+
+    def _forget(self, pid: int) -> None:
+        self._tracked.pop(pid, None)
+        self._parents.pop(pid, None)
+
+    def _measure(self) -> ProcessStats:
+        cpu = 0.0
+        rss = fds = threads = 0
+        for pid, process in list(self._tracked.items()):
+            try:
+                with process.oneshot():
+                    if process.status() == psutil.STATUS_ZOMBIE:
+                        self._forget(pid)
+                        continue
+                    cpu += process.cpu_percent(None)
+                    rss += process.memory_info().rss
+                    threads += process.num_threads()
+                    fds += process.num_fds()
+            except psutil.NoSuchProcess:
+                self._forget(pid)
+            except psutil.AccessDenied:
+                continue
+        roots = sum(1 for parent in self._parents.values() if parent not in self._tracked)
+        return ProcessStats(
+            processes=len(self._tracked),
+            roots=roots,
+            cpu_percent=cpu,
+            rss=rss,
+            fds=fds,
+            threads=threads,
+        )
@@ -0,0 +1,135 @@
+import mmap
+import os
+import struct
+import threading
+import time
+import zlib
+from bisect import bisect_right
+from collections import OrderedDict
+from pathlib import Path
+from typing import List, Optional
+
+BLOCK_LINES = 1024
+BLOCK_BYTES = 64 * 1024
+FLUSH_SECONDS = 0.25
+CACHED_BLOCKS = 16
+DATA_SUFFIX = ".log.z"
+INDEX_SUFFIX = ".idx"
+
+_ENTRY = struct.Struct("<QII")
+
+
+def log_paths(base: Path) -> List[Path]:
+    return [base.with_name(base.name + DATA_SUFFIX), base.with_name(base.name + INDEX_SUFFIX)]
+
+
+class RunLogWriter:
+    def __init__(self, base: Path) -> None:
+        data_path, index_path = log_paths(base)
+        data_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._data = open(data_path, "wb")
+        self._index = open(index_path, "wb")
+        self._offset = 0
+        self._pending: List[str] = []
+        self._pending_bytes = 0
+        self._flushed_at = time.monotonic()
+        self.lines = 0
+
+    def write(self, line: str) -> None:
+        with self._lock:
+            self._pending.append(line)
+            self._pending_bytes += len(line) + 1
+            self.lines += 1
+            if len(self._pending) >= BLOCK_LINES or self._pending_bytes >= BLOCK_BYTES:
+                self._flush_locked()
+
+    def flush_if_stale(self) -> None:
+        with self._lock:
+            if self._pending and time.monotonic() - self._flushed_at >= FLUSH_SECONDS:
+                self._flush_locked()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._data.closed:
+                return
+            self._flush_locked()
+            self._data.close()
+            self._index.close()
+
+    def _flush_locked(self) -> None:
+        self._flushed_at = time.monotonic()
+        if not self._pending or self._data.closed:
+            return
+        block = zlib.compress("\n".join(self._pending).encode("utf-8", "replace"), 6)
+        self._data.write(block)
+        self._data.flush()
+        self._index.write(_ENTRY.pack(self._offset, len(block), len(self._pending)))
+        self._index.flush()
+        self._offset += len(block)
+        self._pending = []
+        self._pending_bytes = 0
+
+
+class RunLog:
+    def __init__(self, base: Path) -> None:
+        data_path, index_path = log_paths(base)
+        self._data_path = data_path
+        self._index_file = open(index_path, "rb")
+        self._data_file = open(data_path, "rb")
+        self._map: Optional[mmap.mmap] = None
+        self._offsets: List[int] = []
+        self._lengths: List[int] = []
+        self._starts: List[int] = []
+        self._count = 0
+        self._tail = b""
+        self._blocks: "OrderedDict[int, List[str]]" = OrderedDict()
+        self.refresh()
+
+    def __len__(self) -> int:
+        return self._count
+
+    def refresh(self) -> int:
+        chunk = self._tail + self._index_file.read()
+        usable = len(chunk) - len(chunk) % _ENTRY.size
+        for offset, length, lines in _ENTRY.iter_unpack(chunk[:usable]):
+            self._offsets.append(offset)
+            self._lengths.append(length)
+            self._starts.append(self._count)
+            self._count += lines
+        self._tail = chunk[usable:]
+        return self._count
+
+    def line(self, index: int) -> str:
+        if index < 0 or index >= self._count:
+            raise IndexError(index)
+        block = bisect_right(self._starts, index) - 1
+        return self._block(block)[index - self._starts[block]]
+
+    def lines(self, start: int, stop: int) -> List[str]:
+        return [self.line(index) for index in range(max(0, start), min(stop, self._count))]
+
+    def close(self) -> None:
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        self._data_file.close()
+        self._index_file.close()
+
+    def _block(self, block: int) -> List[str]:
+        cached = self._blocks.get(block)
+        if cached is not None:
+            self._blocks.move_to_end(block)
+            return cached
+        end = self._offsets[block] + self._lengths[block]
+        if self._map is None or len(self._map) < end:
+            if self._map is not None:
+                self._map.close()
+            size = os.fstat(self._data_file.fileno()).st_size
+            self._map = mmap.mmap(self._data_file.fileno(), size, access=mmap.ACCESS_READ)
+        raw = zlib.decompress(self._map[self._offsets[block] : end])
+        lines = raw.decode("utf-8", "replace").split("\n")
+        self._blocks[block] = lines
+        if len(self._blocks) > CACHED_BLOCKS:
+            self._blocks.popitem(last=False)
+        return lines
@@ -0,0 +1,208 @@
+import threading
+import time
+from array import array
+from dataclasses import dataclass, fields
+from typing import Any, Dict, List, Optional, Tuple
+
+import psutil
+
+from .datasource import DataSource, collector_source
+from .iostats import IOMonitor, IOStats, io_stats_from_dict
+from .procmon import ProcessMonitor, ProcessStats, stats_from_dict
+
+DEFAULT_INTERVAL = 1.0
+DEFAULT_CAPACITY = 900
+
+
+class RingBuffer:
+    __slots__ = ("capacity", "_data", "_next", "_count")
+
+    def __init__(self, capacity: int, typecode: str = "d") -> None:
+        self.capacity = capacity
+        self._data = array(typecode, [0]) * capacity
+        self._next = 0
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def append(self, value: float) -> None:
+        self._data[self._next] = value
+        self._next = (self._next + 1) % self.capacity
+        if self._count < self.capacity:
+            self._count += 1
+
+    def latest(self) -> Optional[float]:
+        if not self._count:
+            return None
+        return self._data[self._next - 1]
+
+    def last(self, count: Optional[int] = None) -> List[float]:
+        count = self._count if count is None else min(count, self._count)
+        if count <= 0:
+            return []
+        start = (self._next - count) % self.capacity
+        if start + count <= self.capacity:
+            return self._data[start : start + count].tolist()
+        return self._data[start:].tolist() + self._data[: self._next].tolist()
+
+    def summary(self, count: Optional[int] = None) -> Optional[Tuple[float, float, float]]:
+        values = self.last(count)
+        if not values:
+            return None
+        return min(values), sum(values) / len(values), max(values)
+
+
+@dataclass(frozen=True)
+class SystemSnapshot:
+    timestamp: float
+    cpu_percent: float
+    per_cpu: Tuple[float, ...]
+    memory_percent: float
+    memory_used: int
+    memory_total: int
+    swap_percent: float
+    swap_used: int
+    swap_total: int
+    disk_percent: float
+    disk_used: int
+    disk_total: int
+
+
+def take_snapshot(disk_path: str = "/", interval: Optional[float] = None) -> SystemSnapshot:
+    per_cpu = psutil.cpu_percent(interval=interval, percpu=True)
+    memory = psutil.virtual_memory()
+    swap = psutil.swap_memory()
+    disk = psutil.disk_usage(disk_path)
+    return SystemSnapshot(
+        timestamp=time.time(),
+        cpu_percent=sum(per_cpu) / len(per_cpu) if per_cpu else 0.0,
+        per_cpu=tuple(per_cpu),
+        memory_percent=memory.percent,
+        memory_used=memory.used,
+        memory_total=memory.total,
+        swap_percent=swap.percent,
+        swap_used=swap.used,
+        swap_total=swap.total,
+        disk_percent=disk.percent,
+        disk_used=disk.used,
+        disk_total=disk.total,
+    )
+
+
+def snapshot_from_dict(data: Any) -> Optional[SystemSnapshot]:
+    if not isinstance(data, dict):
+        return None
+    values = {item.name: data.get(item.name) for item in fields(SystemSnapshot)}
+    if any(value is None for value in values.values()):
+        return None
+    values["per_cpu"] = tuple(values["per_cpu"])
+    return SystemSnapshot(**values)
+
+
+class SystemSampler:
+    SERIES = ("cpu", "memory", "swap", "disk")
+
+    def __init__(
+        self,
+        interval: float = DEFAULT_INTERVAL,
+        capacity: int = DEFAULT_CAPACITY,
+        disk_path: str = "/",
+        source: Optional[DataSource] = None,
+    ) -> None:
+        self.interval = interval
+        self.source = source
+        self.capacity = capacity
+        self.disk_path = disk_path
+        self.history: Dict[str, RingBuffer] = {name: RingBuffer(capacity) for name in self.SERIES}
+        self.per_cpu: List[RingBuffer] = [RingBuffer(capacity) for _ in range(psutil.cpu_count() or 1)]
+        self._latest: Optional[SystemSnapshot] = None
+        self._processes: Optional[ProcessStats] = None
+        self._monitor: Optional[ProcessMonitor] = None
+        self._io: Optional[IOStats] = None
+        self._io_monitor: Optional[IOMonitor] = None
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        with self._lock:
+            if self._thread is not None:
+                return
+            self._thread = threading.Thread(target=self._run, name="system-sampler", daemon=True)
+        self._sample(prime=0.05)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+
+    def latest(self) -> Optional[SystemSnapshot]:
+        with self._lock:
+            return self._latest
+
+    def processes(self) -> Optional[ProcessStats]:
+        with self._lock:
+            return self._processes
+
+    def io(self) -> Optional[IOStats]:
+        with self._lock:
+            return self._io
+
+    def series(self, name: str, count: Optional[int] = None) -> List[float]:
+        with self._lock:
+            return self.history[name].last(count)
+
+    def summary(self, name: str, seconds: float) -> Optional[Tuple[float, float, float]]:
+        with self._lock:
+            return self.history[name].summary(self._samples_for(seconds))
+
+    def _samples_for(self, seconds: float) -> int:
+        return max(1, int(seconds / self.interval))
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            try:
+                self._sample()
+            except Exception:
+                continue
+
+    def _sample(self, prime: Optional[float] = None) -> None:
+        if self.source is not None:
+            result = self.source.fetch()
+            snapshot = None if result.error else snapshot_from_dict(result.data)
+            if snapshot is not None:
+                if self._latest is None or snapshot.timestamp > self._latest.timestamp:
+                    processes = stats_from_dict(result.data.get("processes"))
+                    self._record(snapshot, processes, io_stats_from_dict(result.data.get("io")))
+                return
+        if self._monitor is None:
+            self._monitor = ProcessMonitor()
+        if self._io_monitor is None:
+            self._io_monitor = IOMonitor()
+        self._record(take_snapshot(self.disk_path, prime), self._monitor.sample(), self._io_monitor.sample())
+
+    def _record(self, snapshot: SystemSnapshot, processes: Optional[ProcessStats], io: Optional[IOStats]) -> None:
+        with self._lock:
+            self._processes = processes
+            self._io = io
+            self.history["cpu"].append(snapshot.cpu_percent)
+            self.history["memory"].append(snapshot.memory_percent)
+            self.history["swap"].append(snapshot.swap_percent)
+            self.history["disk"].append(snapshot.disk_percent)
+            for buffer, value in zip(self.per_cpu, snapshot.per_cpu):
+                buffer.append(value)
+            self._latest = snapshot
+
+
+_default_sampler: Optional[SystemSampler] = None
+_default_lock = threading.Lock()
+
+
+def default_sampler() -> SystemSampler:
+    global _default_sampler
+    with _default_lock:
+        if _default_sampler is None:
+            _default_sampler = SystemSampler(source=collector_source("health", "system health"))
+        sampler = _default_sampler
+    sampler.start()
+    return sampler
@@ -0,0 +1,145 @@
+import math
+import os
+import random
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional
+
+
+@dataclass(frozen=True)
+class RefreshPolicy:
+    interval: float
+    cost: float = 0.1
+    max_interval: Optional[float] = None
+    slow_factor: float = 4.0
+    jitter: float = 0.2
+
+    @property
+    def ceiling(self) -> float:
+        return self.max_interval if self.max_interval is not None else self.interval * 16
+
+    @property
+    def max_backoff(self) -> int:
+        return max(0, math.ceil(math.log2(self.ceiling / self.interval)))
+
+
+@dataclass
+class _Slot:
+    policy: RefreshPolicy
+    next_due: float
+    backoff: int = 0
+    failures: int = 0
+    last_duration: Optional[float] = None
+    last_ok: Optional[bool] = None
+    runs: int = 0
+
+
+@dataclass
+class SchedulerStats:
+    interval: float
+    backoff: int
+    failures: int
+    runs: int
+    last_duration: Optional[float]
+    last_ok: Optional[bool]
+    next_in: float
+
+
+@dataclass
+class RefreshScheduler:
+    idle_after: float = 0.0
+    clock: Callable[[], float] = time.monotonic
+    rng: random.Random = field(default_factory=random.Random)
+    _slots: Dict[str, _Slot] = field(default_factory=dict)
+    _visible: bool = True
+    _last_activity: float = 0.0
+
+    def __post_init__(self) -> None:
+        self._last_activity = self.clock()
+
+    def register(self, key: str, policy: RefreshPolicy) -> None:
+        self._slots[key] = _Slot(policy=policy, next_due=self.clock())
+
+    def set_visible(self, visible: bool) -> None:
+        self._visible = visible
+        if visible:
+            self.note_activity()
+
+    def note_activity(self) -> None:
+        self._last_activity = self.clock()
+
+    @property
+    def pause_reason(self) -> Optional[str]:
+        if not self._visible:
+            return "unfocused"
+        if self.idle_after > 0 and self.clock() - self._last_activity >= self.idle_after:
+            return "idle"
+        return None
+
+    @property
+    def paused(self) -> bool:
+        return self.pause_reason is not None
+
+    def start(self, key: str) -> None:
+        self._slots[key].next_due = math.inf
+
+    def due(self) -> List[str]:
+        if self.paused:
+            return []
+        now = self.clock()
+        return [key for key, slot in self._slots.items() if slot.next_due <= now]
+
+    def record(self, key: str, duration: float, ok: bool) -> float:
+        slot = self._slots[key]
+        policy = slot.policy
+        slow = duration > policy.cost * policy.slow_factor
+        slot.runs += 1
+        slot.last_duration = duration
+        slot.last_ok = ok
+        if ok:
+            slot.failures = 0
+        else:
+            slot.failures += 1
+        if not ok or slow:
+            slot.backoff = min(slot.backoff + 1, policy.max_backoff)
+        elif slot.backoff:
+            slot.backoff -= 1
+        interval = self._interval(slot)
+        slot.next_due = self.clock() + interval
+        return interval
+
+    def stats(self) -> Dict[str, SchedulerStats]:
+        now = self.clock()
+        return {
+            key: SchedulerStats(
+                interval=self._base_interval(slot),
+                backoff=slot.backoff,
+                failures=slot.failures,
+                runs=slot.runs,
+                last_duration=slot.last_duration,
+                last_ok=slot.last_ok,
+                next_in=max(0.0, slot.next_due - now),
+            )
+            for key, slot in self._slots.items()
+        }
+
+    def _base_interval(self, slot: _Slot) -> float:
+        policy = slot.policy
+        return min(policy.interval * (2 ** slot.backoff), policy.ceiling)
+
+    def _interval(self, slot: _Slot) -> float:
+        interval = self._base_interval(slot)
+        jitter = slot.policy.jitter
+        if jitter:
+            interval *= self.rng.uniform(1 - jitter, 1 + jitter)
+        return interval
+
+
+def idle_after_from_env() -> float:
+    spec = os.environ.get("CLAWD_DASH_IDLE_PAUSE", "").strip().lower()
+    if spec in ("", "off"):
+        return 0.0
+    try:
+        return max(0.0, float(spec))
+    except ValueError:
+        return 0.0
@@ -0,0 +1,128 @@
+import re
+import sqlite3
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable, List, Optional, Tuple
+
+from .memory_index import MemoryEntry
+
+MAX_INDEXED_BYTES = 1 << 20
+HIGHLIGHT_START = "\x01"
+HIGHLIGHT_END = "\x02"
+
+_TERM = re.compile(r"\w+", re.UNICODE)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE,
+    mtime REAL NOT NULL,
+    size INTEGER NOT NULL
+);
+CREATE VIRTUAL TABLE IF NOT EXISTS docs USING fts5(name, body, tokenize = 'unicode61');
+"""
+
+
+@dataclass(frozen=True)
+class SearchHit:
+    name: str
+    snippet: str
+    score: float
+
+
+@dataclass(frozen=True)
+class SyncResult:
+    added: int
+    updated: int
+    removed: int
+    unchanged: int
+
+
+def build_query(text: str) -> Optional[str]:
+    terms = _TERM.findall(text)
+    if not terms:
+        return None
+    quoted = [f'"{term}"' for term in terms]
+    if text and not text[-1].isspace():
+        quoted[-1] += "*"
+    return " ".join(quoted)
+
+
+class SearchIndex:
+    def __init__(self, db_path: Path, directory: Path) -> None:
+        self.db_path = db_path
+        self.directory = directory
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(db_path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+
+    def sync(self, entries: Iterable[MemoryEntry]) -> SyncResult:
+        with self._lock:
+            stored = {
+                name: (file_id, mtime, size)
+                for file_id, name, mtime, size in self._conn.execute("SELECT id, name, mtime, size FROM files")
+            }
+            added = updated = unchanged = 0
+            with self._conn:
+                for entry in entries:
+                    current = stored.pop(entry.name, None)
+                    if current is not None and current[1] == entry.mtime and current[2] == entry.size:
+                        unchanged += 1
+                        continue
+                    body = self._read(entry.name)
+                    if current is None:
+                        cursor = self._conn.execute(
+                            "INSERT INTO files (name, mtime, size) VALUES (?, ?, ?)",
+                            (entry.name, entry.mtime, entry.size),
+                        )
+                        file_id = cursor.lastrowid
+                        added += 1
+                    else:
+                        file_id = current[0]
+                        self._conn.execute(
+                            "UPDATE files SET mtime = ?, size = ? WHERE id = ?",
+                            (entry.mtime, entry.size, file_id),
+                        )
+                        self._conn.execute("DELETE FROM docs WHERE rowid = ?", (file_id,))
+                        updated += 1
+                    self._conn.execute(
+                        "INSERT INTO docs (rowid, name, body) VALUES (?, ?, ?)",
+                        (file_id, entry.name, body),
+                    )
+                removed: List[Tuple[int]] = [(file_id,) for file_id, _, _ in stored.values()]
+                self._conn.executemany("DELETE FROM docs WHERE rowid = ?", removed)
+                self._conn.executemany("DELETE FROM files WHERE id = ?", removed)
+            return SyncResult(added=added, updated=updated, removed=len(removed), unchanged=unchanged)
+
+    def search(self, text: str, limit: int = 20) -> List[SearchHit]:
+        query = build_query(text)
+        if query is None:
+            return []
+        with self._lock:
+            try:
+                rows = self._conn.execute(
+                    "SELECT name, snippet(docs, 1, ?, ?, '…', 12), bm25(docs, 5.0, 1.0) AS rank "
+                    "FROM docs WHERE docs MATCH ? ORDER BY rank LIMIT ?",
+                    (HIGHLIGHT_START, HIGHLIGHT_END, query, limit),
+                ).fetchall()
+            except sqlite3.OperationalError:
+                return []
+        return [SearchHit(name=name, snippet=snippet, score=-rank) for name, snippet, rank in rows]
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM files").fetchone()[0]
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def _read(self, name: str) -> str:
+        try:
+            with open(self.directory / name, "rb") as handle:
+                return handle.read(MAX_INDEXED_BYTES).decode("utf-8", errors="ignore")
+        except OSError:
+            return ""
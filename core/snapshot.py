@@ -0,0 +1,150 @@
+import json
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional
+
+from .cronjobs import format_countdown, load_jobs, parse_jobs
+from .memory_files import load_memory_files
+from .sampler import take_snapshot
+from .status import format_duration, load_status, read_status, session_rows
+
+CPU_SAMPLE_INTERVAL = 0.1
+
+
+def _session_section() -> Dict[str, Any]:
+    status, error = load_status()
+    if not status:
+        return {"ok": False, "error": error or "moltbot status unavailable"}
+    fields = read_status(status)
+    uptime = fields.uptime_seconds
+    return {
+        "ok": True,
+        "model": fields.model,
+        "tokens": fields.tokens,
+        "tokens_total": fields.tokens_total,
+        "percent_used": fields.percent_used,
+        "uptime_seconds": uptime,
+        "uptime": format_duration(uptime) if uptime is not None else None,
+        "sessions": [asdict(row) for row in session_rows(status)],
+    }
+
+
+def _crons_section() -> Dict[str, Any]:
+    jobs, error = load_jobs()
+    if error:
+        return {"ok": False, "error": error}
+    now = datetime.now(timezone.utc)
+    parsed = parse_jobs(jobs, now)
+    parsed.sort(key=lambda job: (job["next_dt"] is None, job["next_dt"] or now))
+    return {
+        "ok": True,
+        "jobs": [
+            {
+                "name": job["name"],
+                "schedule": job["schedule"],
+                "tz": job["tz"],
+                "next_run": job["next_dt"].isoformat() if job["next_dt"] else None,
+                "countdown": job["error"] or format_countdown(job["next_dt"]),
+                "error": job["error"],
+            }
+            for job in parsed
+        ],
+    }
+
+
+def _memory_section() -> Dict[str, Any]:
+    return {
+        "ok": True,
+        "files": [{"name": name, "preview": preview} for name, preview in load_memory_files()],
+    }
+
+
+def _health_section() -> Dict[str, Any]:
+    snapshot = asdict(take_snapshot(interval=CPU_SAMPLE_INTERVAL))
+    snapshot["per_cpu"] = list(snapshot["per_cpu"])
+    snapshot["ok"] = True
+    return snapshot
+
+
+SECTIONS: Dict[str, Callable[[], Dict[str, Any]]] = {
+    "session": _session_section,
+    "crons": _crons_section,
+    "memory": _memory_section,
+    "health": _health_section,
+}
+
+
+def collect_snapshot() -> Dict[str, Any]:
+    snapshot: Dict[str, Any] = {"timestamp": time.time()}
+    with ThreadPoolExecutor(max_workers=len(SECTIONS)) as pool:
+        futures = {name: pool.submit(section) for name, section in SECTIONS.items()}
+        for name, future in futures.items():
+            try:
+                snapshot[name] = future.result()
+            except Exception as exc:
+                snapshot[name] = {"ok": False, "error": str(exc)}
+    return snapshot
+
+
+def _format_text(snapshot: Dict[str, Any]) -> str:
+    lines: List[str] = []
+    session = snapshot["session"]
+    lines.append("Session")
+    if session["ok"]:
+        lines.append(f"  Model:  {session['model']}")
+        lines.append(f"  Tokens: {session['tokens']}")
+        lines.append(f"  Uptime: {session['uptime'] or '-'}")
+    else:
+        lines.append(f"  {session['error']}")
+    crons = snapshot["crons"]
+    lines.append("Cron Jobs")
+    if not crons["ok"]:
+        lines.append(f"  {crons['error']}")
+    elif not crons["jobs"]:
+        lines.append("  No cron jobs")
+    for job in crons.get("jobs", []):
+        lines.append(f"  {job['name']}  {job['schedule']}  {job['countdown']}")
+    memory = snapshot["memory"]
+    lines.append("Memory")
+    if memory["ok"]:
+        for entry in memory["files"]:
+            lines.append(f"  {entry['name']}: {entry['preview']}")
+    else:
+        lines.append(f"  {memory['error']}")
+    health = snapshot["health"]
+    lines.append("System Health")
+    if health["ok"]:
+        lines.append(f"  CPU:    {health['cpu_percent']:.1f}%")
+        lines.append(f"  Memory: {health['memory_percent']:.1f}%")
+        lines.append(f"  Swap:   {health['swap_percent']:.1f}%")
+        lines.append(f"  Disk:   {health['disk_percent']:.1f}%")
+    else:
+        lines.append(f"  {health['error']}")
+    return "\n".join(lines)
+
+
+def _write(snapshot: Dict[str, Any], as_json: bool, indent: Optional[int]) -> None:
+    if as_json:
+        sys.stdout.write(json.dumps(snapshot, indent=indent, default=str) + "\n")
+    else:
+        sys.stdout.write(_format_text(snapshot) + "\n")
+    sys.stdout.flush()
+
+
+def run_once(as_json: bool = False) -> int:
+    _write(collect_snapshot(), as_json, 2)
+    return 0
+
+
+def run_watch(interval: float) -> int:
+    interval = max(0.5, interval)
+    try:
+        while True:
+            started = time.monotonic()
+            _write(collect_snapshot(), True, None)
+            time.sleep(max(0.0, interval - (time.monotonic() - started)))
+    except (KeyboardInterrupt, BrokenPipeError):
+        return 0
@@ -0,0 +1,30 @@
+import time
+from typing import List, Optional, Tuple
+
+
+class StartupProfile:
+    def __init__(self, origin: Optional[float] = None) -> None:
+        self.origin = time.perf_counter() if origin is None else origin
+        self.marks: List[Tuple[str, float]] = []
+        self._seen = set()
+
+    def mark(self, label: str) -> bool:
+        if label in self._seen:
+            return False
+        self._seen.add(label)
+        self.marks.append((label, time.perf_counter() - self.origin))
+        return True
+
+    def elapsed(self, label: str) -> Optional[float]:
+        for name, seconds in self.marks:
+            if name == label:
+                return seconds
+        return None
+
+    def report(self) -> str:
+        lines = [f"{'stage':<24} {'at':>9} {'delta':>9}"]
+        previous = 0.0
+        for label, seconds in self.marks:
+            lines.append(f"{label:<24} {seconds * 1000:>7.1f}ms {(seconds - previous) * 1000:>7.1f}ms")
+            previous = seconds
+        return "\n".join(lines)
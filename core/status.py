@@ -0,0 +1,340 @@
+import re
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from .datasource import PollingSource, source_from_env
+from .fields import Candidate, FieldResolver
+
+STATUS_COMMAND = ["moltbot", "status", "--json"]
+
+_DURATION_PATTERN = re.compile(
+    r"(?P<num>\d+)\s*(?P<unit>days?|d|hours?|hrs?|h|minutes?|mins?|m|seconds?|secs?|s)",
+    re.IGNORECASE,
+)
+
+status_source = source_from_env(
+    "CLAWD_DASH_STATUS_SOURCE",
+    "status",
+    PollingSource(STATUS_COMMAND, "moltbot status"),
+)
+
+
+def load_status() -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+    result = status_source.fetch()
+    if result.error:
+        return None, result.error
+    data = result.data
+    if not isinstance(data, dict):
+        return None, "unexpected status payload"
+    return data, None
+
+
+def format_duration(seconds: Optional[float]) -> str:
+    if seconds is None:
+        return "unknown"
+    total_seconds = max(0, int(seconds))
+    days, remainder = divmod(total_seconds, 86400)
+    hours, remainder = divmod(remainder, 3600)
+    minutes, seconds = divmod(remainder, 60)
+    if days:
+        return f"{days}d {hours:02d}:{minutes:02d}:{seconds:02d}"
+    return f"{hours:02d}:{minutes:02d}:{seconds:02d}"
+
+
+def as_float(value: Any) -> Optional[float]:
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        return None
+    return float(value)
+
+
+def _parse_iso_datetime(value: str) -> Optional[datetime]:
+    if not value:
+        return None
+    try:
+        if value.endswith("Z"):
+            return datetime.fromisoformat(value.replace("Z", "+00:00"))
+        return datetime.fromisoformat(value)
+    except ValueError:
+        return None
+
+
+def _parse_timestamp(value: Any) -> Optional[datetime]:
+    if value is None:
+        return None
+    if isinstance(value, str):
+        if value.isdigit():
+            value = int(value)
+        else:
+            return _parse_iso_datetime(value)
+    if isinstance(value, (int, float)):
+        timestamp = float(value)
+        if timestamp > 1e12:
+            timestamp /= 1000.0
+        return datetime.fromtimestamp(timestamp, tz=timezone.utc)
+    return None
+
+
+def _parse_duration_text(value: Any) -> Optional[float]:
+    if not isinstance(value, str) or not value:
+        return None
+    total_seconds = 0.0
+    found = False
+    for match in _DURATION_PATTERN.finditer(value):
+        found = True
+        amount = int(match.group("num"))
+        unit = match.group("unit").lower()
+        if unit.startswith("d"):
+            total_seconds += amount * 86400
+        elif unit.startswith("h"):
+            total_seconds += amount * 3600
+        elif unit.startswith("m"):
+            total_seconds += amount * 60
+        else:
+            total_seconds += amount
+    return total_seconds if found else None
+
+
+def _coerce_seconds(value: Any) -> Optional[float]:
+    if value is None:
+        return None
+    if isinstance(value, str):
+        if value.isdigit():
+            value = int(value)
+        else:
+            parsed = _parse_iso_datetime(value)
+            if parsed:
+                return max(0.0, (datetime.now(timezone.utc) - parsed).total_seconds())
+            return None
+    if isinstance(value, (int, float)):
+        if value > 1e12:
+            return value / 1000.0
+        if value > 1e9:
+            return float(value)
+        if value > 1e6:
+            return value / 1000.0
+        return float(value)
+    return None
+
+
+def _since(value: Any) -> Optional[float]:
+    started = _parse_timestamp(value)
+    if started is None:
+        return None
+    return max(0.0, time.time() - started.timestamp())
+
+
+def _milliseconds(value: Any) -> Optional[float]:
+    number = as_float(value)
+    return None if number is None else max(0.0, number / 1000.0)
+
+
+def _seconds(value: Any) -> Optional[float]:
+    number = as_float(value)
+    return None if number is None else max(0.0, number)
+
+
+def _text(value: Any) -> Optional[str]:
+    return value if isinstance(value, str) and value.strip() else None
+
+
+def _mapping(value: Any) -> Optional[Dict[str, Any]]:
+    return value if isinstance(value, dict) and value else None
+
+
+def _uptime_candidates() -> List[Candidate]:
+    candidates = [
+        Candidate((key,), _coerce_seconds)
+        for key in ("uptimeMs", "uptimeMS", "uptimeMillis", "uptimeSeconds", "uptimeSec", "uptime")
+    ]
+    for section in ("gateway", "gatewayService", "nodeService", "process", "system"):
+        candidates += [
+            Candidate((section, key), _coerce_seconds) for key in ("uptimeMs", "uptimeMillis", "uptimeSeconds", "uptime")
+        ]
+        candidates += [Candidate((section, key), _since) for key in ("startedAtMs", "startedAt")]
+        candidates += [Candidate((section, key), _parse_duration_text) for key in ("runtimeShort", "runtimeLong")]
+    return candidates
+
+
+_STATUS_FIELDS = FieldResolver(
+    {
+        "session": [
+            Candidate(("session",), _mapping),
+            Candidate(("sessions", "recent", 0), _mapping),
+            Candidate(("sessions", "byAgent", 0, "recent", 0), _mapping),
+            Candidate(("sessions", 0), _mapping),
+        ],
+        "model": [
+            Candidate(("model",), _text),
+            Candidate(("current_model",), _text),
+            Candidate(("session_model",), _text),
+            Candidate(("sessions", "defaults", "model"), _text),
+        ],
+        "usage": [Candidate(("token_usage",), _mapping), Candidate(("tokens",), _mapping)],
+        "uptime": _uptime_candidates(),
+        "agent_idle": [Candidate(("agents", "agents", 0, "lastActiveAgeMs"), _coerce_seconds)],
+    }
+)
+
+_SESSION_FIELDS = FieldResolver(
+    {
+        "key": [Candidate(("key",), str), Candidate(("sessionId",), str), Candidate(("id",), str)],
+        "agent": [Candidate(("agentId",), _text), Candidate(("agent",), _text)],
+        "model": [Candidate(("model",), _text)],
+        "input": [Candidate(("inputTokens",)), Candidate(("promptTokens",))],
+        "output": [Candidate(("outputTokens",)), Candidate(("completionTokens",))],
+        "total": [Candidate(("totalTokens",)), Candidate(("tokens",))],
+        "remaining": [Candidate(("remainingTokens",))],
+        "percent": [Candidate(("percentUsed",))],
+        "context": [Candidate(("contextTokens",))],
+        "age": [
+            Candidate(("ageMs",), _milliseconds),
+            Candidate(("age",), _seconds),
+            Candidate(("updatedAt",), _since),
+        ],
+    }
+)
+
+_USAGE_FIELDS = FieldResolver(
+    {
+        "prompt": [Candidate(("prompt",)), Candidate(("input",))],
+        "completion": [Candidate(("completion",)), Candidate(("output",))],
+        "total": [Candidate(("total",))],
+    }
+)
+
+
+@dataclass(frozen=True)
+class StatusFields:
+    session: Optional[Dict[str, Any]]
+    session_key: Optional[str]
+    model: str
+    tokens: str
+    tokens_total: Optional[float]
+    percent_used: Optional[float]
+    uptime_seconds: Optional[float]
+
+
+def _format_tokens(usage: Optional[Dict[str, Any]], session: Dict[str, Any]) -> str:
+    if usage:
+        counts = _USAGE_FIELDS.resolve(usage)
+        parts = [f"{name} {counts[name]}" for name in ("prompt", "completion", "total") if counts[name] is not None]
+        if parts:
+            return ", ".join(parts)
+    parts = []
+    if session.get("input") is not None:
+        parts.append(f"in {session['input']}")
+    if session.get("output") is not None:
+        parts.append(f"out {session['output']}")
+    if session.get("total") is not None:
+        parts.append(f"total {session['total']}")
+    percent, context, remaining = session.get("percent"), session.get("context"), session.get("remaining")
+    if percent is not None:
+        parts.append(f"{percent}% of {context}" if context else f"{percent}% used")
+    elif remaining is not None and context:
+        used = context - remaining
+        if used >= 0:
+            parts.append(f"{used} / {context}")
+    return " · ".join(parts) if parts else "unavailable"
+
+
+def read_status(status: Dict[str, Any]) -> StatusFields:
+    fields = _STATUS_FIELDS.resolve(status)
+    session = fields["session"]
+    values = _SESSION_FIELDS.resolve(session) if session else {}
+    uptime = fields["uptime"]
+    if uptime is None:
+        uptime = values.get("age")
+    if uptime is None:
+        uptime = fields["agent_idle"]
+    return StatusFields(
+        session=session,
+        session_key=values.get("key"),
+        model=values.get("model") or fields["model"] or "unknown",
+        tokens=_format_tokens(fields["usage"], values),
+        tokens_total=as_float(values.get("total")),
+        percent_used=as_float(values.get("percent")),
+        uptime_seconds=uptime,
+    )
+
+
+@dataclass(frozen=True)
+class SessionRow:
+    key: str
+    agent: str
+    model: str
+    total_tokens: Optional[float]
+    percent_used: Optional[float]
+    age_seconds: Optional[float]
+    input_tokens: Optional[float] = None
+    output_tokens: Optional[float] = None
+    context_tokens: Optional[float] = None
+
+
+def extract_sessions(status: Dict[str, Any]) -> List[Dict[str, Any]]:
+    found: List[Dict[str, Any]] = []
+    seen: Set[str] = set()
+
+    def add(entry: Any, agent: Any = None) -> None:
+        if not isinstance(entry, dict):
+            return
+        key = str(entry.get("key") or entry.get("sessionId") or entry.get("id") or "")
+        if key:
+            if key in seen:
+                return
+            seen.add(key)
+        if agent and not entry.get("agentId"):
+            entry = dict(entry, agentId=agent)
+        found.append(entry)
+
+    add(status.get("session"))
+    sessions = status.get("sessions")
+    if isinstance(sessions, dict):
+        recent = sessions.get("recent")
+        if isinstance(recent, list):
+            for entry in recent:
+                add(entry)
+        by_agent = sessions.get("byAgent")
+        if isinstance(by_agent, list):
+            for group in by_agent:
+                if not isinstance(group, dict):
+                    continue
+                agent = group.get("agentId") or group.get("id") or group.get("name")
+                agent_recent = group.get("recent")
+                if isinstance(agent_recent, list):
+                    for entry in agent_recent:
+                        add(entry, agent)
+    elif isinstance(sessions, list):
+        for entry in sessions:
+            add(entry)
+    return found
+
+
+def _session_agent(agent: Optional[str], key: Optional[str]) -> str:
+    if agent:
+        return agent
+    if key and key.startswith("agent:"):
+        return key.split(":")[1] or "-"
+    return "-"
+
+
+_ROW_FIELDS = ("key", "agent", "model", "total", "percent", "age", "input", "output", "context")
+
+
+def session_rows(status: Dict[str, Any]) -> List[SessionRow]:
+    resolved = _SESSION_FIELDS.resolve_many(extract_sessions(status), _ROW_FIELDS)
+    return [
+        SessionRow(
+            key=key or "-",
+            agent=_session_agent(agent, key),
+            model=model or "-",
+            total_tokens=as_float(total),
+            percent_used=as_float(percent),
+            age_seconds=age,
+            input_tokens=as_float(input_tokens),
+            output_tokens=as_float(output_tokens),
+            context_tokens=as_float(context),
+        )
+        for key, agent, model, total, percent, age, input_tokens, output_tokens, context in resolved
+    ]
@@ -0,0 +1,260 @@
+import fcntl
+import math
+import mmap
+import os
+import re
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import IO, Dict, Iterable, List, Mapping, Optional, Tuple
+
+_FIELDS = 5
+_RECORD_BYTES = _FIELDS * 8
+_SAFE_NAME = re.compile(r"[^A-Za-z0-9_.-]+")
+CLAIM_RETRY_SECONDS = 30.0
+
+
+@dataclass(frozen=True)
+class Tier:
+    resolution: int
+    capacity: int
+
+    @property
+    def span(self) -> int:
+        return self.resolution * self.capacity
+
+
+DEFAULT_TIERS = (
+    Tier(resolution=1, capacity=3600),
+    Tier(resolution=60, capacity=1440),
+    Tier(resolution=3600, capacity=720),
+)
+
+
+@dataclass(frozen=True)
+class Point:
+    timestamp: float
+    mean: float
+    minimum: float
+    maximum: float
+    count: int
+
+
+class _Segment:
+    def __init__(self, tier: Tier, path: Optional[Path], writable: bool = True) -> None:
+        self.tier = tier
+        size = tier.capacity * _RECORD_BYTES
+        self._mmap: Optional[mmap.mmap] = None
+        if path is None:
+            self._view = memoryview(bytearray(size)).cast("d")
+        elif writable:
+            fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+            try:
+                if os.fstat(fd).st_size != size:
+                    os.ftruncate(fd, 0)
+                    os.ftruncate(fd, size)
+                self._mmap = mmap.mmap(fd, size)
+            finally:
+                os.close(fd)
+            self._view = memoryview(self._mmap).cast("d")
+        else:
+            self._view = memoryview(bytes(size)).cast("d")
+            try:
+                fd = os.open(path, os.O_RDONLY)
+            except OSError:
+                return
+            try:
+                if os.fstat(fd).st_size == size:
+                    self._mmap = mmap.mmap(fd, size, access=mmap.ACCESS_READ)
+                    self._view = memoryview(self._mmap).cast("d")
+            finally:
+                os.close(fd)
+
+    def add(self, timestamp: float, value: float) -> None:
+        resolution = self.tier.resolution
+        bucket = int(timestamp // resolution)
+        base = (bucket % self.tier.capacity) * _FIELDS
+        view = self._view
+        start = float(bucket * resolution)
+        if view[base] != start:
+            view[base] = start
+            view[base + 1] = value
+            view[base + 2] = 1.0
+            view[base + 3] = value
+            view[base + 4] = value
+            return
+        view[base + 1] += value
+        view[base + 2] += 1.0
+        if value < view[base + 3]:
+            view[base + 3] = value
+        if value > view[base + 4]:
+            view[base + 4] = value
+
+    def points(self, start: float, end: float) -> List[Point]:
+        resolution = self.tier.resolution
+        capacity = self.tier.capacity
+        first = int(start // resolution)
+        last = int(end // resolution)
+        first = max(first, last - capacity + 1)
+        view = self._view
+        result: List[Point] = []
+        for bucket in range(first, last + 1):
+            base = (bucket % capacity) * _FIELDS
+            bucket_start = float(bucket * resolution)
+            if view[base] != bucket_start or not view[base + 2]:
+                continue
+            count = view[base + 2]
+            result.append(
+                Point(
+                    timestamp=bucket_start,
+                    mean=view[base + 1] / count,
+                    minimum=view[base + 3],
+                    maximum=view[base + 4],
+                    count=int(count),
+                )
+            )
+        return result
+
+    def flush(self) -> None:
+        if self._mmap is not None:
+            self._mmap.flush()
+
+    def close(self) -> None:
+        self._view.release()
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+
+
+class Series:
+    def __init__(self, name: str, tiers: Tuple[Tier, ...], directory: Optional[Path], writable: bool = True) -> None:
+        self.name = name
+        self.tiers = tiers
+        self.writable = writable
+        self._segments = [
+            _Segment(tier, directory / f"{name}.{tier.resolution}s-{tier.capacity}.tsdb" if directory else None, writable)
+            for tier in tiers
+        ]
+
+    def add(self, value: float, timestamp: Optional[float] = None) -> None:
+        if not self.writable or value is None or math.isnan(value):
+            return
+        timestamp = time.time() if timestamp is None else timestamp
+        for segment in self._segments:
+            segment.add(timestamp, float(value))
+
+    def query(self, start: float, end: Optional[float] = None, resolution: Optional[int] = None) -> List[Point]:
+        end = time.time() if end is None else end
+        return self._segment_for(start, end, resolution).points(start, end)
+
+    def summary(self, start: float, end: Optional[float] = None) -> Optional[Tuple[float, float, float]]:
+        points = self.query(start, end)
+        count = sum(point.count for point in points)
+        if not count:
+            return None
+        mean = sum(point.mean * point.count for point in points) / count
+        return min(point.minimum for point in points), mean, max(point.maximum for point in points)
+
+    def latest(self) -> Optional[Point]:
+        now = time.time()
+        points = self._segments[0].points(now - self.tiers[0].span, now)
+        return points[-1] if points else None
+
+    def _segment_for(self, start: float, end: float, resolution: Optional[int]) -> _Segment:
+        if resolution is not None:
+            for segment in self._segments:
+                if segment.tier.resolution >= resolution:
+                    return segment
+            return self._segments[-1]
+        for segment in self._segments:
+            if end - start <= segment.tier.span:
+                return segment
+        return self._segments[-1]
+
+    def flush(self) -> None:
+        for segment in self._segments:
+            segment.flush()
+
+    def close(self) -> None:
+        for segment in self._segments:
+            segment.close()
+
+
+class TimeSeriesStore:
+    def __init__(self, directory: Optional[Path] = None, tiers: Tuple[Tier, ...] = DEFAULT_TIERS) -> None:
+        self.directory = directory
+        self.tiers = tiers
+        self._series: Dict[str, Series] = {}
+        self._lock = threading.Lock()
+        self._owner: Optional[IO[str]] = None
+        self._claim_after = 0.0
+        if directory is not None:
+            directory.mkdir(parents=True, exist_ok=True)
+            self._claim()
+
+    @property
+    def writable(self) -> bool:
+        return self.directory is None or self._owner is not None
+
+    def series(self, name: str) -> Series:
+        with self._lock:
+            series = self._series.get(name)
+            if series is None:
+                series = Series(_SAFE_NAME.sub("_", name), self.tiers, self.directory, self.writable)
+                self._series[name] = series
+            return series
+
+    def names(self) -> List[str]:
+        with self._lock:
+            names = set(self._series)
+        if self.directory is not None:
+            suffix = f".{self.tiers[0].resolution}s-{self.tiers[0].capacity}.tsdb"
+            names.update(path.name[: -len(suffix)] for path in self.directory.glob(f"*{suffix}"))
+        return sorted(names)
+
+    def record(self, values: Mapping[str, Optional[float]], timestamp: Optional[float] = None) -> None:
+        if not self._claim():
+            return
+        timestamp = time.time() if timestamp is None else timestamp
+        for name, value in values.items():
+            if value is not None:
+                self.series(name).add(value, timestamp)
+
+    def flush(self) -> None:
+        with self._lock:
+            series: Iterable[Series] = list(self._series.values())
+        for item in series:
+            item.flush()
+
+    def close(self) -> None:
+        with self._lock:
+            series = list(self._series.values())
+            self._series.clear()
+            owner, self._owner = self._owner, None
+        for item in series:
+            item.close()
+        if owner is not None:
+            owner.close()
+
+    def _claim(self) -> bool:
+        if self.writable:
+            return True
+        assert self.directory is not None
+        now = time.monotonic()
+        if now < self._claim_after:
+            return False
+        self._claim_after = now + CLAIM_RETRY_SECONDS
+        try:
+            handle = open(self.directory / "writer.lock", "a")
+        except OSError:
+            return False
+        try:
+            fcntl.flock(handle, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            handle.close()
+            return False
+        with self._lock:
+            self._owner = handle
+            self._series.clear()
+        return True
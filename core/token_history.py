@@ -0,0 +1,298 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Deque, Dict, Iterable, List, Mapping, Optional, Tuple
+
+from .paths import state_path
+from .status import SessionRow
+
+SHORT_WINDOW = 300.0
+LONG_WINDOW = 3600.0
+MIN_SPAN_SECONDS = 30.0
+FLUSH_ROWS = 256
+FLUSH_SECONDS = 30.0
+RETENTION_SECONDS = 7 * 86400
+PRUNE_EVERY_SECONDS = 3600.0
+
+DEFAULT_PRICES: Dict[str, Tuple[float, float]] = {
+    "opus": (15.0, 75.0),
+    "sonnet": (3.0, 15.0),
+    "haiku": (0.8, 4.0),
+}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS samples (
+    session TEXT NOT NULL,
+    ts REAL NOT NULL,
+    total REAL NOT NULL,
+    input REAL,
+    output REAL,
+    model TEXT
+);
+CREATE INDEX IF NOT EXISTS samples_session_ts ON samples (session, ts);
+CREATE INDEX IF NOT EXISTS samples_ts ON samples (ts);
+"""
+
+
+class _Sample:
+    __slots__ = ("timestamp", "total", "input", "output", "grown", "grown_input", "grown_output")
+
+    def __init__(
+        self,
+        timestamp: float,
+        total: float,
+        input_tokens: Optional[float],
+        output_tokens: Optional[float],
+        grown: float = 0.0,
+        grown_input: Optional[float] = None,
+        grown_output: Optional[float] = None,
+    ) -> None:
+        self.timestamp = timestamp
+        self.total = total
+        self.input = input_tokens
+        self.output = output_tokens
+        self.grown = grown
+        self.grown_input = grown_input
+        self.grown_output = grown_output
+
+
+@dataclass(frozen=True)
+class Burn:
+    tokens: float
+    input: Optional[float]
+    output: Optional[float]
+
+
+@dataclass(frozen=True)
+class BurnSummary:
+    short_rate: Optional[float]
+    long_rate: Optional[float]
+    full_in_seconds: Optional[float]
+    cost_per_day: Optional[float]
+
+
+class TokenHistory:
+    def __init__(self, db_path: Optional[Path] = None) -> None:
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        self._samples: Dict[str, Deque[_Sample]] = {}
+        self._observed: Dict[str, float] = {}
+        self._pending: List[Tuple[str, float, float, Optional[float], Optional[float], str]] = []
+        self._flushed_at = time.time()
+        self._pruned_at = 0.0
+        self._conn: Optional[sqlite3.Connection] = None
+        if db_path is None:
+            return
+        self._conn = sqlite3.connect(str(db_path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        self._load()
+
+    def record(self, rows: Iterable[SessionRow], now: Optional[float] = None) -> None:
+        now = time.time() if now is None else now
+        with self._lock:
+            for row in rows:
+                if row.total_tokens is None or row.key == "-":
+                    continue
+                self._observed[row.key] = now
+                samples = self._samples.get(row.key)
+                if samples is None:
+                    samples = self._samples[row.key] = deque()
+                elif samples[-1].total == row.total_tokens:
+                    continue
+                _append(samples, now, row.total_tokens, row.input_tokens, row.output_tokens)
+                self._pending.append((row.key, now, row.total_tokens, row.input_tokens, row.output_tokens, row.model))
+            if len(self._pending) >= FLUSH_ROWS or now - self._flushed_at >= FLUSH_SECONDS:
+                self._flush_locked(now)
+
+    def burn(self, key: str, window: float) -> Optional[Burn]:
+        with self._lock:
+            return self._burn_locked(key, window)
+
+    def summarize(
+        self,
+        rows: Iterable[SessionRow],
+        current: Optional[str],
+        prices: Mapping[str, Tuple[float, float]],
+    ) -> BurnSummary:
+        short_rate: Optional[float] = None
+        long_rate: Optional[float] = None
+        cost: Optional[float] = None
+        full_in: Optional[float] = None
+        matched: Dict[str, Optional[Tuple[float, float]]] = {}
+        with self._lock:
+            for row in rows:
+                short = self._burn_locked(row.key, SHORT_WINDOW)
+                long = self._burn_locked(row.key, LONG_WINDOW)
+                if short is not None:
+                    short_rate = (short_rate or 0.0) + short.tokens
+                if long is not None:
+                    long_rate = (long_rate or 0.0) + long.tokens
+                recent = short or long
+                if recent is None:
+                    continue
+                if row.model not in matched:
+                    matched[row.model] = price_for(row.model, prices)
+                price = matched[row.model]
+                if price is not None:
+                    cost = (cost or 0.0) + cost_per_day(recent, price)
+                if row.key == current and recent.tokens > 0 and row.context_tokens:
+                    remaining = max(0.0, row.context_tokens - (row.total_tokens or 0.0))
+                    full_in = remaining / recent.tokens * 60.0
+        return BurnSummary(short_rate=short_rate, long_rate=long_rate, full_in_seconds=full_in, cost_per_day=cost)
+
+    def flush(self) -> None:
+        with self._lock:
+            self._flush_locked(time.time())
+
+    def close(self) -> None:
+        with self._lock:
+            self._flush_locked(time.time())
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def _flush_locked(self, now: float) -> None:
+        pending, self._pending = self._pending, []
+        self._flushed_at = now
+        prune = now - self._pruned_at >= PRUNE_EVERY_SECONDS
+        if prune:
+            self._pruned_at = now
+            for key in [key for key, seen in self._observed.items() if seen < now - LONG_WINDOW]:
+                del self._observed[key]
+                del self._samples[key]
+        if self._conn is None:
+            return
+        try:
+            with self._conn:
+                self._conn.executemany(
+                    "INSERT INTO samples (session, ts, total, input, output, model) VALUES (?, ?, ?, ?, ?, ?)",
+                    pending,
+                )
+                if prune:
+                    self._conn.execute("DELETE FROM samples WHERE ts < ?", (now - RETENTION_SECONDS,))
+        except sqlite3.Error:
+            pass
+
+    def _load(self) -> None:
+        assert self._conn is not None
+        cutoff = time.time() - LONG_WINDOW
+        rows = self._conn.execute(
+            "SELECT session, MAX(ts), total, input, output FROM samples WHERE ts < ? GROUP BY session "
+            "UNION ALL SELECT session, ts, total, input, output FROM samples WHERE ts >= ? ORDER BY 2",
+            (cutoff, cutoff),
+        )
+        for key, timestamp, total, input_tokens, output_tokens in rows:
+            _append(self._samples.setdefault(key, deque()), timestamp, total, input_tokens, output_tokens)
+            self._observed[key] = timestamp
+
+    def _burn_locked(self, key: str, window: float) -> Optional[Burn]:
+        samples = self._samples.get(key)
+        observed = self._observed.get(key)
+        if not samples or observed is None:
+            return None
+        start = observed - window
+        last = samples[-1]
+        base = samples[0]
+        if base.timestamp > start:
+            start = base.timestamp
+        elif last.timestamp <= start:
+            base = last
+        else:
+            for sample in reversed(samples):
+                if sample.timestamp <= start:
+                    base = sample
+                    break
+        if observed - start < MIN_SPAN_SECONDS:
+            return None
+        minutes = (observed - start) / 60.0
+        return Burn(
+            tokens=(last.grown - base.grown) / minutes,
+            input=_rate(base.grown_input, last.grown_input, minutes),
+            output=_rate(base.grown_output, last.grown_output, minutes),
+        )
+
+
+def _grow(grown: Optional[float], previous: Optional[float], value: Optional[float]) -> Optional[float]:
+    if value is None:
+        return None
+    if grown is None or previous is None:
+        return 0.0
+    return grown + value - previous if value > previous else grown
+
+
+def _append(
+    samples: Deque[_Sample],
+    timestamp: float,
+    total: float,
+    input_tokens: Optional[float],
+    output_tokens: Optional[float],
+) -> None:
+    previous = samples[-1] if samples else _Sample(timestamp, total, None, None)
+    samples.append(
+        _Sample(
+            timestamp,
+            total,
+            input_tokens,
+            output_tokens,
+            previous.grown + total - previous.total if total > previous.total else previous.grown,
+            _grow(previous.grown_input, previous.input, input_tokens),
+            _grow(previous.grown_output, previous.output, output_tokens),
+        )
+    )
+    while len(samples) > 1 and samples[1].timestamp <= timestamp - LONG_WINDOW:
+        samples.popleft()
+
+
+def _rate(base: Optional[float], last: Optional[float], minutes: float) -> Optional[float]:
+    if base is None or last is None:
+        return None
+    return max(0.0, last - base) / minutes
+
+
+def load_prices() -> Dict[str, Tuple[float, float]]:
+    path = os.environ.get("CLAWD_DASH_PRICES")
+    if not path:
+        return dict(DEFAULT_PRICES)
+    try:
+        raw = json.loads(Path(path).expanduser().read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return dict(DEFAULT_PRICES)
+    prices: Dict[str, Tuple[float, float]] = {}
+    for model, entry in raw.items() if isinstance(raw, dict) else ():
+        if isinstance(entry, dict):
+            try:
+                prices[str(model).lower()] = (float(entry["input"]), float(entry["output"]))
+            except (KeyError, TypeError, ValueError):
+                continue
+    return prices
+
+
+def price_for(model: str, prices: Mapping[str, Tuple[float, float]]) -> Optional[Tuple[float, float]]:
+    model = model.lower()
+    if model in prices:
+        return prices[model]
+    matches = [name for name in prices if name in model]
+    return prices[max(matches, key=len)] if matches else None
+
+
+def cost_per_day(burn: Burn, price: Tuple[float, float]) -> float:
+    input_price, output_price = price
+    if burn.input is not None and burn.output is not None:
+        per_minute = burn.input * input_price + burn.output * output_price
+    else:
+        per_minute = burn.tokens * input_price
+    return per_minute * 1440 / 1_000_000
+
+
+def open_token_history() -> TokenHistory:
+    try:
+        return TokenHistory(state_path("token-history.db"))
+    except (OSError, sqlite3.Error):
+        return TokenHistory()
@@ -0,0 +1,536 @@
+import os
+import threading
+import time
+from dataclasses import asdict
+from functools import partial
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set
+
+from textual import events
+from textual.app import App, ComposeResult
+from textual.containers import Container
+from textual.widgets import Button, Footer, Header
+
+from core import RefreshScheduler
+from core.alerts import AlertEngine, AlertEvent, AlertHook, load_alerts
+from core.datasource import DataSource
+from core.executor import default_executor
+from core.jobs import JobRun, JobRunner, max_jobs_from_env
+from core.instrumentation import default_instrumentation
+from core.panel_cache import PanelCache
+from core.paths import state_dir
+from core.scheduler import idle_after_from_env
+from core.startup import StartupProfile
+from core.timeseries import TimeSeriesStore
+from panels import (
+    CronJobsPanel,
+    CronTimelineScreen,
+    DashboardPanel,
+    MemoryPanel,
+    MemorySearchScreen,
+    JobLogScreen,
+    JobsScreen,
+    PerformanceScreen,
+    QuickActionsPanel,
+    SessionPanel,
+    SessionsScreen,
+    SystemHealthPanel,
+)
+from panels.base import ErrorModel
+
+
+LOOP_PROBE_INTERVAL = 0.25
+EMAIL_CHECK_COMMAND = ["/root/clawd/nightly-builds/unified-email-checker/check-emails"]
+
+
+class ClawdDashApp(App):
+    CSS = """
+    Screen {
+        background: #0b1220;
+        color: #e2e8f0;
+    }
+
+    #grid {
+        layout: grid;
+        grid-size: 2 3;
+        grid-columns: 1fr 1fr;
+        grid-rows: 1fr 1fr 7;
+        grid-gutter: 1 2;
+        padding: 1 2;
+    }
+
+    .panel {
+        border: round #334155;
+        border-subtitle-color: #94a3b8;
+        background: #111827;
+        padding: 1 2;
+    }
+
+    #session {
+        border-title-color: #7ee787;
+    }
+
+    #crons {
+        border-title-color: #ffb3c1;
+    }
+
+    #memory {
+        border-title-color: #ffc078;
+    }
+
+    #health {
+        border-title-color: #8ce99a;
+    }
+
+    #actions {
+        column-span: 2;
+        border-title-color: #a5d6ff;
+        height: 7;
+    }
+
+    #action-buttons {
+        height: 3;
+        content-align: center middle;
+    }
+
+    Button {
+        margin: 0 1;
+    }
+
+    #action-status {
+        color: #94a3b8;
+        margin-top: 1;
+        content-align: center middle;
+    }
+
+    JobLogScreen, JobsScreen, SessionsScreen {
+        align: center middle;
+    }
+
+    #job-log, #jobs, #sessions {
+        width: 90%;
+        height: 90%;
+        border: round #334155;
+        background: #0f172a;
+        padding: 1 2;
+    }
+
+    #job-log-title {
+        height: auto;
+        margin-bottom: 1;
+    }
+
+    #job-log-body {
+        height: 1fr;
+        overflow-x: hidden;
+        border: round #1f2937;
+        background: #0b1220;
+    }
+
+    #sessions-status {
+        color: #94a3b8;
+        height: 1;
+        margin: 1 0;
+    }
+
+    #jobs-list, #sessions-table {
+        height: 1fr;
+        border: round #1f2937;
+        background: #0b1220;
+    }
+
+    #job-log-help, #jobs-help, #sessions-help {
+        height: 1;
+        margin-top: 1;
+    }
+
+    CronTimelineScreen {
+        align: center middle;
+    }
+
+    #cron-timeline {
+        width: 90%;
+        height: 90%;
+        border: round #334155;
+        border-title-color: #ffb3c1;
+        background: #0f172a;
+        padding: 1 2;
+    }
+
+    PerformanceScreen {
+        align: center middle;
+    }
+
+    #perf {
+        width: 90%;
+        height: 90%;
+        border: round #334155;
+        border-title-color: #a5d6ff;
+        background: #0f172a;
+        padding: 1 2;
+    }
+
+    #perf-help {
+        height: 1;
+    }
+
+    MemorySearchScreen {
+        align: center middle;
+    }
+
+    #memory-search {
+        width: 90%;
+        height: 90%;
+        border: round #334155;
+        border-title-color: #ffc078;
+        background: #0f172a;
+        padding: 1 2;
+    }
+
+    #memory-search-status {
+        color: #94a3b8;
+        height: 1;
+        margin: 1 0;
+    }
+
+    #memory-search-results {
+        height: 1fr;
+    }
+    """
+
+    BINDINGS = [
+        ("q", "quit", "Quit"),
+        ("r", "refresh", "Refresh"),
+        ("slash", "search_memory", "Search memory"),
+        ("t", "cron_timeline", "Cron timeline"),
+        ("p", "performance", "Performance"),
+        ("j", "jobs", "Jobs"),
+        ("s", "sessions", "Sessions"),
+    ]
+
+    def __init__(self, startup_profile: Optional[StartupProfile] = None) -> None:
+        super().__init__()
+        self.start_time = time.time()
+        self.startup_profile = startup_profile
+        self._created = time.perf_counter()
+        self._ui_thread: Optional[int] = None
+        self.scheduler = RefreshScheduler(idle_after=idle_after_from_env())
+        self._refresh_started: Dict[str, float] = {}
+        self._refresh_pending: Set[str] = set()
+        self._sources: List[DataSource] = []
+        self.metrics = _open_metrics_store()
+        self.cache = _open_panel_cache()
+        self._record_failures: Dict[str, int] = {}
+        self._record_error: Optional[str] = None
+        rules, hook, self._alerts_error = load_alerts()
+        self.alerts = AlertEngine(rules)
+        self.alert_hook = AlertHook(hook) if hook else None
+        self.jobs = JobRunner(state_dir() / "runs", max_jobs_from_env())
+        self.jobs.subscribe(self._on_job_changed)
+
+    def compose(self) -> ComposeResult:
+        yield Header(show_clock=True)
+        with Container(id="grid"):
+            yield SessionPanel(self.start_time, id="session", classes="panel")
+            yield CronJobsPanel(id="crons", classes="panel")
+            yield MemoryPanel(id="memory", classes="panel")
+            yield SystemHealthPanel(self.metrics, id="health", classes="panel")
+            yield QuickActionsPanel(id="actions", classes="panel")
+        yield Footer()
+
+    def on_mount(self) -> None:
+        self._ui_thread = threading.get_ident()
+        for panel in self._panels():
+            self.scheduler.register(panel.id, panel.REFRESH_POLICY)
+            for source in panel.data_sources():
+                source.subscribe(partial(self._on_source_push, panel.id))
+                self._sources.append(source)
+        if self._alerts_error:
+            self.notify(self._alerts_error, title="Alerts", severity="warning", markup=False)
+        self._mark("mounted")
+        self.call_after_refresh(self._first_paint)
+        cached = [panel for panel in self._panels() if panel.CACHE_DATA]
+        self.run_worker(partial(self._load_cached, cached), thread=True, name="load-cache", exit_on_error=False)
+        self.call_after_refresh(self._start_refreshes)
+
+    def _load_cached(self, panels: List[DashboardPanel]) -> None:
+        for panel in panels:
+            entry = self.cache.load(panel.id)
+            if entry is None:
+                continue
+            try:
+                if not panel.data_ok(entry.data):
+                    continue
+                model = panel.build_cached_model(entry.data)
+            except Exception:
+                continue
+            self.call_from_thread(self._show_cached, panel, model, entry.saved_at)
+
+    def _show_cached(self, panel: DashboardPanel, model: object, saved_at: float) -> None:
+        if panel.is_mounted and panel.data_time is None:
+            panel.show_cached(model, saved_at)
+
+    def _start_refreshes(self) -> None:
+        self.refresh_all()
+        self.set_interval(1, self._run_due_refreshes)
+        self._loop_tick = time.perf_counter()
+        self.set_interval(LOOP_PROBE_INTERVAL, self._probe_loop_lag)
+
+    def on_unmount(self) -> None:
+        for source in self._sources:
+            source.close()
+        self.jobs.shutdown()
+        self.metrics.flush()
+        self.cache.flush()
+        dump_path = os.environ.get("CLAWD_DASH_PERF_DUMP")
+        if dump_path:
+            report = self.perf_report()
+            report.pop("latency", None)
+            try:
+                default_instrumentation.dump(Path(dump_path), report)
+            except OSError:
+                pass
+
+    def _probe_loop_lag(self) -> None:
+        now = time.perf_counter()
+        default_instrumentation.record("ui loop lag", max(0.0, now - self._loop_tick - LOOP_PROBE_INTERVAL))
+        self._loop_tick = now
+
+    def _first_paint(self) -> None:
+        default_instrumentation.record("startup first paint", time.perf_counter() - self._created)
+        self._mark("first paint")
+
+    def _record_frame(self, updated: float) -> None:
+        default_instrumentation.record("ui frame", time.perf_counter() - updated)
+
+    def _mark(self, label: str) -> None:
+        if self.startup_profile is not None:
+            self.startup_profile.mark(label)
+
+    def perf_report(self) -> Dict[str, Any]:
+        executor = default_executor.stats()
+        return {
+            "latency": default_instrumentation.snapshot(),
+            "executor": dict(asdict(executor), avg_latency=executor.avg_latency),
+            "scheduler": {key: asdict(stats) for key, stats in self.scheduler.stats().items()},
+            "render": {panel.id: asdict(panel.render_stats) for panel in self._panels()},
+            "alerts": {name: dict(asdict(stats), mean=stats.mean) for name, stats in self.alerts.stats().items()},
+            "recording": {"failures": dict(self._record_failures), "last_error": self._record_error},
+        }
+
+    def _on_source_push(self, panel_id: str) -> None:
+        try:
+            self.call_from_thread(self._refresh_by_id, panel_id)
+        except RuntimeError:
+            pass
+
+    def _refresh_by_id(self, panel_id: str) -> None:
+        for panel in self._panels():
+            if panel.id == panel_id and not self.refresh_panel(panel):
+                self._refresh_pending.add(panel_id)
+
+    async def on_event(self, event: events.Event) -> None:
+        if isinstance(event, events.InputEvent):
+            self.scheduler.note_activity()
+        await super().on_event(event)
+
+    def on_app_blur(self) -> None:
+        self.scheduler.set_visible(False)
+
+    def on_app_focus(self) -> None:
+        self.scheduler.set_visible(True)
+
+    def on_dashboard_panel_refresh_requested(self, event: DashboardPanel.RefreshRequested) -> None:
+        self._request_source_refresh([event.panel])
+        self.refresh_panel(event.panel)
+
+    def action_refresh(self) -> None:
+        self._request_source_refresh(self._panels())
+        self.refresh_all()
+
+    def action_search_memory(self) -> None:
+        self.push_screen(MemorySearchScreen())
+
+    def action_sessions(self) -> None:
+        self.push_screen(SessionsScreen(self.query_one(SessionPanel)))
+
+    def action_jobs(self) -> None:
+        if isinstance(self.screen, JobsScreen):
+            self.pop_screen()
+        else:
+            self.push_screen(JobsScreen(self.jobs))
+
+    def _on_job_changed(self, run: JobRun) -> None:
+        if threading.get_ident() == self._ui_thread:
+            if self.is_running:
+                self._show_job_status(run)
+            return
+        try:
+            self.call_from_thread(self._show_job_status, run)
+        except RuntimeError:
+            pass
+
+    def _show_job_status(self, run: JobRun) -> None:
+        if run.state == "running":
+            message = f"{run.name} running…"
+        elif run.finished:
+            message = f"{run.name} {run.state}"
+            if run.exit_code is not None:
+                message += f" (exit {run.exit_code})"
+        else:
+            message = f"{run.name} {run.state}…"
+        active = self.jobs.active()
+        if active:
+            message += f" · {active} active"
+        for panel in self.query(QuickActionsPanel):
+            panel.set_status(message)
+
+    def action_performance(self) -> None:
+        if isinstance(self.screen, PerformanceScreen):
+            self.pop_screen()
+        else:
+            self.push_screen(PerformanceScreen())
+
+    def action_cron_timeline(self) -> None:
+        self.push_screen(CronTimelineScreen(self.query_one(CronJobsPanel).jobs_snapshot()))
+
+    def _panels(self) -> List[DashboardPanel]:
+        return list(self.query(DashboardPanel))
+
+    def _run_due_refreshes(self) -> None:
+        reason = self.scheduler.pause_reason
+        self.sub_title = f"paused ({reason})" if reason else ""
+        due = set(self.scheduler.due())
+        for panel in self._panels():
+            panel.update_age()
+            if panel.id in due:
+                self.refresh_panel(panel)
+
+    def _request_source_refresh(self, panels: List[DashboardPanel]) -> None:
+        sources = [source for panel in panels for source in panel.data_sources()]
+        if sources:
+            self.run_worker(
+                partial(_request_refresh, sources), thread=True, name="request-refresh", exit_on_error=False
+            )
+
+    def refresh_all(self) -> None:
+        for panel in self._panels():
+            self.refresh_panel(panel)
+
+    def refresh_panel(self, panel: DashboardPanel) -> bool:
+        key = panel.id
+        if key in self._refresh_started:
+            return False
+        self._refresh_started[key] = time.perf_counter()
+        self.scheduler.start(key)
+        self.run_worker(
+            partial(self._collect_panel, panel),
+            thread=True,
+            name=f"refresh-{key}",
+            group="refresh",
+            exit_on_error=False,
+        )
+        return True
+
+    def _collect_panel(self, panel: DashboardPanel) -> None:
+        try:
+            with default_instrumentation.timer(f"collect {panel.id}"):
+                data = panel.collect_data()
+            with default_instrumentation.timer(f"build {panel.id}"):
+                model = panel.build_model(data)
+        except Exception as exc:
+            self.call_from_thread(self._finish_refresh, panel, None, None, exc)
+            return
+        self._record_panel_data(panel, data)
+        self.call_from_thread(self._finish_refresh, panel, data, model, None)
+
+    def _record_panel_data(self, panel: DashboardPanel, data: object) -> None:
+        try:
+            metrics = panel.metrics(data)
+            self.metrics.record(metrics)
+            alerts = self.alerts.observe(metrics)
+            if alerts:
+                self.call_from_thread(self._raise_alerts, alerts)
+            if panel.CACHE_DATA and panel.data_ok(data):
+                self.cache.store(panel.id, data)
+        except Exception as exc:
+            self._record_failures[panel.id] = self._record_failures.get(panel.id, 0) + 1
+            self._record_error = f"{panel.id}: {exc}"
+
+    def _raise_alerts(self, events: List[AlertEvent]) -> None:
+        for event in events:
+            if self.alert_hook is not None:
+                self.alert_hook.fire(event)
+            severity = "information" if event.state in ("resolved", "resumed") else "warning"
+            timeout = 30 if event.state == "firing" else None
+            self.notify(event.message, title=f"Alert: {event.rule}", severity=severity, timeout=timeout, markup=False)
+
+    def _finish_refresh(
+        self,
+        panel: DashboardPanel,
+        data: object,
+        model: object,
+        error: Optional[BaseException],
+    ) -> None:
+        started = self._refresh_started.pop(panel.id, None)
+        ok = error is None and panel.data_ok(data)
+        if started is not None:
+            self.scheduler.record(panel.id, time.perf_counter() - started, ok)
+        if not panel.is_mounted:
+            return
+        if panel.id in self._refresh_pending:
+            self._refresh_pending.discard(panel.id)
+            self.call_later(self.refresh_panel, panel)
+        if error is not None:
+            if not (panel.CACHE_DATA and panel.mark_stale("refresh failed")):
+                panel.show_error("Refresh failed", str(error))
+        elif ok:
+            panel.show_fresh(model)
+        elif not (panel.CACHE_DATA and isinstance(model, ErrorModel) and panel.mark_stale(model.title)):
+            panel.show(model)
+        self.call_after_refresh(self._record_frame, time.perf_counter())
+        if self.startup_profile is not None:
+            self._mark(f"{panel.id} ready")
+            if all(candidate.loaded for candidate in self._panels()):
+                self._mark("all panels ready")
+                self.call_after_refresh(self._finish_startup_profile)
+
+    def _finish_startup_profile(self) -> None:
+        self._mark("all panels painted")
+        self.exit()
+
+    def set_action_status(self, message: str) -> None:
+        actions = self.query_one(QuickActionsPanel)
+        actions.set_status(message)
+
+    def on_button_pressed(self, event: Button.Pressed) -> None:
+        button_id: Optional[str] = event.button.id
+        if button_id == "action-refresh":
+            self._request_source_refresh(self._panels())
+            self.refresh_all()
+            self.set_action_status("Refreshing dashboard...")
+        elif button_id == "action-email":
+            run = self.jobs.submit("Check Emails", EMAIL_CHECK_COMMAND)
+            self.push_screen(JobLogScreen(self.jobs, run))
+        elif button_id == "action-canvas":
+            self.set_action_status("Canvas assignments coming soon.")
+            self.notify("Canvas assignments integration is coming soon.")
+
+
+def _request_refresh(sources: List[DataSource]) -> None:
+    for source in sources:
+        source.request_refresh()
+
+
+def _open_panel_cache() -> PanelCache:
+    try:
+        return PanelCache(state_dir() / "cache")
+    except OSError:
+        return PanelCache()
+
+
+def _open_metrics_store() -> TimeSeriesStore:
+    try:
+        return TimeSeriesStore(state_dir() / "metrics")
+    except OSError:
+        return TimeSeriesStore()
@@ -1,15 +1,25 @@
 """Panel widgets for clawd-dash."""
 
-from .session import SessionPanel
-from .crons import CronJobsPanel
-from .memory import MemoryPanel
+from .base import DashboardPanel
+from .session import SessionPanel, SessionsScreen
+from .crons import CronJobsPanel, CronTimelineScreen
+from .memory import MemoryPanel, MemorySearchScreen
+from .perf import PerformanceScreen
+from .jobs import JobLogScreen, JobsScreen
 from .health import SystemHealthPanel
 from .actions import QuickActionsPanel
 
 __all__ = [
+    "DashboardPanel",
     "SessionPanel",
+    "SessionsScreen",
     "CronJobsPanel",
+    "CronTimelineScreen",
     "MemoryPanel",
+    "MemorySearchScreen",
+    "PerformanceScreen",
+    "JobLogScreen",
+    "JobsScreen",
     "SystemHealthPanel",
     "QuickActionsPanel",
 ]
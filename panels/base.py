@@ -0,0 +1,164 @@
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence
+
+from rich.markup import escape
+from textual.app import ComposeResult
+from textual.containers import Vertical
+from textual.message import Message
+from textual.widgets import Static
+
+from core.datasource import DataSource
+from core.instrumentation import default_instrumentation
+from core.scheduler import RefreshPolicy
+
+
+@dataclass
+class RenderStats:
+    renders: int = 0
+    skipped: int = 0
+    rows_updated: int = 0
+    rows_unchanged: int = 0
+
+
+@dataclass(frozen=True)
+class ErrorModel:
+    title: str
+    message: str
+
+
+def format_age(seconds: Optional[float]) -> str:
+    if seconds is None:
+        return "-"
+    if seconds < 60:
+        return f"{seconds:.0f}s"
+    if seconds < 3600:
+        return f"{seconds / 60:.0f}m"
+    if seconds < 86400:
+        return f"{seconds / 3600:.1f}h"
+    return f"{seconds / 86400:.1f}d"
+
+
+class DashboardPanel(Vertical):
+    REFRESH_POLICY = RefreshPolicy(interval=30.0)
+    CACHE_DATA = False
+    SKELETON_LINES: Sequence[str] = ("[#5c6370]Loading…[/]",)
+
+    class RefreshRequested(Message):
+        def __init__(self, panel: "DashboardPanel") -> None:
+            super().__init__()
+            self.panel = panel
+
+    def __init__(self, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self.render_stats = RenderStats()
+        self._model: Any = None
+        self._lines: List[str] = []
+        self._rows: List[Static] = []
+        self.data_time: Optional[float] = None
+        self.stale_reason: Optional[str] = None
+        self._stale = False
+
+    def compose(self) -> ComposeResult:
+        self._lines = list(self.SKELETON_LINES)
+        self._rows = [Static(line, classes="panel-row") for line in self._lines]
+        yield from self._rows
+
+    @property
+    def loaded(self) -> bool:
+        return self._model is not None
+
+    def refresh_panel(self) -> None:
+        self.show(self.build_model(self.collect_data()))
+
+    def collect_data(self) -> Any:
+        raise NotImplementedError
+
+    def build_model(self, data: Any) -> Any:
+        return data
+
+    def build_cached_model(self, data: Any) -> Any:
+        return self.build_model(data)
+
+    def render_model(self, model: Any) -> List[str]:
+        raise NotImplementedError
+
+    def data_ok(self, data: Any) -> bool:
+        return True
+
+    def data_sources(self) -> List[DataSource]:
+        return []
+
+    def metrics(self, data: Any) -> Dict[str, Optional[float]]:
+        return {}
+
+    def show(self, model: Any) -> bool:
+        if self._lines and model == self._model:
+            self.render_stats.skipped += 1
+            return False
+        self._model = model
+        self.render_stats.renders += 1
+        with default_instrumentation.timer(f"render {self.id}"):
+            if isinstance(model, ErrorModel):
+                lines = [f"[bold #ff6b6b]{model.title}[/]", escape(model.message)]
+            else:
+                lines = self.render_model(model)
+            self._set_lines(lines)
+        return True
+
+    def show_error(self, title: str, message: str) -> bool:
+        return self.show(ErrorModel(title, message))
+
+    def show_fresh(self, model: Any) -> bool:
+        self.data_time = time.time()
+        self._stale = False
+        self.stale_reason = None
+        self.update_age()
+        return self.show(model)
+
+    def show_cached(self, model: Any, saved_at: float) -> bool:
+        if isinstance(self._model, ErrorModel):
+            self.stale_reason = self._model.title
+        self.data_time = saved_at
+        self._stale = True
+        self.update_age()
+        return self.show(model)
+
+    def mark_stale(self, reason: str) -> bool:
+        if self.data_time is None:
+            return False
+        self._stale = True
+        self.stale_reason = reason
+        self.update_age()
+        return True
+
+    def update_age(self) -> None:
+        if not self._stale or self.data_time is None:
+            self.border_subtitle = ""
+            return
+        subtitle = f"cached · {format_age(max(0.0, time.time() - self.data_time))} old"
+        if self.stale_reason:
+            subtitle += f" · {escape(self.stale_reason)}"
+        self.border_subtitle = subtitle
+
+    @property
+    def text(self) -> str:
+        return "\n".join(self._lines)
+
+    def _set_lines(self, lines: Sequence[str]) -> None:
+        rows = self._rows
+        for index, line in enumerate(lines):
+            if index < len(rows):
+                if self._lines[index] == line:
+                    self.render_stats.rows_unchanged += 1
+                    continue
+                rows[index].update(line)
+            else:
+                row = Static(line, classes="panel-row")
+                rows.append(row)
+                self.mount(row)
+            self.render_stats.rows_updated += 1
+        for row in rows[len(lines) :]:
+            row.remove()
+        del rows[len(lines) :]
+        self._lines = list(lines)
@@ -1,157 +1,198 @@
-import json
-import subprocess
-from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional, Tuple
-
+from __future__ import annotations
+
+import heapq
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+
+from rich.markup import escape
+from textual.app import ComposeResult
+from textual.containers import Vertical, VerticalScroll
+from textual.screen import ModalScreen
 from textual.widgets import Static
 
-CRON_COMMAND = ["moltbot", "cron", "list", "--json"]
+from core.cronjobs import (
+    advance_jobs,
+    cron_source,
+    format_countdown,
+    load_jobs,
+    parse_jobs,
+)
+from core.datasource import DataSource
+from core.scheduler import RefreshPolicy
 
+from .base import DashboardPanel, ErrorModel
+
+if TYPE_CHECKING:
+    from core.crontimeline import Timeline
+
+HEAT_CHARS = " ·░▒▓█"
+
+
+@dataclass(frozen=True)
+class CronJobsLoaded:
+    jobs: Tuple[Dict[str, Any], ...]
+
+
+@dataclass(frozen=True)
+class CountdownModel:
+    countdown: str
+    jobs: Tuple[Tuple[str, str], ...]
+
+
+def _next_key(job: Dict[str, Any]) -> datetime:
+    return job["next_dt"] or datetime.max.replace(tzinfo=timezone.utc)
+
+
+class CronJobsPanel(DashboardPanel):
+    REFRESH_POLICY = RefreshPolicy(interval=300.0, cost=1.0, max_interval=900.0)
+    CACHE_DATA = True
 
-def _run_command(command: list[str]) -> Optional[str]:
-    try:
-        result = subprocess.run(
-            command,
-            capture_output=True,
-            text=True,
-            check=True,
-            timeout=8,
-        )
-    except (subprocess.SubprocessError, FileNotFoundError):
-        return None
-    return result.stdout.strip() or None
-
-
-def _load_jobs() -> Tuple[List[Dict[str, Any]], Optional[str]]:
-    output = _run_command(CRON_COMMAND)
-    if not output:
-        return [], "moltbot cron list --json failed"
-    try:
-        data = json.loads(output)
-    except json.JSONDecodeError:
-        return [], "invalid JSON from moltbot cron list"
-    if isinstance(data, dict) and "jobs" in data:
-        jobs = data["jobs"]
-    else:
-        jobs = data
-    if not isinstance(jobs, list):
-        return [], "unexpected cron payload"
-    return jobs, None
-
-
-def _parse_datetime(value: str) -> Optional[datetime]:
-    if not value:
-        return None
-    try:
-        if value.endswith("Z"):
-            return datetime.fromisoformat(value.replace("Z", "+00:00"))
-        return datetime.fromisoformat(value)
-    except ValueError:
-        return None
-
-
-def _parse_epoch(value: Any) -> Optional[datetime]:
-    if value is None:
-        return None
-    if isinstance(value, str) and value.isdigit():
-        value = int(value)
-    if isinstance(value, (int, float)):
-        timestamp = float(value)
-        if timestamp > 1e12:
-            timestamp /= 1000.0
-        return datetime.fromtimestamp(timestamp, tz=timezone.utc)
-    if isinstance(value, str):
-        return _parse_datetime(value)
-    return None
-
-
-def _extract_next_run(job: Dict[str, Any]) -> Optional[datetime]:
-    state = job.get("state") or {}
-    for key in ("nextRunAtMs", "next_run_at_ms", "nextRunAt", "next_run_at", "next"):
-        if key in state:
-            return _parse_epoch(state[key])
-    schedule = job.get("schedule") or {}
-    if isinstance(schedule, dict):
-        if schedule.get("kind") == "at":
-            for key in ("atMs", "at", "at_ms"):
-                if key in schedule:
-                    return _parse_epoch(schedule[key])
-        for key in ("nextRunAtMs", "nextRunAt", "next"):
-            if key in schedule:
-                return _parse_epoch(schedule[key])
-    for key in ("nextRunAtMs", "nextRunAt", "next_run", "next"):
-        if key in job:
-            return _parse_epoch(job[key])
-    return None
-
-
-def _format_countdown(target: Optional[datetime]) -> str:
-    if not target:
-        return "unknown"
-    now = datetime.now(timezone.utc)
-    if target.tzinfo is None:
-        target = target.replace(tzinfo=timezone.utc)
-    delta = int((target - now).total_seconds())
-    if delta <= 0:
-        return "due"
-    minutes, seconds = divmod(delta, 60)
-    hours, minutes = divmod(minutes, 60)
-    days, hours = divmod(hours, 24)
-    if days:
-        return f"{days}d {hours}h"
-    if hours:
-        return f"{hours}h {minutes}m"
-    if minutes:
-        return f"{minutes}m {seconds}s"
-    return f"{seconds}s"
-
-
-class CronJobsPanel(Static):
     def __init__(self, **kwargs: Any) -> None:
         super().__init__(**kwargs)
         self.border_title = "Cron Jobs"
+        self._jobs: List[Dict[str, Any]] = []
+        self._loaded = False
 
-    def refresh_panel(self) -> None:
-        jobs, error = _load_jobs()
-        if error:
-            self.update(f"[bold #ff6b6b]Cron load failed[/]\n{error}")
+    def on_mount(self) -> None:
+        self.set_interval(1, self._tick)
+
+    def _tick(self) -> None:
+        if not self._loaded:
             return
-        parsed: List[Dict[str, Any]] = []
-        for job in jobs:
-            name = str(job.get("name") or job.get("id") or "job")
-            schedule = job.get("schedule") or job.get("cron")
-            schedule_text = "-"
-            if isinstance(schedule, dict):
-                if schedule.get("kind") == "cron":
-                    schedule_text = str(schedule.get("expr") or schedule.get("cron") or "-")
-                elif schedule.get("kind") == "at":
-                    schedule_text = "at"
-            elif schedule:
-                schedule_text = str(schedule)
-            next_dt = _extract_next_run(job)
-            parsed.append(
-                {
-                    "name": name,
-                    "schedule": schedule_text,
-                    "next_dt": next_dt,
-                }
-            )
+        if advance_jobs(self._jobs, datetime.now(timezone.utc)):
+            self.post_message(self.RefreshRequested(self))
+        super().show(self._countdown_model())
+
+    def collect_data(self) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        return load_jobs()
+
+    def data_ok(self, data: Tuple[List[Dict[str, Any]], Optional[str]]) -> bool:
+        return data[1] is None
 
-        parsed.sort(key=lambda item: item["next_dt"] or datetime.max.replace(tzinfo=timezone.utc))
-        next_job = parsed[0] if parsed else None
-        countdown = _format_countdown(next_job["next_dt"] if next_job else None)
+    def data_sources(self) -> List[DataSource]:
+        return [cron_source]
 
+    def metrics(self, data: Tuple[List[Dict[str, Any]], Optional[str]]) -> Dict[str, Optional[float]]:
+        jobs, error = data
+        if error:
+            return {}
+        parsed = parse_jobs(jobs, datetime.now(timezone.utc))
+        lateness = max((job["lateness"] for job in parsed if job["lateness"] is not None), default=0.0)
+        return {"crons.jobs": float(len(jobs)), "crons.max_lateness": lateness}
+
+    def build_model(self, data: Tuple[List[Dict[str, Any]], Optional[str]]) -> Any:
+        jobs, error = data
+        if error:
+            return ErrorModel("Cron load failed", error)
+        return CronJobsLoaded(tuple(parse_jobs(jobs, datetime.now(timezone.utc))))
+
+    def show(self, model: Any) -> bool:
+        if isinstance(model, CronJobsLoaded):
+            self._jobs = list(model.jobs)
+            self._loaded = True
+            model = self._countdown_model()
+        else:
+            self._loaded = False
+        return super().show(model)
+
+    def render_model(self, model: CountdownModel) -> List[str]:
         lines = [
-            f"[bold #ffb3c1]Next in:[/] {countdown}",
+            f"[bold #ffb3c1]Next in:[/] {model.countdown}",
             "",
         ]
-        for job in parsed[:5]:
-            per_job = _format_countdown(job["next_dt"])
+        for name, per_job in model.jobs:
             lines.append(
-                f"[bold #c8f7c5]{job['name']}[/] · {per_job}"
+                f"[bold #c8f7c5]{name}[/] · {per_job}"
             )
 
         if len(lines) <= 2:
             lines.append("No upcoming jobs found.")
 
-        self.update("\n".join(lines))
+        return lines
+
+    def jobs_snapshot(self) -> List[Dict[str, Any]]:
+        return [dict(job) for job in self._jobs]
+
+    def _countdown_model(self) -> CountdownModel:
+        upcoming = heapq.nsmallest(5, self._jobs, key=_next_key)
+        next_job = upcoming[0] if upcoming else None
+        return CountdownModel(
+            countdown=format_countdown(next_job["next_dt"] if next_job else None),
+            jobs=tuple((job["name"], _job_countdown(job)) for job in upcoming),
+        )
+
+
+def _job_countdown(job: Dict[str, Any]) -> str:
+    if job.get("error"):
+        return f"[#ff6b6b]{escape(job['error'])}[/]"
+    return format_countdown(job["next_dt"])
+
+
+def _heat_cell(count: int, peak: int, hot: int) -> str:
+    if not count:
+        return HEAT_CHARS[0]
+    level = 1 + (count - 1) * (len(HEAT_CHARS) - 2) // max(1, peak - 1) if peak > 1 else len(HEAT_CHARS) - 1
+    char = HEAT_CHARS[min(level, len(HEAT_CHARS) - 1)]
+    if hot and count >= hot:
+        return f"[bold #ff6b6b]{char}[/]"
+    return char
+
+
+def _render_timeline(timeline: Timeline, elapsed: float) -> str:
+    peak = timeline.peak
+    hot = min((spot.count for spot in timeline.hotspots), default=0)
+    lines = [
+        f"[bold #ffb3c1]{timeline.total}[/] fires from [bold]{timeline.jobs}[/] jobs "
+        f"({timeline.schedules} distinct schedules) · peak {peak}/min · built in {elapsed:.0f} ms",
+        "",
+        "        " + "".join(str(minute // 10) if minute % 10 == 0 else " " for minute in range(60)),
+    ]
+    for row in range(0, timeline.minutes, 60):
+        label = (timeline.start + timedelta(minutes=row)).astimezone().strftime("%H:%M")
+        cells = "".join(_heat_cell(count, peak, hot) for count in timeline.counts[row : row + 60])
+        lines.append(f"[#94a3b8]{label}[/] │{cells}")
+    lines.append("")
+    if timeline.hotspots:
+        lines.append("[bold #ffb3c1]Collision hot spots[/]")
+        for spot in sorted(timeline.hotspots, key=lambda item: -item.count):
+            names = ", ".join(spot.jobs[:6])
+            extra = f" (+{len(spot.jobs) - 6})" if len(spot.jobs) > 6 else ""
+            when = spot.start.astimezone().strftime("%H:%M")
+            lines.append(f"[bold #ff6b6b]{when}[/] · {spot.count} fires · {escape(names)}{extra}")
+    else:
+        lines.append("No collisions in the next 24 hours.")
+    return "\n".join(lines)
+
+
+class CronTimelineScreen(ModalScreen[None]):
+    BINDINGS = [("escape", "close", "Close"), ("t", "close", "Close")]
+
+    def __init__(self, jobs: List[Dict[str, Any]]) -> None:
+        super().__init__()
+        self._jobs = jobs
+
+    def compose(self) -> ComposeResult:
+        with Vertical(id="cron-timeline"):
+            with VerticalScroll():
+                yield Static("Building timeline…", id="cron-timeline-body")
+
+    def on_mount(self) -> None:
+        self.query_one("#cron-timeline", Vertical).border_title = "Cron Timeline · next 24h"
+        self.run_worker(self._build, thread=True, group="cron-timeline", exit_on_error=False)
+
+    def action_close(self) -> None:
+        self.app.pop_screen()
+
+    def _build(self) -> None:
+        from core.crontimeline import build_timeline
+
+        started = time.perf_counter()
+        timeline = build_timeline(self._jobs)
+        elapsed = (time.perf_counter() - started) * 1000
+        self.app.call_from_thread(self._show, _render_timeline(timeline, elapsed))
+
+    def _show(self, markup: str) -> None:
+        if self.is_mounted:
+            self.query_one("#cron-timeline-body", Static).update(markup)
@@ -1,7 +1,25 @@
-from typing import Any
+from __future__ import annotations
 
-import psutil
-from textual.widgets import Static
+import time
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Tuple
+
+from core.scheduler import RefreshPolicy
+
+from .base import DashboardPanel
+
+if TYPE_CHECKING:
+    from core.iostats import IOStats
+    from core.procmon import ProcessStats
+    from core.sampler import SystemSnapshot
+    from core.timeseries import TimeSeriesStore
+
+SPARK_CHARS = "▁▂▃▄▅▆▇█"
+SPARK_WIDTH = 30
+SUMMARY_SECONDS = 300.0
+DAILY_SECONDS = 86400.0
+DAILY_REFRESH_SECONDS = 60.0
+MOUNT_LINES = 4
 
 
 def _format_bytes(value: float) -> str:
@@ -14,19 +32,157 @@ def _format_bytes(value: float) -> str:
     return f"{size:.1f} EB"
 
 
-class SystemHealthPanel(Static):
-    def __init__(self, **kwargs: Any) -> None:
+def _sparkline(values: Sequence[float], maximum: float = 100.0) -> str:
+    if not values:
+        return ""
+    top = len(SPARK_CHARS) - 1
+    chars = []
+    for value in values:
+        level = int(round(min(max(value, 0.0), maximum) / maximum * top))
+        chars.append(SPARK_CHARS[level])
+    return "".join(chars)
+
+
+def _format_summary(summary: Optional[Tuple[float, float, float]], label: str = "5m") -> str:
+    if summary is None:
+        return ""
+    low, mean, high = summary
+    return f"[#94a3b8]{label} {low:.0f}/{mean:.0f}/{high:.0f}%[/]"
+
+
+def _format_rate(value: Optional[float]) -> str:
+    return "…" if value is None else f"{_format_bytes(value)}/s"
+
+
+@dataclass(frozen=True)
+class HealthView:
+    snapshot: Optional[SystemSnapshot]
+    series: Dict[str, Tuple[float, ...]]
+    summaries: Dict[str, Optional[Tuple[float, float, float]]]
+    processes: Optional[ProcessStats] = None
+    io: Optional[IOStats] = None
+    daily: Dict[str, Optional[Tuple[float, float, float]]] = field(default_factory=dict)
+
+
+def _sample_health(daily: Dict[str, Optional[Tuple[float, float, float]]]) -> HealthView:
+    from core.sampler import default_sampler
+
+    sampler = default_sampler()
+    return HealthView(
+        snapshot=sampler.latest(),
+        series={name: tuple(sampler.series(name, SPARK_WIDTH)) for name in ("cpu", "memory")},
+        summaries={name: sampler.summary(name, SUMMARY_SECONDS) for name in ("cpu", "memory")},
+        processes=sampler.processes(),
+        io=sampler.io(),
+        daily=daily,
+    )
+
+
+def _format_processes(stats: Optional[ProcessStats]) -> str:
+    if stats is None:
+        return "[#94a3b8]…[/]"
+    if not stats.processes:
+        return "[#94a3b8]not running[/]"
+    return (
+        f"{stats.processes} procs ({stats.children} children) · CPU {stats.cpu_percent:.1f}% · "
+        f"RSS {_format_bytes(stats.rss)} · {stats.fds} fds · {stats.threads} threads"
+    )
+
+
+def _disk_lines(sample: SystemSnapshot, io: Optional[IOStats]) -> List[str]:
+    if io is None or not io.mounts:
+        return [
+            f"[bold #ffd43b]Disk:[/] {sample.disk_percent:.1f}% ({_format_bytes(sample.disk_used)} / {_format_bytes(sample.disk_total)})"
+        ]
+    lines = [
+        f"[bold #ffd43b]Disk {mount.mountpoint}:[/] {mount.percent:.1f}% ({_format_bytes(mount.used)} / {_format_bytes(mount.total)})"
+        for mount in io.mounts[:MOUNT_LINES]
+    ]
+    if len(io.mounts) > MOUNT_LINES:
+        lines.append(f"[#94a3b8]  +{len(io.mounts) - MOUNT_LINES} more mounts[/]")
+    return lines
+
+
+def _format_io(io: Optional[IOStats]) -> str:
+    if io is None or io.read_rate is None:
+        return "[#94a3b8]…[/]"
+    return (
+        f"read {_format_rate(io.read_rate)} · write {_format_rate(io.write_rate)} · "
+        f"{(io.read_iops or 0.0):.0f}/{(io.write_iops or 0.0):.0f} IOPS"
+    )
+
+
+def _format_network(io: Optional[IOStats]) -> str:
+    if io is None or io.rx_rate is None:
+        return "[#94a3b8]…[/]"
+    return f"rx {_format_rate(io.rx_rate)} · tx {_format_rate(io.tx_rate)}"
+
+
+class SystemHealthPanel(DashboardPanel):
+    REFRESH_POLICY = RefreshPolicy(interval=1.0, cost=0.01, max_interval=30.0)
+    SKELETON_LINES = (
+        "[bold #8ce99a]CPU:[/] [#5c6370]…[/]",
+        "[bold #8ce99a]Cores:[/] [#5c6370]…[/]",
+        "[bold #74c0fc]Memory:[/] [#5c6370]…[/]",
+        "[bold #b197fc]Swap:[/] [#5c6370]…[/]",
+        "[bold #ffd43b]Disk:[/] [#5c6370]…[/]",
+        "[bold #ffd43b]Disk I/O:[/] [#5c6370]…[/]",
+        "[bold #63e6be]Network:[/] [#5c6370]…[/]",
+        "[bold #ff8787]Moltbot:[/] [#5c6370]…[/]",
+    )
+
+    def __init__(self, metrics: Optional[TimeSeriesStore] = None, **kwargs: Any) -> None:
         super().__init__(**kwargs)
         self.border_title = "System Health"
+        self._metrics = metrics
+        self._daily: Dict[str, Optional[Tuple[float, float, float]]] = {}
+        self._daily_at = 0.0
+
+    def collect_data(self) -> HealthView:
+        now = time.time()
+        if self._metrics is not None and now - self._daily_at >= DAILY_REFRESH_SECONDS:
+            self._daily = {
+                name: self._metrics.series(f"health.{name}").summary(now - DAILY_SECONDS, now)
+                for name in ("cpu", "memory")
+            }
+            self._daily_at = now
+        return _sample_health(self._daily)
 
-    def refresh_panel(self) -> None:
-        cpu_percent = psutil.cpu_percent(interval=0.1)
-        memory = psutil.virtual_memory()
-        disk = psutil.disk_usage("/")
+    def metrics(self, view: HealthView) -> Dict[str, Optional[float]]:
+        sample = view.snapshot
+        if sample is None:
+            return {}
+        processes = view.processes
+        io = view.io
+        iops = None
+        if io is not None and io.read_iops is not None and io.write_iops is not None:
+            iops = io.read_iops + io.write_iops
+        return {
+            "health.cpu": sample.cpu_percent,
+            "health.memory": sample.memory_percent,
+            "health.swap": sample.swap_percent,
+            "health.disk": sample.disk_percent,
+            "health.moltbot_cpu": processes.cpu_percent if processes else None,
+            "health.moltbot_rss": float(processes.rss) if processes else None,
+            "health.disk_read": io.read_rate if io else None,
+            "health.disk_write": io.write_rate if io else None,
+            "health.disk_iops": iops,
+            "health.net_rx": io.rx_rate if io else None,
+            "health.net_tx": io.tx_rate if io else None,
+        }
 
+    def render_model(self, view: HealthView) -> List[str]:
+        sample = view.snapshot
+        if sample is None:
+            return ["[#94a3b8]Sampling…[/]"]
         lines = [
-            f"[bold #8ce99a]CPU:[/] {cpu_percent:.1f}%",
-            f"[bold #74c0fc]Memory:[/] {memory.percent:.1f}% ({_format_bytes(memory.used)} / {_format_bytes(memory.total)})",
-            f"[bold #ffd43b]Disk:[/] {disk.percent:.1f}% ({_format_bytes(disk.used)} / {_format_bytes(disk.total)})",
+            f"[bold #8ce99a]CPU:[/] {sample.cpu_percent:.1f}% [#8ce99a]{_sparkline(view.series['cpu'])}[/] {_format_summary(view.summaries['cpu'])} {_format_summary(view.daily.get('cpu'), '24h')}",
+            f"[bold #8ce99a]Cores:[/] [#8ce99a]{_sparkline(sample.per_cpu)}[/]",
+            f"[bold #74c0fc]Memory:[/] {sample.memory_percent:.1f}% ({_format_bytes(sample.memory_used)} / {_format_bytes(sample.memory_total)}) [#74c0fc]{_sparkline(view.series['memory'])}[/] {_format_summary(view.daily.get('memory'), '24h')}",
+            f"[bold #b197fc]Swap:[/] {sample.swap_percent:.1f}% ({_format_bytes(sample.swap_used)} / {_format_bytes(sample.swap_total)})",
         ]
-        self.update("\n".join(lines))
+        lines.extend(_disk_lines(sample, view.io))
+        lines.append(f"[bold #ffd43b]Disk I/O:[/] {_format_io(view.io)}")
+        lines.append(f"[bold #63e6be]Network:[/] {_format_network(view.io)}")
+        lines.append(f"[bold #ff8787]Moltbot:[/] {_format_processes(view.processes)}")
+        return lines
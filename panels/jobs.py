@@ -0,0 +1,191 @@
+import time
+from typing import Dict, List, Optional
+
+from rich.markup import escape
+from rich.segment import Segment
+from textual.app import ComposeResult
+from textual.containers import Vertical
+from textual.geometry import Size
+from textual.screen import ModalScreen
+from textual.scroll_view import ScrollView
+from textual.strip import Strip
+from textual.widgets import OptionList, Static
+from textual.widgets.option_list import Option
+
+from core.jobs import JobRun, JobRunner
+from core.runlog import RunLog
+
+POLL_SECONDS = 0.25
+
+STATE_COLORS = {
+    "queued": "#94a3b8",
+    "running": "#a5d6ff",
+    "cancelling": "#ffd43b",
+    "succeeded": "#8ce99a",
+    "failed": "#ff6b6b",
+    "cancelled": "#ffd43b",
+    "interrupted": "#ffd43b",
+}
+
+_CONTROL = {code: None for code in (*range(32), 127)}
+
+
+def _format_seconds(seconds: Optional[float]) -> str:
+    if seconds is None:
+        return "-"
+    if seconds < 60:
+        return f"{seconds:.1f}s"
+    minutes, seconds = divmod(int(seconds), 60)
+    return f"{minutes}m {seconds}s"
+
+
+def format_run(run: JobRun) -> str:
+    color = STATE_COLORS.get(run.state, "#f1f3f5")
+    started = time.strftime("%m-%d %H:%M:%S", time.localtime(run.started_at or run.queued_at))
+    exit_code = "-" if run.exit_code is None else str(run.exit_code)
+    return (
+        f"[{color}]{run.state:<11}[/] {escape(run.name):<16} {started}  "
+        f"{_format_seconds(run.duration):>8}  exit {exit_code:>3}  {run.lines} lines"
+    )
+
+
+class LogView(ScrollView):
+    def __init__(self, log: Optional[RunLog], **kwargs: object) -> None:
+        super().__init__(**kwargs)
+        self._log = log
+        self._count = 0
+
+    def sync(self) -> None:
+        if self._log is None:
+            return
+        count = self._log.refresh()
+        if count == self._count:
+            return
+        follow = self.scroll_y >= self.max_scroll_y
+        self._count = count
+        self.virtual_size = Size(self.size.width, count)
+        if follow:
+            self.scroll_end(animate=False)
+        self.refresh()
+
+    def render_line(self, y: int) -> Strip:
+        width = self.size.width
+        style = self.rich_style
+        index = int(self.scroll_y) + y
+        if self._log is None or index >= self._count:
+            return Strip.blank(width, style)
+        text = self._log.line(index).expandtabs(4).translate(_CONTROL)
+        return Strip([Segment(text, style)]).crop_extend(0, width, style)
+
+
+class JobLogScreen(ModalScreen[None]):
+    BINDINGS = [
+        ("escape", "close", "Close"),
+        ("c", "cancel", "Cancel run"),
+    ]
+
+    def __init__(self, runner: JobRunner, run: JobRun) -> None:
+        super().__init__()
+        self._runner = runner
+        self._run = run
+        self._log = runner.open_log(run)
+
+    def compose(self) -> ComposeResult:
+        with Vertical(id="job-log"):
+            yield Static("", id="job-log-title")
+            yield LogView(self._log, id="job-log-body")
+            yield Static("[#94a3b8]c cancel · esc close[/]", id="job-log-help")
+
+    def on_mount(self) -> None:
+        self.query_one("#job-log", Vertical).border_title = self._run.name
+        self._timer = self.set_interval(POLL_SECONDS, self._update)
+        self._update()
+
+    def on_unmount(self) -> None:
+        if self._log is not None:
+            self._log.close()
+
+    def action_close(self) -> None:
+        self.app.pop_screen()
+
+    def action_cancel(self) -> None:
+        if self._runner.cancel(self._run.id):
+            self._update()
+        elif not self._runner.owns(self._run.id):
+            self.app.notify("This run belongs to another dashboard.", severity="warning")
+
+    def _update(self) -> None:
+        run = self._run
+        title = f"[#a5d6ff]$ {escape(' '.join(run.command))}[/]\n{format_run(run)}"
+        if run.error:
+            title += f"\n[bold #ff6b6b]Error:[/] {escape(run.error)}"
+        self.query_one("#job-log-title", Static).update(title)
+        self.query_one(LogView).sync()
+        if run.finished:
+            self._timer.stop()
+
+
+class JobsScreen(ModalScreen[None]):
+    BINDINGS = [
+        ("escape", "close", "Close"),
+        ("j", "close", "Close"),
+        ("c", "cancel", "Cancel run"),
+    ]
+
+    def __init__(self, runner: JobRunner) -> None:
+        super().__init__()
+        self._runner = runner
+        self._rows: Dict[str, str] = {}
+        self._order: List[str] = []
+
+    def compose(self) -> ComposeResult:
+        with Vertical(id="jobs"):
+            yield OptionList(id="jobs-list")
+            yield Static("[#94a3b8]enter open log · c cancel · j/esc close[/]", id="jobs-help")
+
+    def on_mount(self) -> None:
+        self.query_one("#jobs", Vertical).border_title = f"Action runs · up to {self._runner.max_concurrent} at once"
+        self._update()
+        self.set_interval(POLL_SECONDS, self._update)
+        self.query_one(OptionList).focus()
+
+    def action_close(self) -> None:
+        self.app.pop_screen()
+
+    def action_cancel(self) -> None:
+        run = self._highlighted()
+        if run is None:
+            return
+        if not self._runner.cancel(run.id) and not self._runner.owns(run.id):
+            self.app.notify("This run belongs to another dashboard.", severity="warning")
+        self._update()
+
+    def on_option_list_option_selected(self, event: OptionList.OptionSelected) -> None:
+        run = self._runner.get(event.option.id or "")
+        if run is not None:
+            self.app.push_screen(JobLogScreen(self._runner, run))
+
+    def _highlighted(self) -> Optional[JobRun]:
+        options = self.query_one(OptionList)
+        if options.highlighted is None or options.highlighted >= len(self._order):
+            return None
+        return self._runner.get(self._order[options.highlighted])
+
+    def _update(self) -> None:
+        runs = self._runner.runs()
+        rows = {run.id: format_run(run) for run in runs}
+        if rows == self._rows:
+            return
+        options = self.query_one(OptionList)
+        selected = self._highlighted()
+        self._rows = rows
+        self._order = [run.id for run in runs]
+        options.clear_options()
+        if not runs:
+            options.add_option(Option("No runs yet.", disabled=True))
+            return
+        options.add_options([Option(rows[run.id], id=run.id) for run in runs])
+        if selected is not None and selected.id in self._order:
+            options.highlighted = self._order.index(selected.id)
+        else:
+            options.highlighted = 0
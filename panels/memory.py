@@ -1,51 +1,138 @@
 from __future__ import annotations
 
-from pathlib import Path
-from typing import List, Tuple
+import time
+from functools import partial
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
 
-from textual.widgets import Static
+from rich.markup import escape
+from textual.app import ComposeResult
+from textual.containers import Vertical, VerticalScroll
+from textual.screen import ModalScreen
+from textual.widgets import Input, Static
 
-MEMORY_DIR = Path("/root/clawd/memory")
+from core.datasource import DataSource
+from core.memory_files import load_memory_files, memory_file_count, memory_index, memory_search_index, memory_source
+from core.scheduler import RefreshPolicy
 
-PLACEHOLDER_FILES = [
-    ("2026-01-29_reflection.md", "Stavan updated morning briefing flow."),
-    ("2026-01-28_context.txt", "Weekly goal: stabilize cron triggers."),
-    ("2026-01-28_ideas.md", "Investigate new canvas integrations."),
-    ("2026-01-27_notes.txt", "Deployed moltbot v2.4.1."),
-    ("2026-01-26_log.md", "System health checks passed."),
-]
+from .base import DashboardPanel
 
+if TYPE_CHECKING:
+    from core.search_index import SearchHit
 
-def _load_memory_files() -> List[Tuple[str, str]]:
-    if not MEMORY_DIR.exists():
-        return PLACEHOLDER_FILES
 
-    files = [path for path in MEMORY_DIR.iterdir() if path.is_file()]
-    if not files:
-        return PLACEHOLDER_FILES
+class MemoryPanel(DashboardPanel):
+    REFRESH_POLICY = RefreshPolicy(interval=10.0, cost=0.2, max_interval=120.0)
+    CACHE_DATA = True
 
-    files.sort(key=lambda path: path.stat().st_mtime, reverse=True)
-    entries: List[Tuple[str, str]] = []
-    for path in files[:5]:
-        preview = "(empty)"
-        try:
-            content = path.read_text(encoding="utf-8", errors="ignore").strip()
-            preview = content.splitlines()[0] if content else "(empty)"
-        except OSError:
-            preview = "(unreadable)"
-        entries.append((path.name, preview))
-    return entries
-
-
-class MemoryPanel(Static):
     def __init__(self, **kwargs: object) -> None:
         super().__init__(**kwargs)
         self.border_title = "Memory"
 
-    def refresh_panel(self) -> None:
-        entries = _load_memory_files()
+    def collect_data(self) -> List[Tuple[str, str]]:
+        return load_memory_files()
+
+    def data_sources(self) -> List[DataSource]:
+        return [memory_source] if memory_source is not None else []
+
+    def metrics(self, entries: List[Tuple[str, str]]) -> Dict[str, Optional[float]]:
+        return {"memory.files": float(memory_file_count())}
+
+    def build_model(self, entries: List[Tuple[str, str]]) -> Tuple[Tuple[str, str], ...]:
+        return tuple(entries)
+
+    def render_model(self, entries: Tuple[Tuple[str, str], ...]) -> List[str]:
         lines = ["[bold #ffc078]Recent updates[/]"]
         for filename, preview in entries:
             lines.append(f"[bold #f1f3f5]{filename}[/]")
             lines.append(f"  [#d0ebff]{preview}[/]")
-        self.update("\n".join(lines))
+        return lines
+
+
+def _format_hit(hit: SearchHit) -> str:
+    from core.search_index import HIGHLIGHT_END, HIGHLIGHT_START
+
+    snippet = escape(" ".join(hit.snippet.split()))
+    snippet = snippet.replace(HIGHLIGHT_START, "[bold #ffc078]").replace(HIGHLIGHT_END, "[/]")
+    return f"[bold #f1f3f5]{escape(hit.name)}[/]\n  [#d0ebff]{snippet}[/]"
+
+
+class MemorySearchScreen(ModalScreen[None]):
+    BINDINGS = [("escape", "close", "Close")]
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._ready = False
+
+    def compose(self) -> ComposeResult:
+        with Vertical(id="memory-search"):
+            yield Input(placeholder="Search memory files…", id="memory-search-input")
+            yield Static("Indexing memory files…", id="memory-search-status")
+            with VerticalScroll(id="memory-search-results"):
+                yield Static("", id="memory-search-hits")
+
+    def on_mount(self) -> None:
+        self.query_one(Vertical).border_title = "Memory Search"
+        self.query_one("#memory-search-input", Input).focus()
+        self.run_worker(self._sync_index, thread=True, group="memory-search-sync", exit_on_error=False)
+
+    def action_close(self) -> None:
+        self.app.pop_screen()
+
+    def on_input_changed(self, event: Input.Changed) -> None:
+        if self._ready:
+            self._start_search(event.value)
+
+    def _start_search(self, text: str) -> None:
+        self.run_worker(
+            partial(self._search, text),
+            thread=True,
+            group="memory-search",
+            exclusive=True,
+            exit_on_error=False,
+        )
+
+    def _sync_index(self) -> None:
+        started = time.perf_counter()
+        try:
+            index = memory_index()
+            index.refresh()
+            result = memory_search_index().sync(index.entries())
+        except Exception as exc:
+            self.app.call_from_thread(self._set_status, f"[bold #ff6b6b]Indexing failed[/] {escape(str(exc))}")
+            return
+        elapsed = (time.perf_counter() - started) * 1000
+        total = result.added + result.updated + result.unchanged
+        self.app.call_from_thread(
+            self._index_ready,
+            f"{total} files indexed ({result.added} new, {result.updated} updated, {result.removed} removed) in {elapsed:.0f} ms",
+        )
+
+    def _index_ready(self, message: str) -> None:
+        if not self.is_mounted:
+            return
+        self._ready = True
+        self._set_status(message)
+        text = self.query_one("#memory-search-input", Input).value
+        if text:
+            self._start_search(text)
+
+    def _search(self, text: str) -> None:
+        started = time.perf_counter()
+        hits = memory_search_index().search(text)
+        elapsed = (time.perf_counter() - started) * 1000
+        self.app.call_from_thread(self._show_results, text, hits, elapsed)
+
+    def _show_results(self, text: str, hits: List[SearchHit], elapsed: float) -> None:
+        if not self.is_mounted:
+            return
+        results = self.query_one("#memory-search-hits", Static)
+        if not text.strip():
+            self._set_status("Type to search.")
+            results.update("")
+            return
+        self._set_status(f"{len(hits)} matches in {elapsed:.1f} ms")
+        results.update("\n".join(_format_hit(hit) for hit in hits) or "No matches.")
+
+    def _set_status(self, message: str) -> None:
+        if self.is_mounted:
+            self.query_one("#memory-search-status", Static).update(message)
@@ -0,0 +1,109 @@
+import time
+from typing import Any, Dict, List, Optional
+
+from rich.markup import escape
+from textual.app import ComposeResult
+from textual.containers import Vertical, VerticalScroll
+from textual.screen import ModalScreen
+from textual.widgets import Static
+
+from core.instrumentation import default_instrumentation
+from core.paths import state_path
+
+
+def _ms(value: Optional[float]) -> str:
+    if value is None:
+        return "-"
+    return f"{value * 1000:.1f}"
+
+
+def _render_latency(latency: Dict[str, Dict[str, Any]]) -> List[str]:
+    lines = [f"[bold #a5d6ff]{'latency (ms)':<40}{'count':>8}{'p50':>10}{'p95':>10}{'p99':>10}{'max':>10}[/]"]
+    for name, summary in latency.items():
+        lines.append(
+            f"{escape(name[:39]):<40}{summary['count']:>8}{_ms(summary['p50']):>10}"
+            f"{_ms(summary['p95']):>10}{_ms(summary['p99']):>10}{_ms(summary['max']):>10}"
+        )
+    if len(lines) == 1:
+        lines.append("No samples yet.")
+    return lines
+
+
+def _render_report(report: Dict[str, Any]) -> str:
+    lines = _render_latency(report["latency"])
+    executor = report["executor"]
+    lines += [
+        "",
+        "[bold #ffb3c1]Command executor[/]",
+        f"calls {executor['calls']} · cache hits {executor['cache_hits']} · coalesced {executor['coalesced']} · "
+        f"executions {executor['executions']} · failures {executor['failures']} · timeouts {executor['timeouts']} · "
+        f"avg {_ms(executor['avg_latency'])} ms",
+        "",
+        "[bold #8ce99a]Scheduler[/]",
+    ]
+    for key, stats in report["scheduler"].items():
+        lines.append(
+            f"{key:<10} every {stats['interval']:.0f}s · backoff {stats['backoff']} · failures {stats['failures']} · "
+            f"runs {stats['runs']} · next in {stats['next_in']:.0f}s"
+        )
+    lines += ["", "[bold #ffc078]Rendering[/]"]
+    for key, stats in report["render"].items():
+        lines.append(
+            f"{key:<10} renders {stats['renders']} · skipped {stats['skipped']} · "
+            f"rows updated {stats['rows_updated']} · rows unchanged {stats['rows_unchanged']}"
+        )
+    lines += ["", "[bold #ff8787]Alert rules[/]"]
+    for name, stats in report["alerts"].items():
+        state = "suspended" if stats["suspended"] else "firing" if stats["firing"] else "ok"
+        lines.append(
+            f"{escape(name[:30]):<30} {state:<9} · evaluations {stats['evaluations']} · fired {stats['fired']} · "
+            f"avg {_ms(stats['mean'])} ms · total {_ms(stats['seconds'])} ms · suspended {stats['suspensions']}×"
+        )
+    if not report["alerts"]:
+        lines.append("No alert rules.")
+    recording = report["recording"]
+    if recording["failures"]:
+        failures = " · ".join(f"{key} {count}" for key, count in recording["failures"].items())
+        lines += ["", f"[bold #ff6b6b]Metric/alert/cache failures[/] {failures}", escape(recording["last_error"] or "")]
+    return "\n".join(lines)
+
+
+class PerformanceScreen(ModalScreen[None]):
+    BINDINGS = [
+        ("escape", "close", "Close"),
+        ("p", "close", "Close"),
+        ("d", "dump", "Dump JSON"),
+        ("x", "reset", "Reset"),
+    ]
+
+    def compose(self) -> ComposeResult:
+        with Vertical(id="perf"):
+            with VerticalScroll():
+                yield Static("", id="perf-body")
+            yield Static("[#94a3b8]d dump to JSON · x reset histograms · p/esc close[/]", id="perf-help")
+
+    def on_mount(self) -> None:
+        self.query_one("#perf", Vertical).border_title = "Performance"
+        self._update()
+        self.set_interval(1, self._update)
+
+    def action_close(self) -> None:
+        self.app.pop_screen()
+
+    def action_dump(self) -> None:
+        report = self.app.perf_report()
+        report.pop("latency", None)
+        try:
+            path = default_instrumentation.dump(state_path(f"perf-{time.strftime('%Y%m%d-%H%M%S')}.json"), report)
+        except OSError as exc:
+            self.app.notify(f"Could not write performance report: {exc}", severity="error", markup=False)
+            return
+        self.app.notify(f"Performance report written to {path}")
+
+    def action_reset(self) -> None:
+        default_instrumentation.reset()
+        self._update()
+
+    def _update(self) -> None:
+        self.query_one("#perf-body", Static).update(_render_report(self.app.perf_report()))
+
@@ -1,279 +1,268 @@
-import json
-import re
-import subprocess
+from __future__ import annotations
+
 import time
-from datetime import datetime, timezone
-from typing import Any, Dict, Iterable, Optional, Tuple
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Sequence, Tuple
 
-from textual.widgets import Static
+from textual.app import ComposeResult
+from textual.containers import Vertical
+from textual.screen import ModalScreen
+from textual.widgets import Input, Static
 
-STATUS_COMMAND = ["moltbot", "status", "--json"]
+from core.datasource import DataSource
+from core.scheduler import RefreshPolicy
+from core.status import (
+    SessionRow,
+    extract_sessions,
+    format_duration,
+    load_status,
+    read_status,
+    session_rows,
+    status_source,
+)
 
+from .base import DashboardPanel, ErrorModel, format_age
+from .table import Column, VirtualTable
 
-def _run_command(command: list[str]) -> Optional[str]:
-    try:
-        result = subprocess.run(
-            command,
-            capture_output=True,
-            text=True,
-            check=True,
-            timeout=8,
-        )
-    except (subprocess.SubprocessError, FileNotFoundError):
-        return None
-    return result.stdout.strip() or None
-
-
-def _load_status() -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
-    output = _run_command(STATUS_COMMAND)
-    if not output:
-        return None, "moltbot status --json failed"
-    try:
-        data = json.loads(output)
-    except json.JSONDecodeError:
-        return None, "invalid JSON from moltbot status"
-    if not isinstance(data, dict):
-        return None, "unexpected status payload"
-    return data, None
-
-
-def _format_duration(seconds: Optional[float]) -> str:
-    if seconds is None:
-        return "unknown"
-    total_seconds = max(0, int(seconds))
-    days, remainder = divmod(total_seconds, 86400)
-    hours, remainder = divmod(remainder, 3600)
-    minutes, seconds = divmod(remainder, 60)
-    if days:
-        return f"{days}d {hours:02d}:{minutes:02d}:{seconds:02d}"
-    return f"{hours:02d}:{minutes:02d}:{seconds:02d}"
-
-
-def _extract_session(status: Dict[str, Any]) -> Optional[Dict[str, Any]]:
-    session = status.get("session")
-    if isinstance(session, dict):
-        return session
-    sessions = status.get("sessions")
-    if isinstance(sessions, dict):
-        recent = sessions.get("recent")
-        if isinstance(recent, list) and recent:
-            return recent[0]
-        by_agent = sessions.get("byAgent")
-        if isinstance(by_agent, list) and by_agent:
-            agent_recent = by_agent[0].get("recent")
-            if isinstance(agent_recent, list) and agent_recent:
-                return agent_recent[0]
-    if isinstance(sessions, list) and sessions:
-        return sessions[0]
-    return None
-
-
-def _extract_model(status: Dict[str, Any], session: Optional[Dict[str, Any]]) -> str:
-    candidates: Iterable[Optional[str]] = [
-        session.get("model") if session else None,
-        status.get("model"),
-        status.get("current_model"),
-        status.get("session_model"),
-    ]
-    for value in candidates:
-        if isinstance(value, str) and value.strip():
-            return value
-    sessions = status.get("sessions")
-    if isinstance(sessions, dict):
-        defaults = sessions.get("defaults")
-        if isinstance(defaults, dict):
-            model = defaults.get("model")
-            if isinstance(model, str) and model.strip():
-                return model
-    return "unknown"
-
-
-def _format_tokens(status: Dict[str, Any], session: Optional[Dict[str, Any]]) -> str:
-    usage = status.get("token_usage") or status.get("tokens") or {}
-    if isinstance(usage, dict):
-        prompt = usage.get("prompt") or usage.get("input")
-        completion = usage.get("completion") or usage.get("output")
-        total = usage.get("total")
-        parts = []
-        if prompt is not None:
-            parts.append(f"prompt {prompt}")
-        if completion is not None:
-            parts.append(f"completion {completion}")
-        if total is not None:
-            parts.append(f"total {total}")
-        if parts:
-            return ", ".join(parts)
-    if session:
-        input_tokens = session.get("inputTokens") or session.get("promptTokens")
-        output_tokens = session.get("outputTokens") or session.get("completionTokens")
-        total_tokens = session.get("totalTokens") or session.get("tokens")
-        remaining_tokens = session.get("remainingTokens")
-        percent_used = session.get("percentUsed")
-        context_tokens = session.get("contextTokens")
-        parts = []
-        if input_tokens is not None:
-            parts.append(f"in {input_tokens}")
-        if output_tokens is not None:
-            parts.append(f"out {output_tokens}")
-        if total_tokens is not None:
-            parts.append(f"total {total_tokens}")
-        if percent_used is not None:
-            if context_tokens:
-                parts.append(f"{percent_used}% of {context_tokens}")
-            else:
-                parts.append(f"{percent_used}% used")
-        elif remaining_tokens is not None and context_tokens:
-            used = context_tokens - remaining_tokens
-            if used >= 0:
-                parts.append(f"{used} / {context_tokens}")
-        if parts:
-            return " · ".join(parts)
-    return "unavailable"
-
-
-def _parse_iso_datetime(value: str) -> Optional[datetime]:
-    if not value:
-        return None
-    try:
-        if value.endswith("Z"):
-            return datetime.fromisoformat(value.replace("Z", "+00:00"))
-        return datetime.fromisoformat(value)
-    except ValueError:
-        return None
-
-
-def _parse_timestamp(value: Any) -> Optional[datetime]:
-    if value is None:
-        return None
-    if isinstance(value, str):
-        if value.isdigit():
-            value = int(value)
-        else:
-            return _parse_iso_datetime(value)
-    if isinstance(value, (int, float)):
-        timestamp = float(value)
-        if timestamp > 1e12:
-            timestamp /= 1000.0
-        return datetime.fromtimestamp(timestamp, tz=timezone.utc)
-    return None
-
-
-def _parse_duration_text(value: str) -> Optional[float]:
-    if not value:
-        return None
-    total_seconds = 0.0
-    found = False
-    pattern = re.compile(
-        r"(?P<num>\\d+)\\s*(?P<unit>days?|d|hours?|hrs?|h|minutes?|mins?|m|seconds?|secs?|s)",
-        re.IGNORECASE,
+if TYPE_CHECKING:
+    from core.token_history import BurnSummary, TokenHistory
+
+SESSION_COLUMNS: List[Column] = [
+    ("Agent", 16, "left"),
+    ("Session", 32, "left"),
+    ("Model", 18, "left"),
+    ("Tokens", 10, "right"),
+    ("Used", 6, "right"),
+    ("Age", 10, "right"),
+]
+
+SORT_KEYS: List[Tuple[str, Callable[[SessionRow], Any]]] = [
+    ("age", lambda row: row.age_seconds),
+    ("tokens", lambda row: row.total_tokens),
+    ("used", lambda row: row.percent_used),
+    ("agent", lambda row: row.agent.lower()),
+    ("model", lambda row: row.model.lower()),
+    ("session", lambda row: row.key.lower()),
+]
+
+@dataclass(frozen=True)
+class SessionModel:
+    model: str
+    tokens: str
+    uptime: str
+    burn: str = ""
+    sessions: int = 0
+    agents: int = 0
+    rows: Tuple[SessionRow, ...] = field(default=(), repr=False, compare=False)
+
+
+class SessionPanel(DashboardPanel):
+    REFRESH_POLICY = RefreshPolicy(interval=15.0, cost=1.0, max_interval=240.0)
+    CACHE_DATA = True
+    SKELETON_LINES = (
+        "[bold #7ee787]Model:[/] [#5c6370]…[/]",
+        "[bold #a5d6ff]Tokens:[/] [#5c6370]…[/]",
+        "[bold #ffe08a]Uptime:[/] [#5c6370]…[/]",
+        "[bold #ff8787]Burn:[/] [#5c6370]…[/]",
+        "[bold #d0bfff]Sessions:[/] [#5c6370]…[/]",
     )
-    for match in pattern.finditer(value):
-        found = True
-        amount = int(match.group("num"))
-        unit = match.group("unit").lower()
-        if unit.startswith("d"):
-            total_seconds += amount * 86400
-        elif unit.startswith("h"):
-            total_seconds += amount * 3600
-        elif unit.startswith("m"):
-            total_seconds += amount * 60
-        else:
-            total_seconds += amount
-    return total_seconds if found else None
-
-
-def _coerce_seconds(value: Any) -> Optional[float]:
-    if value is None:
-        return None
-    if isinstance(value, str):
-        if value.isdigit():
-            value = int(value)
-        else:
-            parsed = _parse_iso_datetime(value)
-            if parsed:
-                return max(0.0, (datetime.now(timezone.utc) - parsed).total_seconds())
-            return None
-    if isinstance(value, (int, float)):
-        if value > 1e12:
-            return value / 1000.0
-        if value > 1e9:
-            return float(value)
-        if value > 1e6:
-            return value / 1000.0
-        return float(value)
-    return None
-
-
-def _extract_uptime_seconds(status: Dict[str, Any], session: Optional[Dict[str, Any]]) -> Optional[float]:
-    for key in ("uptimeMs", "uptimeMS", "uptimeMillis", "uptimeSeconds", "uptimeSec", "uptime"):
-        if key in status:
-            return _coerce_seconds(status[key])
-    for section_key in ("gateway", "gatewayService", "nodeService", "process", "system"):
-        section = status.get(section_key)
-        if isinstance(section, dict):
-            for key in ("uptimeMs", "uptimeMillis", "uptimeSeconds", "uptime", "startedAtMs", "startedAt"):
-                if key in section:
-                    if key.startswith("started"):
-                        started_at = _parse_timestamp(section[key])
-                        if started_at:
-                            return max(0.0, (datetime.now(timezone.utc) - started_at).total_seconds())
-                    else:
-                        return _coerce_seconds(section[key])
-            runtime_text = section.get("runtimeShort") or section.get("runtimeLong")
-            parsed = _parse_duration_text(runtime_text or "")
-            if parsed is not None:
-                return parsed
-    if session:
-        for key in ("ageMs", "age"):
-            if key in session:
-                value = _coerce_seconds(session[key])
-                if value is not None:
-                    return value
-        updated_at = session.get("updatedAt")
-        if updated_at:
-            updated_dt = None
-            if isinstance(updated_at, (int, float)):
-                updated_dt = datetime.fromtimestamp(updated_at / 1000.0, tz=timezone.utc)
-            elif isinstance(updated_at, str):
-                updated_dt = _parse_iso_datetime(updated_at)
-            if updated_dt:
-                return max(0.0, (datetime.now(timezone.utc) - updated_dt).total_seconds())
-    agents = status.get("agents")
-    if isinstance(agents, dict):
-        entries = agents.get("agents")
-        if isinstance(entries, list) and entries:
-            last_active = entries[0].get("lastActiveAgeMs")
-            value = _coerce_seconds(last_active)
-            if value is not None:
-                return value
-    return None
-
-
-class SessionPanel(Static):
+
     def __init__(self, start_time: float, **kwargs: Any) -> None:
         super().__init__(**kwargs)
         self.start_time = start_time
         self.border_title = "Session"
+        self._history: Optional[TokenHistory] = None
+        self._prices: Dict[str, Tuple[float, float]] = {}
+        self._sessions: Tuple[SessionRow, ...] = ()
+
+    def collect_data(self) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+        return load_status()
 
-    def refresh_panel(self) -> None:
-        status, error = _load_status()
+    def data_ok(self, data: Tuple[Optional[Dict[str, Any]], Optional[str]]) -> bool:
+        return data[0] is not None
+
+    def data_sources(self) -> List[DataSource]:
+        return [status_source]
+
+    def metrics(self, data: Tuple[Optional[Dict[str, Any]], Optional[str]]) -> Dict[str, Optional[float]]:
+        status = data[0]
         if not status:
-            message = error or "moltbot status unavailable"
-            self.update(f"[bold #ff6b6b]Status unavailable[/]\n{message}")
-            return
-        session = _extract_session(status)
-        model = _extract_model(status, session)
-        tokens = _format_tokens(status, session)
-        uptime_seconds = _extract_uptime_seconds(status, session)
+            return {}
+        fields = read_status(status)
+        if not fields.session:
+            return {}
+        return {
+            "session.tokens_total": fields.tokens_total,
+            "session.percent_used": fields.percent_used,
+            "session.count": float(len(extract_sessions(status))),
+        }
+
+    def build_model(self, data: Tuple[Optional[Dict[str, Any]], Optional[str]]) -> Any:
+        return self._build_model(data, record=True)
+
+    def build_cached_model(self, data: Tuple[Optional[Dict[str, Any]], Optional[str]]) -> Any:
+        return self._build_model(data, record=False)
+
+    def _build_model(self, data: Tuple[Optional[Dict[str, Any]], Optional[str]], record: bool) -> Any:
+        status, error = data
+        if not status:
+            return ErrorModel("Status unavailable", error or "moltbot status unavailable")
+        fields = read_status(status)
+        uptime_seconds = fields.uptime_seconds
         if uptime_seconds is None:
             uptime_seconds = max(0.0, time.time() - self.start_time)
-        uptime = _format_duration(uptime_seconds)
-        self.update(
-            "\n".join(
-                [
-                    f"[bold #7ee787]Model:[/] {model}",
-                    f"[bold #a5d6ff]Tokens:[/] {tokens}",
-                    f"[bold #ffe08a]Uptime:[/] {uptime}",
-                ]
-            )
+        rows = tuple(session_rows(status))
+        burn = "[#5c6370]…[/]"
+        if record:
+            from core.token_history import load_prices, open_token_history
+
+            if self._history is None:
+                self._history = open_token_history()
+                self._prices = load_prices()
+            self._history.record(rows)
+            burn = _format_burn(self._history.summarize(rows, fields.session_key, self._prices))
+        return SessionModel(
+            model=fields.model,
+            tokens=fields.tokens,
+            uptime=format_duration(uptime_seconds),
+            burn=burn,
+            sessions=len(rows),
+            agents=len({row.agent for row in rows}),
+            rows=rows,
+        )
+
+    def render_model(self, model: SessionModel) -> List[str]:
+        return [
+            f"[bold #7ee787]Model:[/] {model.model}",
+            f"[bold #a5d6ff]Tokens:[/] {model.tokens}",
+            f"[bold #ffe08a]Uptime:[/] {model.uptime}",
+            f"[bold #ff8787]Burn:[/] {model.burn}",
+            f"[bold #d0bfff]Sessions:[/] {model.sessions} across {model.agents} agents [#94a3b8](s for table)[/]",
+        ]
+
+    def on_unmount(self) -> None:
+        if self._history is not None:
+            self._history.close()
+
+    def show(self, model: Any) -> bool:
+        self._sessions = model.rows if isinstance(model, SessionModel) else ()
+        return super().show(model)
+
+    def sessions_snapshot(self) -> Tuple[SessionRow, ...]:
+        return self._sessions
+
+
+def _format_count(value: Optional[float]) -> str:
+    return "-" if value is None else f"{value:,.0f}"
+
+
+def _format_rate(value: float) -> str:
+    return f"{value / 1000:.1f}k" if value >= 1000 else f"{value:.0f}"
+
+
+def _format_burn(summary: BurnSummary) -> str:
+    if summary.short_rate is None and summary.long_rate is None:
+        return "[#94a3b8]collecting…[/]"
+    parts = []
+    if summary.short_rate is not None:
+        parts.append(f"{_format_rate(summary.short_rate)} tok/min (5m)")
+    if summary.long_rate is not None:
+        parts.append(f"{_format_rate(summary.long_rate)} (1h)")
+    if summary.full_in_seconds is not None:
+        parts.append(f"context full in {format_age(summary.full_in_seconds)}")
+    if summary.cost_per_day is not None:
+        parts.append(f"~${summary.cost_per_day:,.2f}/day")
+    return " · ".join(parts)
+
+
+def _row_cells(row: SessionRow) -> Sequence[str]:
+    used = "-" if row.percent_used is None else f"{row.percent_used:.0f}%"
+    return (row.agent, row.key, row.model, _format_count(row.total_tokens), used, format_age(row.age_seconds))
+
+
+def sort_rows(rows: Sequence[SessionRow], key: str, descending: bool) -> List[SessionRow]:
+    getter = dict(SORT_KEYS)[key]
+    present = [row for row in rows if getter(row) is not None]
+    missing = [row for row in rows if getter(row) is None]
+    return sorted(present, key=getter, reverse=descending) + missing
+
+
+def search_text(row: SessionRow) -> str:
+    return f"{row.agent} {row.key} {row.model}".lower()
+
+
+def filter_rows(rows: Sequence[SessionRow], haystacks: Sequence[str], text: str) -> List[SessionRow]:
+    terms = text.lower().split()
+    if not terms:
+        return list(rows)
+    return [row for row, haystack in zip(rows, haystacks) if all(term in haystack for term in terms)]
+
+
+class SessionsScreen(ModalScreen[None]):
+    BINDINGS = [
+        ("escape", "close", "Close"),
+        ("slash", "filter", "Filter"),
+        ("s", "sort", "Sort column"),
+        ("o", "reverse", "Reverse order"),
+    ]
+
+    def __init__(self, panel: SessionPanel) -> None:
+        super().__init__()
+        self._panel = panel
+        self._rows: Tuple[SessionRow, ...] = ()
+        self._haystacks: List[str] = []
+        self._sort = 0
+        self._descending = False
+
+    def compose(self) -> ComposeResult:
+        with Vertical(id="sessions"):
+            yield Input(placeholder="Filter by agent, session or model…", id="sessions-filter")
+            yield Static("", id="sessions-status")
+            yield VirtualTable(SESSION_COLUMNS, id="sessions-table")
+            yield Static("[#94a3b8]/ filter · s sort column · o reverse · esc close[/]", id="sessions-help")
+
+    def on_mount(self) -> None:
+        self.query_one("#sessions", Vertical).border_title = "Sessions"
+        self.query_one(VirtualTable).focus()
+        self._poll()
+        self.set_interval(1, self._poll)
+
+    def action_close(self) -> None:
+        self.app.pop_screen()
+
+    def action_filter(self) -> None:
+        self.query_one("#sessions-filter", Input).focus()
+
+    def action_sort(self) -> None:
+        self._sort = (self._sort + 1) % len(SORT_KEYS)
+        self._apply()
+
+    def action_reverse(self) -> None:
+        self._descending = not self._descending
+        self._apply()
+
+    def on_input_changed(self, event: Input.Changed) -> None:
+        self._apply()
+
+    def on_input_submitted(self, event: Input.Submitted) -> None:
+        self.query_one(VirtualTable).focus()
+
+    def _poll(self) -> None:
+        rows = self._panel.sessions_snapshot()
+        if rows is not self._rows:
+            self._rows = rows
+            self._haystacks = [search_text(row) for row in rows]
+            self._apply()
+
+    def _apply(self) -> None:
+        started = time.perf_counter()
+        text = self.query_one("#sessions-filter", Input).value
+        key = SORT_KEYS[self._sort][0]
+        rows = sort_rows(filter_rows(self._rows, self._haystacks, text), key, self._descending)
+        table = self.query_one(VirtualTable)
+        table.set_rows(rows, _row_cells)
+        elapsed = (time.perf_counter() - started) * 1000
+        order = "desc" if self._descending else "asc"
+        self.query_one("#sessions-status", Static).update(
+            f"{len(rows)} of {len(self._rows)} sessions · sorted by {key} {order} · {elapsed:.1f} ms"
         )
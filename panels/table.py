@@ -0,0 +1,55 @@
+from typing import Any, Callable, List, Sequence, Tuple
+
+from rich.segment import Segment
+from rich.style import Style
+from textual.geometry import Size
+from textual.scroll_view import ScrollView
+from textual.strip import Strip
+
+Column = Tuple[str, int, str]
+
+
+def format_cells(columns: Sequence[Column], cells: Sequence[str]) -> str:
+    parts = []
+    for (_, width, align), cell in zip(columns, cells):
+        cell = cell if len(cell) <= width else cell[: max(0, width - 1)] + "…"
+        parts.append(cell.rjust(width) if align == "right" else cell.ljust(width))
+    return " ".join(parts)
+
+
+class VirtualTable(ScrollView, can_focus=True):
+    HEADER_STYLE = Style(bold=True, color="#a5d6ff")
+
+    def __init__(self, columns: Sequence[Column], **kwargs: object) -> None:
+        super().__init__(**kwargs)
+        self.columns = list(columns)
+        self._header = format_cells(self.columns, [title for title, _, _ in self.columns])
+        self._rows: Sequence[Any] = []
+        self._cells: Callable[[Any], Sequence[str]] = lambda row: row
+        self._lines: List[str] = []
+        self._width = len(self._header)
+
+    def set_rows(self, rows: Sequence[Any], cells: Callable[[Any], Sequence[str]]) -> None:
+        self._rows = rows
+        self._cells = cells
+        self._lines = [""] * len(rows)
+        self.virtual_size = Size(self._width, len(rows) + 1)
+        self.refresh()
+
+    @property
+    def row_count(self) -> int:
+        return len(self._rows)
+
+    def render_line(self, y: int) -> Strip:
+        width = self.size.width
+        style = self.rich_style
+        scroll_x, scroll_y = self.scroll_offset
+        if y == 0:
+            return Strip([Segment(self._header, style + self.HEADER_STYLE)]).crop_extend(scroll_x, scroll_x + width, style)
+        index = scroll_y + y - 1
+        if index >= len(self._rows):
+            return Strip.blank(width, style)
+        line = self._lines[index]
+        if not line:
+            line = self._lines[index] = format_cells(self.columns, self._cells(self._rows[index]))
+        return Strip([Segment(line, style)]).crop_extend(scroll_x, scroll_x + width, style)
@@ -0,0 +1,20 @@
+import json
+import sys
+import time
+
+
+def main() -> None:
+    for step in json.loads(sys.argv[1]):
+        if "emit" in step:
+            sys.stdout.write(json.dumps(step["emit"]) + "\n")
+        elif "raw" in step:
+            sys.stdout.flush()
+            sys.stdout.buffer.write(bytes.fromhex(step["raw"]))
+        elif "sleep" in step:
+            sys.stdout.flush()
+            time.sleep(step["sleep"])
+        sys.stdout.flush()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+import pytest
+
+from core import alerts
+from core.alerts import AlertEngine, AlertRule, _parse_rule
+
+
+def _states(engine, metric, values, start=0.0, step=1.0):
+    states = []
+    for index, value in enumerate(values):
+        states += [event.state for event in engine.observe({metric: value}, now=start + index * step)]
+    return states
+
+
+def test_threshold_hysteresis_uses_clear():
+    engine = AlertEngine([AlertRule("cpu", "health.cpu", above=90.0, clear=75.0)])
+    assert _states(engine, "health.cpu", [50, 95, 96, 80, 91, 70, 95]) == ["firing", "resolved", "firing"]
+    assert engine.stats()["cpu"].fired == 2
+
+
+def test_below_rule_clears_at_threshold_by_default():
+    engine = AlertEngine([AlertRule("quiet", "health.net_rx", below=10.0)])
+    assert _states(engine, "health.net_rx", [20, 5, 9, 10, 3]) == ["firing", "resolved", "firing"]
+
+
+def test_duration_must_be_sustained():
+    engine = AlertEngine([AlertRule("cpu", "health.cpu", above=90.0, duration=60.0)])
+    assert _states(engine, "health.cpu", [95, 95, 50, 95], step=30.0) == []
+    assert _states(engine, "health.cpu", [95, 95, 95], start=200.0, step=30.0) == ["firing"]
+
+
+def test_rate_waits_for_half_a_window():
+    engine = AlertEngine([AlertRule("burn", "tokens", kind="rate", above=100.0, window=60.0)])
+    assert engine.observe({"tokens": 0}, now=0.0) == []
+    assert engine.observe({"tokens": 1000}, now=20.0) == []
+    events = engine.observe({"tokens": 1000}, now=30.0)
+    assert [(event.state, event.value) for event in events] == [("firing", pytest.approx(2000.0))]
+
+
+def test_rate_drops_samples_outside_window():
+    engine = AlertEngine([AlertRule("burn", "tokens", kind="rate", above=100.0, window=60.0)])
+    values = [(0.0, 0), (30.0, 0), (60.0, 0), (90.0, 10), (150.0, 20)]
+    events = [event for now, value in values for event in engine.observe({"tokens": value}, now=now)]
+    assert events == []
+
+
+def test_missing_values_and_other_metrics_are_ignored():
+    engine = AlertEngine([AlertRule("cpu", "health.cpu", above=90.0)])
+    assert engine.observe({"health.cpu": None, "health.disk": 99.0}, now=0.0) == []
+    assert engine.stats()["cpu"].evaluations == 0
+
+
+@pytest.mark.parametrize(
+    "entry, error",
+    [
+        ("cpu", "rule must be an object"),
+        ({"above": 1}, "needs a metric"),
+        ({"metric": "x"}, "needs above or below"),
+        ({"metric": "x", "above": 1, "kind": "median"}, "unknown rule kind"),
+    ],
+)
+def test_parse_rule_errors(entry, error):
+    with pytest.raises(ValueError, match=error):
+        _parse_rule(entry)
+
+
+def test_parse_rule_fields():
+    rule = _parse_rule({"metric": "m", "above": "5", "for": 30, "kind": "rate", "window": 120})
+    assert rule == AlertRule("m", "m", kind="rate", above=5.0, duration=30.0, window=120.0)
+
+
+def test_over_budget_rule_is_paused_then_resumed(monkeypatch):
+    engine = AlertEngine([AlertRule("cpu", "health.cpu", above=90.0)])
+    monkeypatch.setattr(alerts, "RULE_BUDGET_SECONDS", -1.0)
+    states = _states(engine, "health.cpu", [50] * alerts.BUDGET_WINDOW)
+    assert states == ["suspended"]
+    assert _states(engine, "health.cpu", [95], start=100.0) == []
+    monkeypatch.setattr(alerts, "RULE_BUDGET_SECONDS", 1.0)
+    resumed = alerts.SUSPEND_SECONDS + alerts.BUDGET_WINDOW
+    assert _states(engine, "health.cpu", [95] * alerts.BUDGET_WINDOW, start=resumed) == ["resumed", "firing"]
+    stats = engine.stats()["cpu"]
+    assert (stats.suspended, stats.suspensions, stats.evaluations) == (False, 1, 2 * alerts.BUDGET_WINDOW)
+
+
+def test_budget_uses_thread_time_per_window(monkeypatch):
+    ticks = iter(range(10 * alerts.BUDGET_WINDOW))
+    monkeypatch.setattr(alerts.time, "thread_time", lambda: next(ticks) * 0.0002)
+    engine = AlertEngine([AlertRule("cpu", "health.cpu", above=90.0)])
+    assert _states(engine, "health.cpu", [50] * 3 * alerts.BUDGET_WINDOW) == []
+    assert engine.stats()["cpu"].seconds == pytest.approx(3 * alerts.BUDGET_WINDOW * 0.0002)
@@ -0,0 +1,188 @@
+import json
+import random
+import socket
+import threading
+import time
+from typing import Callable
+
+import pytest
+
+from core import collector as collector_module
+from core.collector import CLIENT_QUEUE, Collector, Topic, _Client
+from core.datasource import CollectorSource, SourceResult, apply_delta, diff_delta
+
+PAIRS = [
+    ({"a": 1}, {"a": 2}),
+    ({"a": 1, "b": 2}, {"b": 2, "c": 3}),
+    ({"a": {"b": {"c": [1, 2, 3]}}}, {"a": {"b": {"c": [1, 5, 3]}, "d": None}}),
+    ({"jobs": [{"id": 1, "state": {"next": 5}}, {"id": 2}]}, {"jobs": [{"id": 1, "state": {"next": 9}}, {"id": 2}]}),
+    ({"jobs": [1, 2]}, {"jobs": [1, 2, 3]}),
+    ({"a": [1, {"b": 2}]}, {"a": {"b": 2}}),
+    ({"a": 1}, [1, 2]),
+    (None, {"a": 1}),
+    ([[1, 2], [3]], [[1, 4], [3]]),
+    ({}, {}),
+]
+
+
+def _random_value(rng, depth=0):
+    kind = rng.randrange(4 if depth < 3 else 2)
+    if kind == 0:
+        return rng.choice([None, True, 0, 1.5, "x", "y"])
+    if kind == 1:
+        return rng.randrange(5)
+    if kind == 2:
+        return [_random_value(rng, depth + 1) for _ in range(rng.randrange(4))]
+    return {rng.choice("abcde"): _random_value(rng, depth + 1) for _ in range(rng.randrange(4))}
+
+
+def _mutate(rng, value, depth=0):
+    if isinstance(value, dict) and value and rng.random() < 0.7:
+        value = dict(value)
+        key = rng.choice(sorted(value))
+        choice = rng.randrange(3)
+        if choice == 0:
+            del value[key]
+        elif choice == 1:
+            value[key] = _mutate(rng, value[key], depth + 1)
+        else:
+            value[rng.choice("fgh")] = _random_value(rng, depth + 1)
+        return value
+    if isinstance(value, list) and value and rng.random() < 0.7:
+        value = list(value)
+        index = rng.randrange(len(value))
+        value[index] = _mutate(rng, value[index], depth + 1)
+        return value
+    return _random_value(rng, depth)
+
+
+def _round_trip(before, after):
+    snapshot = json.loads(json.dumps(before))
+    ops = json.loads(json.dumps(diff_delta(before, after)))
+    assert apply_delta(before, ops) == after
+    assert before == snapshot
+
+
+@pytest.mark.parametrize("before, after", PAIRS)
+def test_delta_round_trip(before, after):
+    _round_trip(before, after)
+
+
+def test_delta_round_trip_random():
+    rng = random.Random(7)
+    for _ in range(500):
+        before = _random_value(rng)
+        _round_trip(before, _mutate(rng, before))
+
+
+def _source():
+    return CollectorSource("/nonexistent.sock", "cron", "cron")
+
+
+def test_source_applies_deltas_and_error_only_updates():
+    source = _source()
+    source._publish({"topic": "cron", "version": 1, "data": {"jobs": [1], "ok": True}})
+    source._publish({"topic": "cron", "version": 2, "base": 1, "ops": [[["jobs"], [1, 2]]]})
+    assert source._latest == {"jobs": [1, 2], "ok": True}
+    source._publish({"topic": "cron", "version": 3, "base": 2, "ops": [], "error": "moltbot timed out"})
+    assert source._latest == {"jobs": [1, 2], "ok": True}
+    assert source._remote_error == "moltbot timed out"
+    source._publish({"topic": "cron", "version": 4, "base": 3, "ops": []})
+    assert source._remote_error is None
+
+
+def test_source_rejects_deltas_on_the_wrong_base():
+    source = _source()
+    source._publish({"topic": "cron", "version": 1, "data": {"n": 1}})
+    with pytest.raises(OSError):
+        source._publish({"topic": "cron", "version": 3, "base": 2, "ops": [[["n"], 3]]})
+    source._publish({"topic": "other", "version": 9, "data": {"n": 9}})
+    assert source._latest == {"n": 1}
+
+
+def _client():
+    near, far = socket.socketpair()
+    return _Client(near), far
+
+
+def _drain(client):
+    lines = []
+    while not client.queue.empty():
+        lines.append(json.loads(client.queue.get_nowait()))
+    return lines
+
+
+def test_publish_sends_full_delta_and_error_only_messages():
+    topic = Topic("cron", lambda: SourceResult(), 300.0)
+    collector = Collector(None, [topic])
+    client, far = _client()
+    topic.subscribers.append(client)
+    payload = {"jobs": [{"id": i, "name": f"job {i}"} for i in range(20)]}
+    collector._publish(topic, SourceResult(data=payload))
+    changed = dict(payload, jobs=payload["jobs"][:19] + [{"id": 19, "name": "renamed"}])
+    collector._publish(topic, SourceResult(data=changed))
+    collector._publish(topic, SourceResult(data=changed))
+    collector._publish(topic, SourceResult(error="boom"))
+    full, delta, error = _drain(client)
+    assert full == {"topic": "cron", "version": 1, "data": payload}
+    assert (delta["version"], delta["base"], "data" in delta) == (2, 1, False)
+    assert apply_delta(payload, delta["ops"]) == changed
+    assert error == {"topic": "cron", "version": 3, "base": 2, "ops": [], "error": "boom"}
+    assert topic.data == changed
+    far.close()
+
+
+def test_slow_clients_are_dropped():
+    topic = Topic("health", lambda: SourceResult(), 1.0)
+    collector = Collector(None, [topic])
+    slow, slow_far = _client()
+    fast, fast_far = _client()
+    topic.subscribers.extend([slow, fast])
+    for _ in range(CLIENT_QUEUE):
+        slow.send(b"{}\n")
+    collector._publish(topic, SourceResult(data={"n": 1}))
+    assert topic.subscribers == [fast]
+    assert slow_far.recv(1) == b""
+    assert fast.queue.qsize() == 1
+    slow_far.close()
+    fast_far.close()
+
+
+def _wait_for(predicate: Callable[[], bool], timeout: float = 5.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.02)
+    return predicate()
+
+
+def test_two_subscribers_share_one_collection(tmp_path, monkeypatch):
+    monkeypatch.setattr(collector_module, "REFRESH_MIN_SECONDS", 0.0)
+    calls = []
+
+    def collect():
+        calls.append(time.monotonic())
+        return SourceResult(data={"n": len(calls), "jobs": list(range(50))})
+
+    path = tmp_path / "c.sock"
+    collector = Collector(path, [Topic("cron", collect, 300.0)])
+    thread = threading.Thread(target=collector.serve_forever, daemon=True)
+    thread.start()
+    assert _wait_for(path.exists)
+    first = CollectorSource(str(path), "cron", "cron")
+    second = CollectorSource(str(path), "cron", "cron")
+    try:
+        assert _wait_for(lambda: first.fetch().data == {"n": 1, "jobs": list(range(50))})
+        assert _wait_for(lambda: second.fetch().data == {"n": 1, "jobs": list(range(50))})
+        assert len(calls) == 1
+        first.request_refresh()
+        assert _wait_for(lambda: first.fetch().data["n"] == 2 and second.fetch().data["n"] == 2)
+        assert first.fetch().version == second.fetch().version == 2
+        assert len(calls) == 2
+    finally:
+        first.close()
+        second.close()
+        collector.stop()
+        thread.join(5)
+    assert not path.exists()
@@ -0,0 +1,99 @@
+from datetime import datetime, timezone
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from core.cronexpr import CronParseError, UnknownTimezoneError, next_fire, parse_cron, resolve_timezone, upcoming
+from core.cronjobs import parse_jobs
+
+UTC = timezone.utc
+NEW_YORK = "America/New_York"
+
+
+def _utc(*parts: int) -> datetime:
+    return datetime(*parts, tzinfo=UTC)
+
+
+@pytest.mark.parametrize(
+    "expr, field, expected",
+    [
+        ("0 9-17 * * *", "hours", tuple(range(9, 18))),
+        ("*/15 * * * *", "minutes", (0, 15, 30, 45)),
+        ("10-40/10 * * * *", "minutes", (10, 20, 30, 40)),
+        ("5/20 * * * *", "minutes", (5, 25, 45)),
+        ("0 0 1 jan,Jul *", "months", (1, 7)),
+        ("0 8 * * mon-fri", "weekdays", (1, 2, 3, 4, 5)),
+        ("0 8 * * 5-7", "weekdays", (0, 5, 6)),
+        ("*/20 * * * * *", "seconds", (0, 20, 40)),
+        ("@hourly", "minutes", (0,)),
+    ],
+)
+def test_fields(expr, field, expected):
+    assert getattr(parse_cron(expr), field) == expected
+
+
+@pytest.mark.parametrize("expr", ["61 * * * *", "* * *", "*/0 * * * *", "0 0 * foo *", "5-1 * * * *", ""])
+def test_invalid_expressions(expr):
+    with pytest.raises(CronParseError):
+        parse_cron(expr)
+
+
+@pytest.mark.parametrize(
+    "expr, moment, expected",
+    [
+        ("0 9-17 * * *", _utc(2026, 1, 29, 17, 30), _utc(2026, 1, 30, 9)),
+        ("*/15 * * * *", _utc(2026, 1, 29, 12, 7, 30), _utc(2026, 1, 29, 12, 15)),
+        ("*/15 * * * *", _utc(2026, 1, 29, 12, 15), _utc(2026, 1, 29, 12, 30)),
+        ("*/10 * * * * *", _utc(2026, 1, 29, 12, 0, 1), _utc(2026, 1, 29, 12, 0, 10)),
+        ("@daily", _utc(2026, 12, 31, 23, 59), _utc(2027, 1, 1)),
+        ("@weekly", _utc(2026, 1, 29), _utc(2026, 2, 1)),
+        ("@monthly", _utc(2026, 1, 29), _utc(2026, 2, 1)),
+        ("@yearly", _utc(2026, 1, 29), _utc(2027, 1, 1)),
+        ("0 0 29 2 *", _utc(2026, 3, 1), _utc(2028, 2, 29)),
+    ],
+)
+def test_next_fire(expr, moment, expected):
+    assert next_fire(expr, moment) == expected
+
+
+def test_impossible_date_never_fires():
+    assert next_fire("0 0 30 2 *", _utc(2026, 1, 1)) is None
+
+
+def test_restricted_day_of_month_or_day_of_week():
+    fires = upcoming("0 0 13 * fri", _utc(2026, 2, 1), 4)
+    assert [fire.day for fire in fires] == [6, 13, 20, 27]
+    assert [fire.day for fire in upcoming("0 0 12 * fri", _utc(2026, 2, 1), 3)] == [6, 12, 13]
+
+
+def test_star_step_day_of_month_matches_vixie_cron():
+    assert next_fire("0 0 */2 * mon", _utc(2026, 1, 29)) == _utc(2026, 2, 9)
+    assert next_fire("0 0 1-31/2 * mon", _utc(2026, 1, 29)) == _utc(2026, 1, 31)
+
+
+def test_dst_gap_skips_the_missing_time():
+    fire = next_fire("30 2 * * *", _utc(2026, 3, 7, 17), NEW_YORK)
+    assert fire.astimezone(ZoneInfo(NEW_YORK)).replace(tzinfo=None) == datetime(2026, 3, 9, 2, 30)
+
+
+def test_dst_overlap_fires_once():
+    zone = ZoneInfo(NEW_YORK)
+    first = next_fire("30 1 * * *", _utc(2026, 11, 1, 4), NEW_YORK)
+    assert first == _utc(2026, 11, 1, 5, 30)
+    second = next_fire("30 1 * * *", first, NEW_YORK)
+    assert second.astimezone(zone).replace(tzinfo=None) == datetime(2026, 11, 2, 1, 30)
+    inside_repeat = _utc(2026, 11, 1, 6, 40)
+    assert next_fire("50 1 * * *", inside_repeat, NEW_YORK) == _utc(2026, 11, 2, 6, 50)
+
+
+def test_timezone_offsets_fire_time():
+    assert next_fire("0 9 * * *", _utc(2026, 7, 1), NEW_YORK) == _utc(2026, 7, 1, 13)
+
+
+def test_unknown_timezone_is_reported_on_the_job():
+    with pytest.raises(UnknownTimezoneError):
+        resolve_timezone("Mars/Olympus_Mons")
+    job = {"name": "typo", "schedule": {"kind": "cron", "expr": "0 9 * * *", "tz": "Mars/Olympus_Mons"}}
+    parsed = parse_jobs([job], _utc(2026, 1, 29))[0]
+    assert parsed["next_dt"] is None
+    assert parsed["error"] == "unknown timezone 'Mars/Olympus_Mons'"
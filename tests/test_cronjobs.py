@@ -0,0 +1,66 @@
+from datetime import datetime, timedelta, timezone
+
+from core.cronjobs import advance_jobs, parse_jobs
+
+NOW = datetime(2026, 1, 29, 12, 0, 30, tzinfo=timezone.utc)
+
+
+def _at_job(when: datetime) -> dict:
+    return {"name": "once", "schedule": {"kind": "at", "atMs": int(when.timestamp() * 1000)}}
+
+
+def _cron_job(expr: str) -> dict:
+    return {"name": "every", "schedule": {"kind": "cron", "expr": expr}}
+
+
+def test_one_shot_job_fires_once():
+    parsed = parse_jobs([_at_job(NOW + timedelta(seconds=5))], NOW)
+    assert not advance_jobs(parsed, NOW)
+    later = NOW + timedelta(seconds=10)
+    assert advance_jobs(parsed, later)
+    assert not advance_jobs(parsed, later + timedelta(seconds=1))
+    assert not advance_jobs(parsed, later + timedelta(seconds=2))
+
+
+def test_already_due_one_shot_does_not_fire():
+    parsed = parse_jobs([_at_job(NOW - timedelta(minutes=5))], NOW)
+    assert not advance_jobs(parsed, NOW)
+    assert not advance_jobs(parsed, NOW + timedelta(seconds=1))
+
+
+def test_cron_job_reschedules_after_firing():
+    parsed = parse_jobs([_cron_job("* * * * *")], NOW)
+    first = parsed[0]["next_dt"]
+    assert first > NOW
+    assert advance_jobs(parsed, first)
+    assert parsed[0]["next_dt"] > first
+    assert not advance_jobs(parsed, first + timedelta(seconds=1))
+
+
+def _lateness(job: dict) -> object:
+    return parse_jobs([job], NOW)[0]["lateness"]
+
+
+def _ms(when: datetime) -> int:
+    return int(when.timestamp() * 1000)
+
+
+def test_lateness_counts_only_pending_recurring_jobs():
+    stale = _ms(NOW - timedelta(hours=3))
+    recurring = dict(_cron_job("0 * * * *"), state={"nextRunAtMs": stale})
+    assert _lateness(recurring) == 3 * 3600
+    every = {"name": "poll", "schedule": {"kind": "every", "everyMs": 60000}, "state": {"nextRunAtMs": stale}}
+    assert _lateness(every) == 3 * 3600
+    assert _lateness(dict(recurring, enabled=False)) is None
+    assert _lateness(dict(recurring, state={"nextRunAtMs": stale, "runningAtMs": _ms(NOW)})) is None
+    assert _lateness(dict(recurring, state={"nextRunAtMs": stale, "lastRunAtMs": stale + 1000})) is None
+    assert _lateness(dict(recurring, state={"nextRunAtMs": _ms(NOW + timedelta(minutes=5))})) is None
+    assert _lateness(_at_job(NOW - timedelta(days=2))) is None
+    assert _lateness({"name": "bare", "next": stale}) is None
+
+
+def test_panel_metric_ignores_finished_one_shots():
+    from panels.crons import CronJobsPanel
+
+    jobs = [_at_job(NOW - timedelta(days=30)), dict(_cron_job("*/5 * * * *"), enabled=False, state={"nextRunAtMs": 0})]
+    assert CronJobsPanel().metrics((jobs, None))["crons.max_lateness"] == 0.0
@@ -0,0 +1,86 @@
+import json
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+from core.datasource import PollingSource, WatchSource
+from core.executor import CommandExecutor
+
+STANDIN = str(Path(__file__).with_name("stream_standin.py"))
+
+
+def _standin(*steps: Dict[str, Any]) -> List[str]:
+    return [sys.executable, STANDIN, json.dumps(list(steps))]
+
+
+def _fallback() -> PollingSource:
+    command = [sys.executable, "-c", "print('{\"polled\": true}')"]
+    return PollingSource(command, "fallback", CommandExecutor(ttl=0))
+
+
+def _wait_for(predicate: Callable[[], bool], timeout: float = 5.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.02)
+    return predicate()
+
+
+def test_pushed_payloads_notify_subscribers():
+    source = WatchSource(_standin({"emit": {"n": 1}}, {"emit": {"n": 2}}, {"sleep": 5}), "stand-in", _fallback())
+    pushes = threading.Semaphore(0)
+    source.subscribe(pushes.release)
+    try:
+        assert _wait_for(lambda: source.fetch().data == {"n": 2})
+        result = source.fetch()
+        assert result.pushed
+        assert result.version == 2
+        assert pushes.acquire(timeout=1)
+    finally:
+        source.close()
+
+
+def test_disconnect_falls_back_to_polling():
+    source = WatchSource(_standin({"emit": {"n": 1}}, {"sleep": 0.5}), "stand-in", _fallback())
+    try:
+        assert _wait_for(lambda: source.fetch().pushed)
+        assert _wait_for(lambda: source.fetch().data == {"polled": True})
+        assert not source.fetch().pushed
+    finally:
+        source.close()
+
+
+def test_undecodable_stream_is_reported_and_retried():
+    source = WatchSource(_standin({"emit": {"n": 1}}, {"raw": "fffe0a"}, {"sleep": 5}), "stand-in")
+    try:
+        assert _wait_for(lambda: source.fetch().error is not None and "stream failed" in source.fetch().error)
+        assert source._thread is not None and source._thread.is_alive()
+    finally:
+        source.close()
+
+
+class _FailingSource(WatchSource):
+    connects = 0
+
+    def _connect(self):
+        self.connects += 1
+        return super()._connect()
+
+    def _publish(self, payload: Any) -> None:
+        if payload.get("boom"):
+            raise ValueError("bad payload")
+        super()._publish(payload)
+
+
+def test_publish_errors_reconnect_instead_of_killing_the_reader():
+    source = _FailingSource(_standin({"emit": {"n": 1}}, {"emit": {"boom": 1}}, {"sleep": 5}), "stand-in", _fallback())
+    try:
+        source.fetch()
+        assert _wait_for(lambda: source.connects >= 2)
+        assert source._thread is not None and source._thread.is_alive()
+        assert source.fetch().data in ({"n": 1}, {"polled": True})
+    finally:
+        source.close()
@@ -0,0 +1,37 @@
+from types import SimpleNamespace
+
+import pytest
+
+from core import iostats
+from core.iostats import IOMonitor
+
+PARTITIONS = [
+    SimpleNamespace(device="/dev/sda1", mountpoint="/", fstype="ext4"),
+    SimpleNamespace(device="/dev/sda1", mountpoint="/var/lib/docker", fstype="ext4"),
+    SimpleNamespace(device="tmpfs", mountpoint="/run", fstype="tmpfs"),
+    SimpleNamespace(device="nas:/export", mountpoint="/mnt/nas", fstype="nfs4"),
+    SimpleNamespace(device="me@host:", mountpoint="/mnt/remote", fstype="fuse.sshfs"),
+    SimpleNamespace(device="/dev/sdb1", mountpoint="/data", fstype="xfs"),
+]
+
+
+@pytest.fixture(autouse=True)
+def partitions(monkeypatch):
+    monkeypatch.setattr(iostats.psutil, "disk_partitions", lambda all=False: PARTITIONS)
+
+
+def _mountpoints(monitor):
+    return [mount[0] for mount in monitor._discover()]
+
+
+def test_remote_mounts_skipped_by_default():
+    assert _mountpoints(IOMonitor(include=(), exclude=())) == ["/", "/data"]
+
+
+def test_remote_mounts_opted_in_by_pattern():
+    assert _mountpoints(IOMonitor(include=("/", "/mnt/nas"), exclude=())) == ["/", "/mnt/nas"]
+
+
+def test_env_patterns(monkeypatch):
+    monkeypatch.setenv("CLAWD_DASH_MOUNTS", "/*,!/data")
+    assert _mountpoints(IOMonitor()) == ["/", "/mnt/nas", "/mnt/remote"]
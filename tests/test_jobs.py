@@ -0,0 +1,91 @@
+import json
+import os
+import subprocess
+import sys
+import time
+
+from core.jobs import ORPHAN_GRACE_SECONDS, JobRunner
+
+IGNORE_TERM = "import signal, time; signal.signal(signal.SIGTERM, signal.SIG_IGN); print('ready', flush=True); time.sleep(60)"
+
+
+def test_shutdown_kills_children_that_ignore_sigterm(tmp_path):
+    runner = JobRunner(tmp_path)
+    run = runner.submit("stubborn", [sys.executable, "-c", IGNORE_TERM])
+    deadline = time.monotonic() + 5
+    while runner._processes.get(run.id) is None or run.lines < 1:
+        assert time.monotonic() < deadline
+        time.sleep(0.02)
+    process = runner._processes[run.id]
+    started = time.monotonic()
+    runner.shutdown()
+    assert time.monotonic() - started < 5
+    assert process.wait(timeout=1) is not None
+
+
+def _age(path, seconds):
+    stamp = time.time() - seconds
+    os.utime(path, (stamp, stamp))
+
+
+def _wait_finished(runner, run):
+    deadline = time.monotonic() + 5
+    while not runner.get(run.id).finished:
+        assert time.monotonic() < deadline
+        time.sleep(0.02)
+
+
+def test_history_skips_incomplete_records(tmp_path):
+    records = [
+        {"id": "a", "name": "ok", "command": ["true"], "state": "succeeded"},
+        {"id": "b", "name": "no command"},
+        {"id": "c", "name": "was running", "command": ["sleep"], "state": "running"},
+    ]
+    (tmp_path / "history.json").write_text(json.dumps(records), encoding="utf-8")
+    runner = JobRunner(tmp_path)
+    assert {run.id: run.state for run in runner.runs()} == {"a": "succeeded", "c": "interrupted"}
+
+
+def test_only_old_unreferenced_logs_are_removed(tmp_path):
+    records = [{"id": "a", "name": "ok", "command": ["true"], "state": "succeeded"}]
+    (tmp_path / "history.json").write_text(json.dumps(records), encoding="utf-8")
+    for name in ("a.log.z", "a.idx", "gone.log.z", "gone.idx", "starting.log.z"):
+        (tmp_path / name).write_bytes(b"")
+        if name != "starting.log.z":
+            _age(tmp_path / name, ORPHAN_GRACE_SECONDS + 60)
+    JobRunner(tmp_path)
+    assert sorted(path.suffix for path in tmp_path.glob("a.*")) == [".idx", ".z"]
+    assert not list(tmp_path.glob("gone.*"))
+    assert (tmp_path / "starting.log.z").exists()
+
+
+def test_running_jobs_of_live_instances_are_left_alone(tmp_path):
+    live = subprocess.Popen(["sleep", "30"])
+    dead = subprocess.Popen(["true"])
+    dead.wait()
+    try:
+        records = [
+            {"id": "live", "name": "other", "command": ["sleep"], "state": "running", "owner": live.pid},
+            {"id": "dead", "name": "crashed", "command": ["sleep"], "state": "running", "owner": dead.pid},
+        ]
+        (tmp_path / "history.json").write_text(json.dumps(records), encoding="utf-8")
+        runner = JobRunner(tmp_path)
+        assert {run.id: run.state for run in runner.runs()} == {"live": "running", "dead": "interrupted"}
+        assert not runner.cancel("live")
+    finally:
+        live.kill()
+        live.wait()
+
+
+def test_instances_merge_their_history(tmp_path):
+    first = JobRunner(tmp_path)
+    one = first.submit("one", ["true"])
+    _wait_finished(first, one)
+    second = JobRunner(tmp_path)
+    two = second.submit("two", ["true"])
+    _wait_finished(second, two)
+    three = first.submit("three", ["true"])
+    _wait_finished(first, three)
+    saved = json.loads((tmp_path / "history.json").read_text(encoding="utf-8"))
+    assert {record["id"] for record in saved} == {one.id, two.id, three.id}
+    assert {run.id for run in first.runs()} == {one.id, two.id, three.id}
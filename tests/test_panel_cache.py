@@ -0,0 +1,94 @@
+import asyncio
+import json
+import time
+import zlib
+
+from textual.app import App
+
+from core import panel_cache
+from core.panel_cache import WRITE_INTERVAL, PanelCache
+from panels.base import DashboardPanel, ErrorModel
+
+
+def test_round_trip(tmp_path):
+    cache = PanelCache(tmp_path)
+    data = [[{"name": "brief", "next": 1700000000000}], None]
+    cache.store("crons", data, now=1000.0)
+    loaded = PanelCache(tmp_path).load("crons")
+    assert (loaded.saved_at, loaded.data) == (1000.0, data)
+    assert PanelCache().load("crons") is None
+
+
+def test_writes_are_throttled_until_flush(tmp_path):
+    cache = PanelCache(tmp_path)
+    cache.store("memory", {"n": 1}, now=1000.0)
+    cache.store("memory", {"n": 2}, now=1000.0 + WRITE_INTERVAL / 2)
+    assert cache.load("memory").data == {"n": 1}
+    cache.flush()
+    assert cache.load("memory").data == {"n": 2}
+    cache.store("memory", {"n": 2}, now=1000.0 + WRITE_INTERVAL * 2)
+    assert cache.load("memory").saved_at == 1000.0 + WRITE_INTERVAL / 2
+
+
+def test_corrupt_and_mismatched_entries_are_ignored(tmp_path, monkeypatch):
+    cache = PanelCache(tmp_path)
+    path = tmp_path / "session.json.z"
+    for raw in (
+        b"not zlib",
+        zlib.compress(b"{not json"),
+        zlib.compress(b"[1, 2]"),
+        zlib.compress(json.dumps({"version": 1, "saved_at": "yesterday", "data": 1}).encode()),
+    ):
+        path.write_bytes(raw)
+        assert cache.load("session") is None
+    cache.store("session", {"n": 1}, now=1000.0)
+    assert cache.load("session") is not None
+    monkeypatch.setattr(panel_cache, "CACHE_VERSION", panel_cache.CACHE_VERSION + 1)
+    assert cache.load("session") is None
+
+
+def test_keys_are_safe_file_names(tmp_path):
+    cache = PanelCache(tmp_path)
+    cache.store("../../etc/passwd", {"n": 1}, now=1000.0)
+    assert [path.name for path in tmp_path.iterdir()] == [".._.._etc_passwd.json.z"]
+
+
+class _Panel(DashboardPanel):
+    def render_model(self, model):
+        return [str(model)]
+
+
+class _Host(App):
+    def compose(self):
+        yield _Panel(id="cached")
+
+
+def test_mark_stale_keeps_data_and_shows_its_age():
+    async def run():
+        app = _Host()
+        async with app.run_test():
+            panel = app.query_one(_Panel)
+            assert not panel.mark_stale("moltbot failed")
+            panel.show_fresh("fresh")
+            assert panel.border_subtitle == ""
+            panel.data_time = time.time() - 120
+            assert panel.mark_stale("moltbot failed")
+            assert panel.text == "fresh"
+            assert panel.border_subtitle == "cached · 2m old · moltbot failed"
+            panel.show_fresh("newer")
+            assert (panel.border_subtitle, panel.stale_reason) == ("", None)
+
+    asyncio.run(run())
+
+
+def test_cached_data_keeps_the_error_that_preceded_it():
+    async def run():
+        app = _Host()
+        async with app.run_test():
+            panel = app.query_one(_Panel)
+            panel.show(ErrorModel("Cron load failed", "timeout"))
+            panel.show_cached("cached", time.time() - 30)
+            assert panel.text == "cached"
+            assert panel.border_subtitle == "cached · 30s old · Cron load failed"
+
+    asyncio.run(run())
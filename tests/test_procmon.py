@@ -0,0 +1,122 @@
+import contextlib
+import time
+from types import SimpleNamespace
+
+import psutil
+import pytest
+
+from core import procmon
+from core.procmon import ProcessMonitor
+
+
+class FakeProcess:
+    table = {}
+
+    def __init__(self, pid):
+        if pid not in self.table:
+            raise psutil.NoSuchProcess(pid)
+        self.pid = pid
+        self._name = None
+
+    def _entry(self):
+        if self.pid not in self.table:
+            raise psutil.NoSuchProcess(self.pid)
+        return self.table[self.pid]
+
+    @contextlib.contextmanager
+    def oneshot(self):
+        yield
+
+    def ppid(self):
+        return self._entry()["ppid"]
+
+    def name(self):
+        if self._name is None:
+            self._name = self._entry()["name"]
+        return self._name
+
+    def cmdline(self):
+        return self._entry().get("cmdline", [self._entry()["name"]])
+
+    def create_time(self):
+        return self._entry()["created"]
+
+    def status(self):
+        return self._entry().get("status", psutil.STATUS_RUNNING)
+
+    def cpu_percent(self, interval=None):
+        return 1.0
+
+    def memory_info(self):
+        return SimpleNamespace(rss=100)
+
+    def num_threads(self):
+        return 2
+
+    def num_fds(self):
+        return 3
+
+
+@pytest.fixture
+def table(monkeypatch):
+    processes = {}
+    monkeypatch.setattr(FakeProcess, "table", processes)
+    monkeypatch.setattr(procmon.psutil, "Process", FakeProcess)
+    monkeypatch.setattr(procmon.psutil, "pids", lambda: list(processes))
+    return processes
+
+
+def _spawn(table, pid, name, ppid=1, age=0.0, **extra):
+    table[pid] = dict(name=name, ppid=ppid, created=time.time() - age, **extra)
+
+
+def test_tracks_matching_processes_and_descendants(table):
+    _spawn(table, 1, "init", age=1000)
+    _spawn(table, 10, "moltbot")
+    _spawn(table, 11, "node", ppid=10)
+    _spawn(table, 12, "sh", ppid=11)
+    _spawn(table, 20, "python", cmdline=["/usr/bin/python", "/opt/clawdbot/bin/clawdbot", "serve"])
+    _spawn(table, 30, "bash")
+    stats = ProcessMonitor(("moltbot", "clawdbot")).sample()
+    assert (stats.processes, stats.roots, stats.rss, stats.fds) == (4, 2, 400, 12)
+
+
+def test_exec_into_match_is_picked_up(table):
+    _spawn(table, 1, "init", age=1000)
+    _spawn(table, 40, "sh", age=1)
+    monitor = ProcessMonitor(("moltbot",))
+    assert monitor.sample().processes == 0
+    table[40]["name"] = "moltbot"
+    _spawn(table, 41, "node", ppid=40)
+    stats = monitor.sample()
+    assert (stats.processes, stats.roots) == (2, 1)
+    assert monitor.stats.rechecked == 1
+
+
+def test_old_processes_are_not_rechecked(table):
+    _spawn(table, 1, "init", age=1000)
+    _spawn(table, 50, "sshd", age=procmon.RECHECK_SECONDS + 5)
+    monitor = ProcessMonitor(("moltbot",))
+    monitor.sample()
+    table[50]["name"] = "moltbot"
+    assert monitor.sample().processes == 0
+    assert (monitor.stats.inspected, monitor.stats.rechecked) == (2, 0)
+
+
+def test_reused_pid_is_not_rechecked_as_old_candidate(table):
+    _spawn(table, 60, "sh", age=1)
+    monitor = ProcessMonitor(("moltbot",))
+    monitor.sample()
+    _spawn(table, 60, "moltbot", age=0.5)
+    assert monitor.sample().processes == 0
+    assert monitor._candidates == {}
+
+
+def test_exited_and_zombie_processes_are_dropped(table):
+    _spawn(table, 70, "moltbot")
+    _spawn(table, 71, "moltbot")
+    monitor = ProcessMonitor(("moltbot",))
+    assert monitor.sample().processes == 2
+    del table[70]
+    table[71]["status"] = psutil.STATUS_ZOMBIE
+    assert monitor.sample().processes == 0
@@ -0,0 +1,37 @@
+from core.scheduler import RefreshPolicy, RefreshScheduler, idle_after_from_env
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_idle_pause_is_off_by_default():
+    clock = FakeClock()
+    scheduler = RefreshScheduler(clock=clock)
+    scheduler.register("health", RefreshPolicy(interval=1.0))
+    clock.now = 3600.0
+    assert scheduler.pause_reason is None
+    assert scheduler.due() == ["health"]
+
+
+def test_idle_pause_resumes_on_input():
+    clock = FakeClock()
+    scheduler = RefreshScheduler(idle_after=60.0, clock=clock)
+    scheduler.register("health", RefreshPolicy(interval=1.0))
+    clock.now = 60.0
+    assert scheduler.pause_reason == "idle"
+    assert scheduler.due() == []
+    scheduler.note_activity()
+    assert scheduler.due() == ["health"]
+    scheduler.set_visible(False)
+    assert scheduler.pause_reason == "unfocused"
+
+
+def test_idle_after_from_env(monkeypatch):
+    for spec, expected in (("", 0.0), ("off", 0.0), ("120", 120.0), ("soon", 0.0), ("-5", 0.0)):
+        monkeypatch.setenv("CLAWD_DASH_IDLE_PAUSE", spec)
+        assert idle_after_from_env() == expected
@@ -0,0 +1,30 @@
+import asyncio
+
+from textual.app import App
+
+from core.status import session_rows
+from panels.session import SessionModel, SessionPanel
+
+
+def _model(age_ms):
+    rows = tuple(session_rows({"sessions": {"recent": [{"key": "main", "ageMs": age_ms}]}}))
+    return SessionModel(model="claude-opus", tokens="-", uptime="1h", sessions=1, agents=1, rows=rows)
+
+
+class _Host(App):
+    def compose(self):
+        yield SessionPanel(0.0)
+
+
+def test_row_ages_do_not_force_a_render():
+    async def run():
+        app = _Host()
+        async with app.run_test():
+            panel = app.query_one(SessionPanel)
+            first, second = _model(1000), _model(6000)
+            assert first == second
+            assert panel.show(first)
+            assert not panel.show(second)
+            assert panel.sessions_snapshot() is second.rows
+
+    asyncio.run(run())
@@ -0,0 +1,121 @@
+import time
+
+import pytest
+
+from core.fields import Candidate, FieldResolver
+from core.status import _parse_duration_text, read_status, session_rows
+
+
+def test_top_level_session():
+    status = {
+        "session": {"key": "main", "model": "claude-opus", "inputTokens": 1200, "outputTokens": 300},
+        "uptimeMs": 7_200_000,
+    }
+    fields = read_status(status)
+    assert fields.session_key == "main"
+    assert fields.model == "claude-opus"
+    assert fields.tokens == "in 1200 · out 300"
+    assert fields.uptime_seconds == 7200.0
+
+
+def test_recent_sessions():
+    status = {
+        "sessions": {
+            "defaults": {"model": "claude-sonnet"},
+            "recent": [{"key": "agent:ops:main", "totalTokens": 5000, "percentUsed": 12, "contextTokens": 200000}],
+        }
+    }
+    fields = read_status(status)
+    assert fields.session_key == "agent:ops:main"
+    assert fields.model == "claude-sonnet"
+    assert fields.tokens_total == 5000.0
+    assert fields.percent_used == 12.0
+    assert fields.tokens == "total 5000 · 12% of 200000"
+    rows = session_rows(status)
+    assert [(row.key, row.agent, row.context_tokens) for row in rows] == [("agent:ops:main", "ops", 200000.0)]
+
+
+def test_sessions_by_agent():
+    status = {
+        "sessions": {
+            "byAgent": [
+                {"agentId": "research", "recent": [{"sessionId": "s1", "model": "claude-haiku", "ageMs": 5000}]},
+                {"agentId": "ops", "recent": [{"sessionId": "s2", "tokens": 10}]},
+            ]
+        }
+    }
+    fields = read_status(status)
+    assert fields.session_key == "s1"
+    assert fields.model == "claude-haiku"
+    assert fields.uptime_seconds == 5.0
+    rows = session_rows(status)
+    assert [(row.key, row.agent, row.total_tokens) for row in rows] == [("s1", "research", None), ("s2", "ops", 10.0)]
+
+
+def test_session_list_and_usage_mapping():
+    status = {
+        "sessions": [{"id": "first", "model": "claude-opus"}],
+        "token_usage": {"prompt": 10, "completion": 20, "total": 30},
+        "current_model": "ignored",
+    }
+    fields = read_status(status)
+    assert fields.session_key == "first"
+    assert fields.model == "claude-opus"
+    assert fields.tokens == "prompt 10, completion 20, total 30"
+
+
+def test_gateway_runtime_text():
+    fields = read_status({"gateway": {"runtimeShort": "2h 5m"}})
+    assert fields.uptime_seconds == 7500.0
+    assert fields.model == "unknown"
+    assert fields.tokens == "unavailable"
+
+
+def test_gateway_started_at():
+    started = int((time.time() - 60) * 1000)
+    fields = read_status({"gateway": {"startedAtMs": started}})
+    assert fields.uptime_seconds == pytest.approx(60.0, abs=2.0)
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("2h 5m", 7500.0),
+        ("1d 2h 3m 4s", 93784.0),
+        ("5 mins", 300.0),
+        ("3 Days", 259200.0),
+        ("45s", 45.0),
+        ("soon", None),
+        ("", None),
+        (None, None),
+    ],
+)
+def test_parse_duration_text(text, expected):
+    assert _parse_duration_text(text) == expected
+
+
+def test_higher_priority_candidate_filling_in_wins():
+    stale = {"session": {"key": None, "sessionId": "old"}}
+    fresh = {"session": {"key": "new", "sessionId": "old"}}
+    assert read_status(stale).session_key == "old"
+    assert read_status(fresh).session_key == "new"
+    assert [row.key for row in session_rows(fresh)] == ["new"]
+
+
+def test_resolver_precedence_on_cached_shape():
+    resolver = FieldResolver({"value": [Candidate(("a",)), Candidate(("b", "c")), Candidate(("d",))]})
+    assert resolver.resolve({"a": None, "b": {}, "d": 3}) == {"value": 3}
+    assert resolver.resolve({"a": None, "b": {"c": 2}, "d": 3}) == {"value": 2}
+    assert resolver.resolve({"a": 1, "b": {"c": 2}, "d": 3}) == {"value": 1}
+    assert resolver.resolve_many([{"a": None, "b": {}, "d": 3}, {"a": 1, "b": {}, "d": 3}], ("value",)) == [
+        (3,),
+        (1,),
+    ]
+    assert resolver.stats.variants == 2
+
+
+def test_resolver_skips_candidates_absent_from_shape():
+    resolver = FieldResolver({"value": [Candidate(("a",)), Candidate(("b",), int)]})
+    assert resolver.resolve({"b": "7"}) == {"value": 7}
+    assert resolver.resolve({"b": None}) == {"value": None}
+    assert resolver.resolve({"a": "x", "b": "7"}) == {"value": "x"}
@@ -0,0 +1,73 @@
+import pytest
+
+from core import timeseries
+from core.timeseries import Tier, TimeSeriesStore
+
+TIERS = (Tier(resolution=1, capacity=10), Tier(resolution=60, capacity=5))
+
+
+def _values(points):
+    return [(point.timestamp, point.mean, point.minimum, point.maximum, point.count) for point in points]
+
+
+def test_buckets_roll_up_across_tiers(tmp_path):
+    store = TimeSeriesStore(tmp_path, TIERS)
+    for offset, value in enumerate([4.0, 8.0, 6.0]):
+        store.record({"cpu": value}, timestamp=120.0 + offset)
+    store.record({"cpu": 2.0}, timestamp=122.5)
+    series = store.series("cpu")
+    assert _values(series.query(120.0, 122.9, resolution=1)) == [
+        (120.0, 4.0, 4.0, 4.0, 1),
+        (121.0, 8.0, 8.0, 8.0, 1),
+        (122.0, 4.0, 2.0, 6.0, 2),
+    ]
+    assert _values(series.query(0.0, 179.0, resolution=60)) == [(120.0, 5.0, 2.0, 8.0, 4)]
+    assert series.summary(120.0, 179.0) == (2.0, 5.0, 8.0)
+    assert series.summary(0.0, 60.0) is None
+
+
+def test_ring_wraps_and_overwrites_old_buckets(tmp_path):
+    store = TimeSeriesStore(tmp_path, TIERS)
+    for second in range(25):
+        store.record({"cpu": float(second)}, timestamp=float(second))
+    points = store.series("cpu").query(0.0, 24.0, resolution=1)
+    assert [point.timestamp for point in points] == [float(second) for second in range(15, 25)]
+    assert store.series("cpu").query(0.0, 9.0, resolution=1) == []
+
+
+def test_reopened_store_keeps_history(tmp_path):
+    store = TimeSeriesStore(tmp_path, TIERS)
+    store.record({"health.cpu": 42.0, "skipped": None}, timestamp=61.0)
+    store.close()
+    reopened = TimeSeriesStore(tmp_path, TIERS)
+    assert _values(reopened.series("health.cpu").query(60.0, 62.0, resolution=1)) == [(61.0, 42.0, 42.0, 42.0, 1)]
+    assert reopened.names() == ["health.cpu"]
+
+
+def test_resized_tier_file_starts_empty(tmp_path):
+    store = TimeSeriesStore(tmp_path, TIERS)
+    store.record({"cpu": 1.0}, timestamp=5.0)
+    store.close()
+    bigger = TimeSeriesStore(tmp_path, (Tier(resolution=1, capacity=20),))
+    assert bigger.series("cpu").query(0.0, 10.0) == []
+
+
+def test_second_store_reads_but_does_not_write(tmp_path, monkeypatch):
+    owner = TimeSeriesStore(tmp_path, TIERS)
+    reader = TimeSeriesStore(tmp_path, TIERS)
+    assert owner.writable and not reader.writable
+    reader.record({"cpu": 99.0}, timestamp=3.0)
+    owner.record({"cpu": 10.0}, timestamp=4.0)
+    assert _values(reader.series("cpu").query(0.0, 9.0, resolution=1)) == [(4.0, 10.0, 10.0, 10.0, 1)]
+    owner.close()
+    monkeypatch.setattr(timeseries.time, "monotonic", lambda: 1e12)
+    reader.record({"cpu": 20.0}, timestamp=5.0)
+    assert reader.writable
+    assert [point.mean for point in reader.series("cpu").query(0.0, 9.0, resolution=1)] == [10.0, 20.0]
+
+
+@pytest.mark.parametrize("value", [None, float("nan")])
+def test_missing_values_are_not_recorded(tmp_path, value):
+    store = TimeSeriesStore(tmp_path, TIERS)
+    store.series("cpu").add(value, timestamp=1.0)
+    assert store.series("cpu").query(0.0, 9.0) == []
@@ -0,0 +1,92 @@
+import json
+import time
+
+import pytest
+
+from core.status import SessionRow
+from core.token_history import DEFAULT_PRICES, Burn, TokenHistory, cost_per_day, load_prices, price_for
+
+
+def _row(total, input_tokens=None, output_tokens=None, key="main", model="claude-sonnet-4"):
+    return SessionRow(key, "agent", model, total, None, None, input_tokens, output_tokens, 200000.0)
+
+
+def _feed(history, samples):
+    for timestamp, *tokens in samples:
+        history.record([_row(*tokens)], now=timestamp)
+
+
+def test_counter_reset_does_not_count_as_negative_burn():
+    history = TokenHistory()
+    _feed(history, [(0, 1000, 800, 200), (60, 2000, 1500, 500), (120, 100, 50, 50), (180, 700, 450, 250)])
+    burn = history.burn("main", 300)
+    assert burn.tokens == pytest.approx(1600 / 3)
+    assert burn.input == pytest.approx((700 + 400) / 3)
+    assert burn.output == pytest.approx((300 + 200) / 3)
+
+
+def test_window_starts_at_the_last_sample_before_its_edge():
+    history = TokenHistory()
+    _feed(history, [(0, 0), (300, 300), (600, 900)])
+    assert history.burn("main", 300).tokens == pytest.approx(120)
+    assert history.burn("main", 3600).tokens == pytest.approx(90)
+
+
+def test_quiet_session_decays_to_zero():
+    history = TokenHistory()
+    _feed(history, [(0, 0), (100, 500)])
+    history.record([_row(500)], now=1000)
+    assert history.burn("main", 300).tokens == 0.0
+    assert history.burn("main", 3600).tokens == pytest.approx(500 / (1000 / 60))
+
+
+def test_short_spans_and_unknown_sessions_have_no_burn():
+    history = TokenHistory()
+    _feed(history, [(0, 0), (10, 500)])
+    assert history.burn("main", 300) is None
+    assert history.burn("other", 300) is None
+
+
+def test_samples_older_than_the_long_window_are_dropped():
+    history = TokenHistory()
+    _feed(history, [(0, 0), (100, 100), (5000, 200), (5060, 260)])
+    assert [sample.timestamp for sample in history._samples["main"]] == [100, 5000, 5060]
+
+
+def test_history_survives_reopen(tmp_path):
+    path = tmp_path / "tokens.db"
+    now = time.time()
+    history = TokenHistory(path)
+    _feed(history, [(now - 7200, 0), (now - 600, 1000), (now, 2000)])
+    expected = history.burn("main", 3600)
+    history.close()
+    reopened = TokenHistory(path)
+    assert reopened.burn("main", 3600) == expected
+    reopened.close()
+
+
+def test_price_for_prefers_exact_then_longest_match():
+    prices = {"sonnet": (3.0, 15.0), "claude-sonnet-4": (4.0, 20.0), "opus": (15.0, 75.0)}
+    assert price_for("Claude-Sonnet-4", prices) == (4.0, 20.0)
+    assert price_for("anthropic/claude-sonnet-4-5", prices) == (4.0, 20.0)
+    assert price_for("claude-3-5-sonnet", prices) == (3.0, 15.0)
+    assert price_for("OPUS", prices) == (15.0, 75.0)
+    assert price_for("gpt-4o", prices) is None
+
+
+def test_load_prices_from_env(tmp_path, monkeypatch):
+    path = tmp_path / "prices.json"
+    path.write_text(json.dumps({"Sonnet": {"input": 2, "output": 10}, "bad": {"input": "x"}, "list": [1]}))
+    monkeypatch.setenv("CLAWD_DASH_PRICES", str(path))
+    assert load_prices() == {"sonnet": (2.0, 10.0)}
+    monkeypatch.setenv("CLAWD_DASH_PRICES", str(tmp_path / "missing.json"))
+    assert load_prices() == DEFAULT_PRICES
+
+
+def test_cost_per_day_uses_split_prices_when_known():
+    assert cost_per_day(Burn(tokens=100, input=60, output=40), (3.0, 15.0)) == pytest.approx(
+        (60 * 3 + 40 * 15) * 1440 / 1_000_000
+    )
+    assert cost_per_day(Burn(tokens=100, input=None, output=None), (3.0, 15.0)) == pytest.approx(
+        100 * 3 * 1440 / 1_000_000
+    )